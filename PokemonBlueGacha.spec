@@ -1,4 +1,6 @@
 # -*- mode: python ; coding: utf-8 -*-
+# src/Assets includes the sprite atlas; build_installer.py runs
+# scripts/build_sprite_atlas.py before PyInstaller
 
 
 a = Analysis(
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Headless throughput benchmarks for the gacha core
+
+Times pulls, table builds, stats calls and inventory updates on the
+shipped 151 Pokemon and on larger synthetic catalogs, without pygame, and
+writes the results as JSON so two runs can be compared.
+
+Usage (from the repo root):
+    python benchmarks/bench_gacha.py --output bench.json
+    python benchmarks/bench_gacha.py --sizes 151 1000 --quick
+    python benchmarks/bench_gacha.py --output after.json --compare before.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from catalog import CSV_SOURCES, Catalog, build_catalogs
+
+from data.catalog_validator import validate_catalog
+from data.csv_loader import CSVLoader
+from logic.alias_table import np
+from logic.gacha_logic import GachaSystem
+from logic.items_gacha import ItemsGachaSystem
+from logic.new_chance_tracker import NewChanceTracker
+from logic.probability_table import POKEMON_VERSIONS, ProbabilityTable
+from logic.rng import make_rng
+from managers.game_data import GameData
+from managers.save_manager import SaveManager
+from utils.gacha_stats import GachaStats
+
+
+DEFAULT_SIZES = [151, 1000, 10000, 100000]
+
+# Bumped whenever benchmark names or units change meaning
+SCHEMA_VERSION = 1
+
+
+class Timer:
+    """Repeats a call until enough time has passed and keeps the best rate"""
+    
+    def __init__(self, min_time: float, repeat: int):
+        """
+        Args:
+            min_time: Seconds each repeat should run for
+            repeat: Number of repeats (best one is reported)
+        """
+        self.min_time = min_time
+        self.repeat = repeat
+    
+    def measure(self, fn: Callable, units_per_call: float = 1.0,
+                setup: Optional[Callable] = None) -> Dict:
+        """
+        Time fn
+        
+        Args:
+            fn: Function under test (no arguments)
+            units_per_call: Work units one call performs (e.g. 10 for roll_ten)
+            setup: Untimed function run before every call (e.g. to clear a cache)
+            
+        Returns:
+            Dict with units_per_sec, seconds_per_call and calls
+        """
+        best = None
+        total_calls = 0
+        
+        for _ in range(self.repeat):
+            calls = 0
+            elapsed = 0.0
+            while elapsed < self.min_time:
+                if setup is not None:
+                    setup()
+                start = time.perf_counter()
+                fn()
+                elapsed += time.perf_counter() - start
+                calls += 1
+            total_calls += calls
+            per_call = elapsed / calls
+            if best is None or per_call < best:
+                best = per_call
+        
+        return {
+            "units_per_sec": units_per_call / best if best > 0 else float("inf"),
+            "seconds_per_call": best,
+            "calls": total_calls,
+        }
+
+
+def run_catalog(catalog: Catalog, timer: Timer, seed: int, batch: int) -> List[Dict]:
+    """
+    Run every benchmark on one catalog
+    
+    Args:
+        catalog: Data set to benchmark
+        timer: Timer to measure with
+        seed: Seed for every random stream
+        batch: Pulls per roll_many call
+        
+    Returns:
+        List of result dicts
+    """
+    results = []
+    pokemon_list = catalog.pokemon_list
+    items_list = catalog.items_list
+    rarities_dict = catalog.rarities_dict
+    
+    def record(name: str, unit: str, measurement: Dict):
+        entry = {"benchmark": name, "catalog": catalog.name, "size": catalog.size, "unit": unit}
+        entry.update(measurement)
+        results.append(entry)
+        print(f"  {name:<40} {measurement['units_per_sec']:>16,.1f} {unit}/s", file=sys.stderr)
+    
+    # --- Builds ---
+    record("validation.validate_catalog", "runs", timer.measure(
+        lambda: validate_catalog(pokemon_list, catalog.types_dict, rarities_dict,
+                                 catalog.gacha_machines, items_list)))
+    record("probability_table.build", "builds", timer.measure(
+        lambda: ProbabilityTable(pokemon_list, rarities_dict, items_list)))
+    
+    table = ProbabilityTable(pokemon_list, rarities_dict, items_list)
+    record("gacha_system.build", "builds", timer.measure(
+        lambda: GachaSystem(pokemon_list, rarities_dict, probability_table=table)))
+    record("items_gacha_system.build", "builds", timer.measure(
+        lambda: ItemsGachaSystem(items_list, rarities_dict)))
+    
+    # --- Pokemon pulls ---
+    gacha_system = GachaSystem(pokemon_list, rarities_dict, rng=random.Random(seed),
+                               probability_table=table)
+    record("gacha.roll_single", "pulls", timer.measure(lambda: gacha_system.roll_single("Red")))
+    record("gacha.roll_ten", "pulls", timer.measure(lambda: gacha_system.roll_ten("Red"), 10))
+    
+    rng = make_rng((seed, (0,)))
+    record("gacha.roll_many", "pulls", timer.measure(
+        lambda: gacha_system.roll_many("Red", batch, rng), batch))
+    
+    # --- Items pulls ---
+    items_gacha_system = ItemsGachaSystem(items_list, rarities_dict, rng=random.Random(seed))
+    record("items.roll_single", "pulls", timer.measure(items_gacha_system.roll_single))
+    record("items.roll_ten", "pulls", timer.measure(items_gacha_system.roll_ten, 10))
+    
+    items_rng = make_rng((seed, (1,)))
+    record("items.roll_many", "pulls", timer.measure(
+        lambda: items_gacha_system.roll_many(batch, items_rng), batch))
+    
+    # --- Stats (uncached: the shared cache is cleared before each call) ---
+    machines = catalog.gacha_machines
+    record("stats.expected_pulls_for_version", "calls", timer.measure(
+        lambda: GachaStats.calculate_expected_pulls_for_version(table, "Red", {}),
+        setup=table.cache.clear))
+    record("stats.expected_pulls_for_version.cached", "calls", timer.measure(
+        lambda: GachaStats.calculate_expected_pulls_for_version(table, "Red", {})))
+    record("stats.expected_pulls_from_scratch", "calls", timer.measure(
+        lambda: GachaStats.calculate_expected_pulls_from_scratch(table),
+        setup=table.cache.clear))
+    record("stats.find_recommended_version", "calls", timer.measure(
+        lambda: GachaStats.find_recommended_version(table, {}, machines),
+        setup=table.cache.clear))
+    
+    # --- Inventory updates with the new-chance tracker attached ---
+    draws = gacha_system.roll_many("Red", 10000, make_rng((seed, (2,))))[1]
+    numbers = [pokemon_list[index].number for index in draws]
+    record("game_data.add_pokemon", "pulls", _measure_add_pokemon(timer, table, numbers))
+    
+    return results
+
+
+def run_startup(timer: Timer) -> List[Dict]:
+    """
+    Time loading the shipped catalog from the CSVs and from the compiled cache
+    
+    Args:
+        timer: Timer to measure with
+        
+    Returns:
+        List of result dicts
+    """
+    results = []
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_path = os.path.join(cache_dir, "catalog_cache.pickle")
+        
+        def load(path):
+            with contextlib.redirect_stdout(sys.stderr):
+                return CSVLoader.load_catalog(*CSV_SOURCES, cache_path=path)
+        
+        size = len(load(cache_path)['pokemon_list'])
+        for name, path in (("startup.load_catalog.csv", None), ("startup.load_catalog.cached", cache_path)):
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stderr(devnull):
+                measurement = timer.measure(lambda: load(path))
+            entry = {"benchmark": name, "catalog": "gen1", "size": size, "unit": "loads"}
+            entry.update(measurement)
+            results.append(entry)
+            print(f"  {name:<40} {measurement['units_per_sec']:>16,.1f} loads/s", file=sys.stderr)
+    
+    return results
+
+
+def _measure_add_pokemon(timer: Timer, table: ProbabilityTable, numbers: List[str]) -> Dict:
+    """Time GameData.add_pokemon over a stream of rolled numbers, starting from an empty save"""
+    with tempfile.TemporaryDirectory() as save_dir:
+        with contextlib.redirect_stdout(sys.stderr):
+            game_data = GameData(SaveManager(os.path.join(save_dir, "save.json")))
+        tracker = NewChanceTracker({v: table.version_probabilities(v) for v in POKEMON_VERSIONS})
+        game_data.set_new_pokemon_tracker(tracker)
+        
+        def reset():
+            game_data.pokemon_owned = {}
+            game_data.newly_acquired = []
+            tracker.reset()
+        
+        def add_all():
+            for number in numbers:
+                game_data.add_pokemon(number)
+        
+        return timer.measure(add_all, len(numbers), setup=reset)
+
+
+def environment() -> Dict:
+    """Describe the machine and code the results came from"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ""
+    
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": np.__version__ if np is not None else None,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "commit": commit or None,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def compare(current: Dict, baseline: Dict):
+    """
+    Print the speed ratio of every benchmark present in both runs
+    
+    Args:
+        current: Results of this run
+        baseline: Results loaded from an earlier --output file
+    """
+    before = {(r["benchmark"], r["catalog"]): r["units_per_sec"] for r in baseline["results"]}
+    print(f"\n{'benchmark':<40} {'catalog':<18} {'speedup':>8}", file=sys.stderr)
+    for result in current["results"]:
+        key = (result["benchmark"], result["catalog"])
+        if key in before and before[key] > 0:
+            ratio = result["units_per_sec"] / before[key]
+            print(f"{key[0]:<40} {key[1]:<18} {ratio:>7.2f}x", file=sys.stderr)
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the gacha core without pygame")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Catalog sizes (151 is the shipped data, larger sizes are synthetic)")
+    parser.add_argument("--output", help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--compare", help="Earlier JSON results to print speedups against")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch", type=int, default=100000, help="Pulls per roll_many call")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per repeat")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--quick", action="store_true", help="Short timings for a smoke run")
+    args = parser.parse_args()
+    
+    if args.quick:
+        args.min_time = 0.02
+        args.repeat = 1
+        args.batch = min(args.batch, 10000)
+    
+    timer = Timer(args.min_time, args.repeat)
+    print("\nstartup", file=sys.stderr)
+    results = run_startup(timer)
+    for catalog in build_catalogs(args.sizes):
+        print(f"\n{catalog.name} ({catalog.size:,} Pokemon, {len(catalog.items_list):,} items)",
+              file=sys.stderr)
+        results.extend(run_catalog(catalog, timer, args.seed, args.batch))
+    
+    report = {
+        "schema": SCHEMA_VERSION,
+        "environment": environment(),
+        "settings": {"seed": args.seed, "batch": args.batch,
+                     "min_time": args.min_time, "repeat": args.repeat},
+        "results": results,
+    }
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n[OK] Results written to {args.output}", file=sys.stderr)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
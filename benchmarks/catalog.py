@@ -0,0 +1,166 @@
+"""
+Benchmark data sets: the shipped Gen 1 data plus larger synthetic catalogs
+
+Synthetic catalogs repeat the real Pokemon and items under new numbers, so
+the rarity mix and per-tier weights match the game. Only the original 151
+keep their version exclusives; the copies drop on every version with the
+template's highest weight. That keeps the planner's contested set (and its
+DP state space) the size the game really has, while every other code path
+scales with the catalog.
+"""
+import contextlib
+import os
+import sys
+from typing import Dict, List, Tuple
+
+# Benchmarks run from the repo root; the game modules live in src/
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from config import POKEMON_CSV, TYPES_CSV, RARITY_CSV, ITEMS_CSV, GACHA_MACHINES_CSV
+from data.csv_loader import CSVLoader
+from data.item_data import Item
+from data.pokemon_catalog import PokemonCatalog
+from data.pokemon_data import Pokemon
+
+
+# Source CSVs in CSVLoader.load_catalog argument order
+CSV_SOURCES = [POKEMON_CSV, TYPES_CSV, RARITY_CSV, GACHA_MACHINES_CSV, ITEMS_CSV]
+
+
+class Catalog:
+    """One benchmark data set"""
+    
+    def __init__(self, name: str, pokemon_list: PokemonCatalog, items_list: List[Item],
+                 rarities_dict: Dict, gacha_machines: Dict, types_dict: Dict):
+        """
+        Args:
+            name: Label used in the results ("gen1", "synthetic-10000", ...)
+            pokemon_list: PokemonCatalog
+            items_list: List of Item objects
+            rarities_dict: Dictionary of rarity definitions
+            gacha_machines: Dict of gacha machine data
+            types_dict: Dictionary of type definitions
+        """
+        self.name = name
+        self.pokemon_list = pokemon_list
+        self.items_list = items_list
+        self.rarities_dict = rarities_dict
+        self.gacha_machines = gacha_machines
+        self.types_dict = types_dict
+    
+    @property
+    def size(self) -> int:
+        """Number of Pokemon in the catalog"""
+        return len(self.pokemon_list)
+
+
+def load_gen1() -> Tuple[PokemonCatalog, List[Item], Dict, Dict, Dict]:
+    """
+    Load the shipped CSV data (loader messages go to stderr so stdout
+    stays clean for JSON output)
+    
+    Returns:
+        Tuple of (pokemon_list, items_list, rarities_dict, gacha_machines, types_dict)
+    """
+    with contextlib.redirect_stdout(sys.stderr):
+        return (
+            CSVLoader.load_pokemon(POKEMON_CSV),
+            CSVLoader.load_items(ITEMS_CSV),
+            CSVLoader.load_rarities(RARITY_CSV),
+            CSVLoader.load_gacha_machines(GACHA_MACHINES_CSV),
+            CSVLoader.load_types(TYPES_CSV),
+        )
+
+
+def build_catalogs(sizes: List[int]) -> List[Catalog]:
+    """
+    Build the benchmark data sets
+    
+    Args:
+        sizes: Catalog sizes; 151 (or any size up to the real Pokedex)
+               selects the shipped data, larger sizes are synthetic
+               
+    Returns:
+        List of Catalog, one per size
+    """
+    pokemon_list, items_list, rarities_dict, gacha_machines, types_dict = load_gen1()
+    catalogs = []
+    
+    for size in sizes:
+        if size <= len(pokemon_list):
+            catalogs.append(Catalog("gen1" if size == len(pokemon_list) else f"gen1-{size}",
+                                    pokemon_list[:size], items_list, rarities_dict, gacha_machines,
+                                    types_dict))
+        else:
+            catalogs.append(Catalog(f"synthetic-{size}",
+                                    synthetic_pokemon(pokemon_list, size),
+                                    synthetic_items(items_list, size),
+                                    rarities_dict, gacha_machines, types_dict))
+    
+    return catalogs
+
+
+def synthetic_pokemon(templates: PokemonCatalog, size: int) -> PokemonCatalog:
+    """
+    Scale the Pokemon list up to size entries
+    
+    Args:
+        templates: Real Pokemon to copy
+        size: Number of Pokemon wanted
+        
+    Returns:
+        PokemonCatalog numbered 1..size
+    """
+    width = max(3, len(str(size)))
+    pokemon_list = PokemonCatalog()
+    
+    for index in range(size):
+        template = templates[index % len(templates)]
+        red, blue, yellow = template.red_weight, template.blue_weight, template.yellow_weight
+        if index >= len(templates):
+            red = blue = yellow = max(red, blue, yellow)
+        
+        number = str(index + 1).zfill(width)
+        pokemon_list.append(Pokemon(
+            number=number,
+            name=f"{template.name} {index // len(templates)}" if index >= len(templates) else template.name,
+            type1=template.type1,
+            type2=template.type2,
+            rarity=template.rarity,
+            red_weight=red,
+            blue_weight=blue,
+            yellow_weight=yellow,
+            image_path=template.image_path,
+            species=template.species,
+            height_ft=template.height_ft,
+            weight_lbs=template.weight_lbs,
+            pokedex_entry=template.pokedex_entry
+        ))
+    
+    return pokemon_list
+
+
+def synthetic_items(templates: List[Item], size: int) -> List[Item]:
+    """
+    Scale the item list up to size entries
+    
+    Args:
+        templates: Real items to copy
+        size: Number of items wanted
+        
+    Returns:
+        List of Item numbered 1..size
+    """
+    width = max(3, len(str(size)))
+    items_list = []
+    
+    for index in range(size):
+        template = templates[index % len(templates)]
+        item = Item(index + 1, template.name, template.index, template.category,
+                    template.value, template.rarity, template.weight, template.icon)
+        item.number = str(index + 1).zfill(width)
+        items_list.append(item)
+    
+    return items_list
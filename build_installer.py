@@ -39,6 +39,14 @@ def build_executable():
         print("[WARN] Could not clean dist directory (executable may be running)")
         print("[INFO] Close the .exe file and try again, or PyInstaller will overwrite")
     
+    # Pack the sprite atlases (shipped with src/Assets)
+    print("\nBuilding sprite atlas...")
+    try:
+        subprocess.check_call([sys.executable, os.path.join("scripts", "build_sprite_atlas.py")])
+    except subprocess.CalledProcessError as e:
+        print(f"\n[ERROR] Sprite atlas build failed: {e}")
+        return False
+    
     # PyInstaller command for Windows
     if sys.platform == "win32":
         command = [
@@ -47,6 +47,14 @@ echo.
 REM Get current branch
 for /f "tokens=*" %%a in ('git branch --show-current') do set CURRENT_BRANCH=%%a
 
+REM Pack the sprite atlases the game loads at startup
+python scripts\build_sprite_atlas.py
+if %errorlevel% neq 0 (
+    echo ❌ Sprite atlas build failed!
+    pause
+    exit /b 1
+)
+
 REM Build for web
 pygbag --build src/main.py
 
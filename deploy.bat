@@ -9,6 +9,14 @@ for /f "tokens=*" %%a in ('git branch --show-current') do set CURRENT_BRANCH=%%a
 echo Current branch: %CURRENT_BRANCH%
 echo.
 
+REM Pack the sprite atlases the game loads at startup
+python scripts\build_sprite_atlas.py
+if %errorlevel% neq 0 (
+    echo ❌ Sprite atlas build failed!
+    pause
+    exit /b 1
+)
+
 REM Build for web
 echo 📦 Building web version...
 pygbag --build src/main.py
@@ -11,6 +11,10 @@ CURRENT_BRANCH=$(git branch --show-current)
 echo "Current branch: $CURRENT_BRANCH"
 echo ""
 
+# Pack the sprite atlases the game loads at startup
+echo "🧩 Building sprite atlas..."
+python scripts/build_sprite_atlas.py
+
 # Build for web
 echo "📦 Building web version..."
 pygbag --build src/main.py
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Pack the Pokemon sprites, type icons and item icons into sprite atlases
+
+Writes a few atlas PNGs plus atlas.json to src/Assets/Sprites/Atlas/. At
+startup ResourceManager decodes the pages once and hands out subsurfaces,
+instead of opening, decoding and converting every sprite file on its own
+(on the web build each of those was a separate fetch).
+
+build_installer.py and the deploy scripts run it before packaging, so
+shipped builds always carry a current atlas (the output is not
+committed). Run it by hand from the repo root to use the atlas when
+running from source:
+    python scripts/build_sprite_atlas.py
+    
+A sprite missing from the atlas is still loaded from its own file, so a
+stale atlas only costs the extra file opens for the new sprites.
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+# Atlases are built without opening a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+ATLAS_DIR = SRC_DIR / "Assets" / "Sprites" / "Atlas"
+
+# Atlas name -> sprite folder (relative to src/, as in the CSVs)
+SPRITE_FOLDERS = {
+    "pokemon": "Assets/Sprites/Pokemon",
+    "types": "Assets/Sprites/Types",
+    "items": "Assets/Sprites/Items",
+}
+
+# Largest page edge; bigger sets spill onto more pages
+MAX_PAGE_SIZE = 1024
+
+# Bump when the layout of atlas.json changes (ResourceManager checks it)
+ATLAS_FORMAT = 1
+
+
+def pack_shelves(sizes, max_size=MAX_PAGE_SIZE):
+    """
+    Place rectangles row by row (tallest first) onto as few pages as needed
+    
+    Args:
+        sizes: List of (width, height)
+        max_size: Largest page width and height
+        
+    Returns:
+        Tuple of (placements, page_sizes): placements[i] is (page, x, y)
+        for sizes[i]; page_sizes lists the (width, height) of each page
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    placements = [None] * len(sizes)
+    page_sizes = []
+    page, x, y, shelf_height, page_width = 0, 0, 0, 0, 0
+    
+    for i in order:
+        width, height = sizes[i]
+        if width > max_size or height > max_size:
+            raise ValueError(f"Sprite {width}x{height} does not fit a {max_size}px page")
+        if x + width > max_size:
+            # Next shelf
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if y + height > max_size:
+            # Next page
+            page_sizes.append((page_width, y + shelf_height))
+            page, x, y, shelf_height, page_width = page + 1, 0, 0, 0, 0
+        placements[i] = (page, x, y)
+        x += width
+        shelf_height = max(shelf_height, height)
+        page_width = max(page_width, x)
+    
+    if sizes:
+        page_sizes.append((page_width, y + shelf_height))
+    return placements, page_sizes
+
+
+def build_atlas(name, folder, pages, sprites):
+    """
+    Pack one sprite folder and save its pages
+    
+    Args:
+        name: Atlas name (page file prefix)
+        folder: Sprite folder relative to src/
+        pages: List of page file names, extended in place
+        sprites: Dict of sprite path -> [page, x, y, w, h], extended in place
+    """
+    paths = sorted((SRC_DIR / folder).glob("*.png"))
+    images = [pygame.image.load(str(path)) for path in paths]
+    placements, page_sizes = pack_shelves([image.get_size() for image in images])
+    
+    surfaces = [pygame.Surface(size, pygame.SRCALPHA, 32) for size in page_sizes]
+    for surface in surfaces:
+        surface.fill((0, 0, 0, 0))
+    
+    first_page = len(pages)
+    for path, image, (page, x, y) in zip(paths, images, placements):
+        surfaces[page].blit(image, (x, y))
+        key = f"{folder}/{path.name}"
+        sprites[key] = [first_page + page, x, y, image.get_width(), image.get_height()]
+    
+    for index, surface in enumerate(surfaces):
+        filename = f"{name}_{index}.png"
+        pygame.image.save(surface, str(ATLAS_DIR / filename))
+        pages.append(filename)
+    
+    print(f"✓ {name}: {len(paths)} sprites on {len(surfaces)} page(s) "
+          f"{', '.join(f'{w}x{h}' for w, h in page_sizes)}")
+
+
+def build_all():
+    """Build every atlas and the index"""
+    pygame.init()
+    ATLAS_DIR.mkdir(parents=True, exist_ok=True)
+    
+    pages = []
+    sprites = {}
+    for name, folder in SPRITE_FOLDERS.items():
+        build_atlas(name, folder, pages, sprites)
+    
+    index = {"format": ATLAS_FORMAT, "pages": pages, "sprites": sprites}
+    with open(ATLAS_DIR / "atlas.json", "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    
+    print(f"✓ Wrote {len(sprites)} sprites on {len(pages)} pages to {ATLAS_DIR}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    try:
+        build_all()
+    except (OSError, ValueError, pygame.error) as e:
+        print(f"Error building sprite atlas: {e}")
+        sys.exit(1)
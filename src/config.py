@@ -53,14 +53,41 @@ else:
     # Normal Python: save to project directory
     SAVE_FILE = os.path.join(BASE_PATH, "saves/player_save.json")
 
+# Compiled cache of the validated CSV catalog (rebuilt whenever a CSV changes)
+if IS_WEB:
+    CATALOG_CACHE_FILE = "catalog_cache.pickle"
+elif getattr(sys, 'frozen', False):
+    CATALOG_CACHE_FILE = os.path.join(save_dir, "catalog_cache.pickle")
+else:
+    CATALOG_CACHE_FILE = os.path.join(BASE_PATH, "data/catalog_cache.pickle")
+
+# Reload edited CSVs while the game runs (on by default in source checkouts;
+# POKEGACHA_HOT_RELOAD=1 or 0 overrides, never available on web)
+_HOT_RELOAD_DEFAULT = "0" if getattr(sys, 'frozen', False) else "1"
+HOT_RELOAD = not IS_WEB and os.environ.get("POKEGACHA_HOT_RELOAD", _HOT_RELOAD_DEFAULT) == "1"
+HOT_RELOAD_INTERVAL = 1.0  # seconds between CSV mtime checks
+
+# Startup/phase timeline in Chrome trace format, written on exit when
+# POKEGACHA_TRACE names an output file (e.g. POKEGACHA_TRACE=trace.json)
+TRACE_FILE = os.environ.get("POKEGACHA_TRACE") or None
+
+# Memory budget for scaled copies of sprites and UI images (least recently
+# used sizes are dropped first)
+SCALED_IMAGE_CACHE_BYTES = 32 * 1024 * 1024
+
 # Asset paths
 SPRITES_PATH = os.path.join(BASE_PATH, "Assets/Sprites/Pokemon/")
 TYPES_PATH = os.path.join(BASE_PATH, "Assets/Sprites/Types/")
 ITEMS_PATH = os.path.join(BASE_PATH, "Assets/Sprites/Items/")
+# Packed Pokemon/type/item sprites (built by scripts/build_sprite_atlas.py)
+SPRITE_ATLAS_INDEX = os.path.join(BASE_PATH, "Assets/Sprites/Atlas/atlas.json")
 SOUNDS_PATH = os.path.join(BASE_PATH, "Assets/Sounds/")
 TITLE_FONT_PATH = os.path.join(BASE_PATH, "Assets/Font/TitleFont.ttf")
 BODY_FONT_PATH = os.path.join(BASE_PATH, "Assets/Font/8BitFont.ttf")
 
+# Font sizes opened during startup (the sizes the UI renders with)
+PRELOAD_FONT_SIZES = (14, 15, 16, 18, 20, 21, 22, 24, 28, 32, 36, 42, 48)
+
 # UI Images
 LOGO_PATH = os.path.join(BASE_PATH, "Assets/Sprites/Main/logo.png")
 GACHA_RED_PATH = os.path.join(BASE_PATH, "Assets/Sprites/Main/gacha_red.png")
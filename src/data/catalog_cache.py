@@ -0,0 +1,175 @@
+"""
+Compiled cache of the validated CSV catalog
+
+The parsed and validated catalog is pickled to one file together with the
+size, mtime and SHA-1 of every source CSV. A later start checks size and
+mtime first (one stat per CSV); only when those differ are the files hashed,
+so a copied or re-packaged data folder with identical contents still hits.
+
+File layout: an 8-byte little-endian length, the Pokemon catalog's cold
+field blob, then the pickle. Loading reads only the pickle; the catalog's
+ColdFieldStore keeps the file open and reads individual cold records from
+it on demand.
+"""
+import hashlib
+import os
+import pickle
+import struct
+from typing import Dict, Optional, Tuple
+
+
+# Bump when the cached objects, the layout of the cache file or the
+# validation rules change (cached catalogs are not revalidated)
+CACHE_FORMAT = 4
+
+# Length of the cold field blob that follows the header
+_HEADER = struct.Struct('<Q')
+
+# (size, mtime_ns, sha1 hex)
+SourceStamp = Tuple[int, int, str]
+
+
+def _file_sha1(filepath: str) -> str:
+    """SHA-1 of a file's contents"""
+    digest = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def stamp_sources(sources: Dict[str, str]) -> Dict[str, SourceStamp]:
+    """
+    Fingerprint every source CSV
+    
+    Args:
+        sources: Catalog key -> CSV path
+        
+    Returns:
+        Catalog key -> (size, mtime_ns, sha1)
+    """
+    stamps = {}
+    for key, filepath in sources.items():
+        stat = os.stat(filepath)
+        stamps[key] = (stat.st_size, stat.st_mtime_ns, _file_sha1(filepath))
+    return stamps
+
+
+def load_catalog_cache(cache_path: str, sources: Dict[str, str], base_path: str) -> Optional[Tuple[Dict, bool]]:
+    """
+    Load the cached catalog if it still matches the source CSVs
+    
+    Args:
+        cache_path: Path of the cache file
+        sources: Catalog key -> CSV path
+        base_path: Asset base path the cached image paths were resolved with
+        
+    Returns:
+        Tuple of (catalog dict, stale_stamps) on a hit, where stale_stamps
+        is True if only the contents (not size/mtime) matched and the cache
+        should be rewritten; None on a miss
+    """
+    try:
+        f = open(cache_path, 'rb')
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        print(f"Warning: Ignoring unreadable catalog cache {cache_path}: {e}")
+        return None
+    
+    try:
+        header = f.read(_HEADER.size)
+        (blob_length,) = _HEADER.unpack(header)
+        f.seek(blob_length, os.SEEK_CUR)
+        payload = pickle.loads(f.read())
+    except Exception as e:
+        f.close()
+        print(f"Warning: Ignoring unreadable catalog cache {cache_path}: {e}")
+        return None
+    
+    if (not isinstance(payload, dict) or payload.get('format') != CACHE_FORMAT
+            or payload.get('base_path') != base_path
+            or set(payload.get('sources', {})) != set(sources)):
+        f.close()
+        return None
+    
+    stale_stamps = False
+    for key, filepath in sources.items():
+        size, mtime_ns, sha1 = payload['sources'][key]
+        try:
+            stat = os.stat(filepath)
+            if stat.st_size == size and stat.st_mtime_ns == mtime_ns:
+                continue
+            if stat.st_size != size or _file_sha1(filepath) != sha1:
+                f.close()
+                return None
+        except OSError:
+            f.close()
+            return None
+        stale_stamps = True
+    
+    # The records are read from this same open file, so a cache rewritten
+    # by another instance later cannot mix its blob with this pickle
+    catalog = payload['catalog']
+    catalog['pokemon_list'].cold.use_file(f, _HEADER.size)
+    return catalog, stale_stamps
+
+
+def write_catalog_cache(cache_path: str, sources: Dict[str, str], base_path: str, catalog: Dict) -> bool:
+    """
+    Write the validated catalog to the cache file (atomically)
+    
+    Args:
+        cache_path: Path of the cache file
+        sources: Catalog key -> CSV path
+        base_path: Asset base path the image paths were resolved with
+        catalog: Catalog dict to cache
+        
+    Returns:
+        True if the cache was written
+    """
+    payload = {
+        'format': CACHE_FORMAT,
+        'base_path': base_path,
+        'sources': stamp_sources(sources),
+        'catalog': catalog,
+    }
+    temp_path = f"{cache_path}.tmp"
+    
+    # The cold blob goes in front of the pickle (which leaves it out).
+    # A file-backed store is moved to memory first, so the file it holds
+    # open can be replaced
+    cold = catalog['pokemon_list'].cold
+    blob = cold.blob_bytes()
+    cold.use_memory(blob)
+    
+    try:
+        data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        cache_dir = os.path.dirname(cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            f.write(_HEADER.pack(len(blob)))
+            f.write(blob)
+            f.write(data)
+        os.replace(temp_path, cache_path)
+    except (OSError, pickle.PicklingError) as e:
+        # Read-only install or web sandbox; the CSVs still work
+        print(f"Warning: Could not write catalog cache {cache_path}: {e}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return False
+    
+    # Serve the records from the new file, unless another instance has
+    # already replaced it with a different layout
+    try:
+        f = open(cache_path, 'rb')
+    except OSError:
+        return True
+    if f.read(_HEADER.size) == _HEADER.pack(len(blob)) and f.read(len(blob)) == blob:
+        cold.use_file(f, _HEADER.size)
+    else:
+        f.close()
+    return True
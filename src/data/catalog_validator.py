@@ -0,0 +1,155 @@
+"""
+Whole-catalog validation
+
+Checks every cross-file reference (Pokemon types and rarities, item
+rarities, gacha machine versions), duplicate numbers, negative weights and
+weight coverage: every rarity tier a machine can roll must contain at
+least one Pokemon (or item) with a nonzero weight for that machine,
+otherwise a pull could land on an empty tier. The checks work on the
+catalog's code and weight columns with set operations (and NumPy when
+available), so only the distinct names are looked up and the cost per row
+is a few array operations. Rows are only walked to name them once a
+problem has been found.
+"""
+from collections import Counter
+from typing import Dict, List, Sequence
+
+from .pokemon_catalog import PokemonCatalog, WEIGHT_VERSIONS, NO_TYPE, np
+from .type_data import PokemonType
+from .rarity_data import Rarity
+from .gacha_machine_data import GachaMachine
+from .item_data import Item
+from logic.probability_table import ITEMS_VERSION
+
+
+# Machine versions every catalog must provide
+MACHINE_VERSIONS = WEIGHT_VERSIONS + (ITEMS_VERSION,)
+
+# Issues listed by name per check before the rest are only counted
+MAX_LISTED = 10
+
+
+def validate_catalog(pokemon_list: Sequence, types_dict: Dict[str, PokemonType],
+                     rarities_dict: Dict[str, Rarity], gacha_machines_dict: Dict[str, GachaMachine],
+                     items_list: List[Item]) -> List[str]:
+    """
+    Run every check over a loaded catalog
+    
+    Args:
+        pokemon_list: PokemonCatalog (or list of Pokemon)
+        types_dict: Dictionary of type definitions
+        rarities_dict: Dictionary of rarity definitions
+        gacha_machines_dict: Dictionary of gacha machines by version
+        items_list: List of Item objects
+        
+    Returns:
+        List of issue descriptions (empty if the catalog is valid)
+    """
+    if not isinstance(pokemon_list, PokemonCatalog):
+        pokemon_list = PokemonCatalog(pokemon_list)
+    
+    issues: List[str] = []
+    issues += _check_rarities(rarities_dict)
+    issues += _check_machines(gacha_machines_dict)
+    issues += _check_pokemon(pokemon_list, types_dict, rarities_dict)
+    issues += _check_items(items_list, rarities_dict)
+    return issues
+
+
+def _listed(issues: List[str]) -> List[str]:
+    """Cap a list of per-row issues at MAX_LISTED entries"""
+    if len(issues) <= MAX_LISTED:
+        return issues
+    return issues[:MAX_LISTED] + [f"... and {len(issues) - MAX_LISTED} more"]
+
+
+def _duplicates(label: str, numbers: Sequence[str]) -> List[str]:
+    """Issues for numbers that appear more than once"""
+    if len(set(numbers)) == len(numbers):
+        return []
+    repeated = [number for number, count in Counter(numbers).items() if count > 1]
+    return _listed([f"Duplicate {label} number: {number}" for number in repeated])
+
+
+def _check_rarities(rarities_dict: Dict[str, Rarity]) -> List[str]:
+    """Negative rarity weights and machines with nothing to roll"""
+    issues = []
+    for version in MACHINE_VERSIONS:
+        weights = [rarity.get_weight_for_version(version) for rarity in rarities_dict.values()]
+        if any(weight < 0 for weight in weights):
+            issues.append(f"Rarity weights for {version} contain a negative value")
+        if sum(weight for weight in weights if weight > 0) == 0:
+            issues.append(f"No rarity has a {version} weight")
+    return issues
+
+
+def _check_machines(gacha_machines_dict: Dict[str, GachaMachine]) -> List[str]:
+    """Every machine version present"""
+    return [f"Missing gacha machine for version: {version}"
+            for version in MACHINE_VERSIONS if version not in gacha_machines_dict]
+
+
+def _check_pokemon(catalog: PokemonCatalog, types_dict: Dict[str, PokemonType],
+                   rarities_dict: Dict[str, Rarity]) -> List[str]:
+    """References, duplicates, negative weights and tier coverage of the Pokemon"""
+    issues = _duplicates("Pokemon", catalog.numbers)
+    
+    # References: only the distinct names are looked up, rows are named
+    # only for codes that turned out to be invalid
+    bad_types = {code for code, name in enumerate(catalog.type_names) if name not in types_dict}
+    bad_rarities = {code for code, name in enumerate(catalog.rarity_names) if name not in rarities_dict}
+    if bad_types:
+        rows = []
+        for row, (type1, type2) in enumerate(zip(catalog.type1_codes, catalog.type2_codes)):
+            if type1 in bad_types:
+                rows.append(f"{catalog.names[row]} has invalid Type1: {catalog.type_names[type1]}")
+            if type2 != NO_TYPE and type2 in bad_types:
+                rows.append(f"{catalog.names[row]} has invalid Type2: {catalog.type_names[type2]}")
+        issues += _listed(rows)
+    if bad_rarities:
+        issues += _listed([f"{catalog.names[row]} has invalid rarity: {catalog.rarity_names[code]}"
+                           for row, code in enumerate(catalog.rarity_codes) if code in bad_rarities])
+    
+    # Weights: one reduction per version column
+    tier_count = len(catalog.rarity_names)
+    if np is not None and len(catalog):
+        weights = catalog.np_weights()
+        codes = catalog.np_rarity_codes()
+        negative = (weights < 0).any(axis=1)
+        covered = [set(np.flatnonzero(np.bincount(codes[column > 0], minlength=tier_count)).tolist())
+                   for column in weights]
+    else:
+        negative = [bool(len(column)) and min(column) < 0 for column in catalog.weights]
+        covered = [{code for code, weight in zip(catalog.rarity_codes, column) if weight > 0}
+                   for column in catalog.weights]
+    
+    positions = {name: code for code, name in enumerate(catalog.rarity_names)}
+    for column, version in enumerate(WEIGHT_VERSIONS):
+        if negative[column]:
+            issues.append(f"Pokemon {version} weights contain a negative value")
+        for name, rarity in rarities_dict.items():
+            if rarity.get_weight_for_version(version) > 0 and positions.get(name) not in covered[column]:
+                issues.append(f"Rarity {name} can roll in {version} but no Pokemon of it has a {version} weight")
+    
+    return issues
+
+
+def _check_items(items_list: List[Item], rarities_dict: Dict[str, Rarity]) -> List[str]:
+    """References, duplicates, negative weights and tier coverage of the items"""
+    issues = _duplicates("item", [item.number for item in items_list])
+    
+    rarities = [item.rarity for item in items_list]
+    bad_rarities = set(rarities) - set(rarities_dict)
+    if bad_rarities:
+        issues += _listed([f"{item.name} has invalid rarity: {item.rarity}"
+                           for item in items_list if item.rarity in bad_rarities])
+    
+    if any(item.weight < 0 for item in items_list):
+        issues.append("Item weights contain a negative value")
+    
+    covered = {rarity for rarity, item in zip(rarities, items_list) if item.weight > 0}
+    for name, rarity in rarities_dict.items():
+        if rarity.get_weight_for_version(ITEMS_VERSION) > 0 and name not in covered:
+            issues.append(f"Rarity {name} can roll in {ITEMS_VERSION} but no item of it has a weight")
+    
+    return issues
@@ -0,0 +1,157 @@
+"""
+Offset-indexed store for rarely read Pokemon fields
+
+Species, height, weight and Pokedex text are only shown by the details
+popup, so they are kept out of the hot catalog columns: every row is
+encoded into one UTF-8 blob with an offset array, and decoded on first
+access behind a small LRU. The blob can live in memory (fresh CSV load)
+or stay on disk in the catalog cache file, in which case startup never
+reads it at all. A file-backed store keeps its file open, so it keeps
+reading the records it was loaded with even if the cache file is
+rewritten or replaced while the game runs.
+"""
+import threading
+from array import array
+from collections import OrderedDict, namedtuple
+from typing import BinaryIO, Optional
+
+
+ColdFields = namedtuple("ColdFields", ["species", "height_ft", "weight_lbs", "pokedex_entry"])
+
+# Separates the fields of one row inside the blob (ASCII unit separator)
+_SEPARATOR = "\x1f"
+
+# Decoded rows kept around (the details popup reads one Pokemon at a time)
+DEFAULT_CACHE_SIZE = 64
+
+
+class ColdFieldStore:
+    """Cold Pokemon fields, one encoded record per catalog row"""
+    
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize an empty in-memory store
+        
+        Args:
+            cache_size: Number of decoded rows to keep
+        """
+        self.cache_size = cache_size
+        self._blob: Optional[bytearray] = bytearray()
+        self._offsets = array('q', [0])
+        self._file: Optional[BinaryIO] = None
+        self._base_offset = 0
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[int, ColdFields]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+    
+    def append(self, species: str, height_ft: float, weight_lbs: float, pokedex_entry: str):
+        """
+        Add the cold fields of the next row
+        
+        Args:
+            species: Species (genus)
+            height_ft: Height in feet
+            weight_lbs: Weight in pounds
+            pokedex_entry: Pokedex description
+        """
+        if self._blob is None:
+            # File-backed stores are read-only; pull the blob back into memory first
+            self.use_memory(self.blob_bytes())
+        record = _SEPARATOR.join((species, repr(float(height_ft)), repr(float(weight_lbs)), pokedex_entry))
+        self._blob.extend(record.encode('utf-8'))
+        self._offsets.append(len(self._blob))
+    
+    def get(self, row: int) -> ColdFields:
+        """
+        Cold fields of a row, decoded on first access
+        
+        Args:
+            row: Catalog row index
+            
+        Returns:
+            ColdFields(species, height_ft, weight_lbs, pokedex_entry)
+        """
+        fields = self._cache.get(row)
+        if fields is not None:
+            self._cache.move_to_end(row)
+            return fields
+        
+        start, end = self._offsets[row], self._offsets[row + 1]
+        try:
+            data = self._read(start, end)
+            species, height, weight, entry = data.decode('utf-8').split(_SEPARATOR, 3)
+            fields = ColdFields(species, float(height), float(weight), entry)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read details for row {row}: {e}")
+            return ColdFields("", 0.0, 0.0, "")
+        
+        self._cache[row] = fields
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return fields
+    
+    def blob_bytes(self) -> bytes:
+        """All encoded records (reads them from disk for a file-backed store)"""
+        return self._read(0, self._offsets[-1])
+    
+    def use_file(self, file: BinaryIO, base_offset: int):
+        """
+        Serve records from an open file that holds blob_bytes() at
+        base_offset, dropping the in-memory copy (the store closes the
+        file when it stops using it)
+        
+        Args:
+            file: File holding the records, opened in binary mode
+            base_offset: Byte offset of the first record in the file
+        """
+        self._close_file()
+        self._blob = None
+        self._file = file
+        self._base_offset = base_offset
+    
+    def use_memory(self, blob: bytes):
+        """
+        Serve records from memory again
+        
+        Args:
+            blob: Records as returned by blob_bytes()
+        """
+        self._close_file()
+        self._blob = bytearray(blob)
+        self._base_offset = 0
+    
+    def _read(self, start: int, end: int) -> bytes:
+        """Bytes start:end of the records"""
+        if self._blob is not None:
+            return bytes(self._blob[start:end])
+        if self._file is None:
+            raise OSError("records not attached (use_file/use_memory)")
+        with self._lock:
+            self._file.seek(self._base_offset + start)
+            data = self._file.read(end - start)
+        if len(data) != end - start:
+            raise ValueError("records file is truncated")
+        return data
+    
+    def _close_file(self):
+        """Close the file of a file-backed store"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __getstate__(self):
+        # Pickled without the records: the catalog cache stores them
+        # separately and reattaches them with use_file()
+        state = self.__dict__.copy()
+        state['_blob'] = None
+        state['_file'] = None
+        state['_base_offset'] = 0
+        del state['_lock']
+        state['_cache'] = OrderedDict()
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -4,12 +4,15 @@ CSV loading utilities with error handling
 import csv
 import os
 import sys
-from typing import List, Dict
+from typing import List, Dict, Optional
 from .pokemon_data import Pokemon
+from .pokemon_catalog import PokemonCatalog
 from .type_data import PokemonType
 from .rarity_data import Rarity
 from .gacha_machine_data import GachaMachine
 from .item_data import Item
+from .catalog_cache import load_catalog_cache, write_catalog_cache
+from .catalog_validator import validate_catalog
 
 
 # Get base path for resolving asset paths (same logic as config.py)
@@ -35,7 +38,82 @@ class CSVLoader:
     """Loads game data from CSV files"""
     
     @staticmethod
-    def load_pokemon(filepath: str) -> List[Pokemon]:
+    def load_catalog(pokemon_csv: str, types_csv: str, rarity_csv: str, gacha_machines_csv: str,
+                     items_csv: str, cache_path: Optional[str] = None) -> Dict[str, object]:
+        """
+        Load and validate every CSV, or the compiled cache of them
+        
+        When cache_path is given and the cache matches the CSVs (same size
+        and mtime, or else same SHA-1), the whole catalog comes from one
+        read and validation is skipped, since only validated data is
+        cached. Otherwise the CSVs are parsed and validated as usual and the
+        cache is rewritten.
+        
+        Args:
+            pokemon_csv: Path to pokemon CSV file
+            types_csv: Path to types CSV file
+            rarity_csv: Path to rarities CSV file
+            gacha_machines_csv: Path to gacha machines CSV file
+            items_csv: Path to items CSV file
+            cache_path: Path of the compiled cache (None to always parse)
+            
+        Returns:
+            Dict with pokemon_list, types_dict, rarities_dict,
+            gacha_machines_dict and items_list
+            
+        Raises:
+            CSVLoadError: If a file is missing or data invalid
+        """
+        sources = {
+            'pokemon_list': pokemon_csv,
+            'types_dict': types_csv,
+            'rarities_dict': rarity_csv,
+            'gacha_machines_dict': gacha_machines_csv,
+            'items_list': items_csv,
+        }
+        
+        if cache_path:
+            cached = load_catalog_cache(cache_path, sources, _BASE_PATH)
+            if cached is not None:
+                catalog, stale_stamps = cached
+                if stale_stamps:
+                    CSVLoader.write_cache(cache_path, sources, catalog)
+                print(f"[OK] Loaded {len(catalog['pokemon_list'])} Pokemon, "
+                      f"{len(catalog['items_list'])} items from catalog cache")
+                return catalog
+        
+        catalog = {
+            'pokemon_list': CSVLoader.load_pokemon(pokemon_csv),
+            'types_dict': CSVLoader.load_types(types_csv),
+            'rarities_dict': CSVLoader.load_rarities(rarity_csv),
+            'gacha_machines_dict': CSVLoader.load_gacha_machines(gacha_machines_csv),
+            'items_list': CSVLoader.load_items(items_csv),
+        }
+        CSVLoader.validate_catalog(catalog)
+        
+        if cache_path:
+            CSVLoader.write_cache(cache_path, sources, catalog)
+        
+        return catalog
+    
+    @staticmethod
+    def write_cache(cache_path: str, sources: Dict[str, str], catalog: Dict[str, object]) -> bool:
+        """
+        Rewrite the compiled cache for a validated catalog (load_catalog
+        does this itself; hot reload calls it after swapping in new data)
+        
+        Args:
+            cache_path: Path of the compiled cache
+            sources: Catalog key -> CSV path the catalog was loaded from
+            catalog: Validated catalog dict
+            
+        Returns:
+            True if the cache was written
+        """
+        return write_catalog_cache(cache_path, sources, _BASE_PATH, catalog)
+    
+    @staticmethod
+    def load_pokemon(filepath: str) -> PokemonCatalog:
         """
         Load all Pokémon from CSV
         
@@ -43,7 +121,7 @@ class CSVLoader:
             filepath: Path to pokemon CSV file
             
         Returns:
-            List of Pokemon objects
+            PokemonCatalog (a sequence of Pokemon rows)
             
         Raises:
             CSVLoadError: If file not found or data invalid
@@ -51,7 +129,7 @@ class CSVLoader:
         if not os.path.exists(filepath):
             raise CSVLoadError(f"Pokemon CSV not found: {filepath}")
         
-        pokemon_list = []
+        pokemon_list = PokemonCatalog()
         
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
@@ -205,35 +283,26 @@ class CSVLoader:
         return rarities_dict
     
     @staticmethod
-    def validate_data_integrity(pokemon_list: List[Pokemon], types_dict: Dict[str, PokemonType], 
-                                rarities_dict: Dict[str, Rarity]) -> bool:
+    def validate_catalog(catalog: Dict[str, object]) -> bool:
         """
-        Validate that all references in data are valid
+        Validate a whole catalog: cross-file references, duplicate numbers,
+        negative weights and that every rollable rarity tier has something
+        to drop on every machine (see data.catalog_validator)
         
         Args:
-            pokemon_list: List of loaded Pokemon
-            types_dict: Dictionary of loaded types
-            rarities_dict: Dictionary of loaded rarities
-            
+            catalog: Dict with pokemon_list, types_dict, rarities_dict,
+                     gacha_machines_dict and items_list
+                     
         Returns:
             True if all data is valid, raises CSVLoadError otherwise
         """
-        issues = []
-        
-        # Check all Pokemon have valid types
-        for pokemon in pokemon_list:
-            if pokemon.type1 not in types_dict:
-                issues.append(f"{pokemon.name} has invalid Type1: {pokemon.type1}")
-            if pokemon.type2 and pokemon.type2 not in types_dict:
-                issues.append(f"{pokemon.name} has invalid Type2: {pokemon.type2}")
-            if pokemon.rarity not in rarities_dict:
-                issues.append(f"{pokemon.name} has invalid rarity: {pokemon.rarity}")
-        
+        issues = validate_catalog(catalog['pokemon_list'], catalog['types_dict'], catalog['rarities_dict'],
+                                  catalog['gacha_machines_dict'], catalog['items_list'])
         if issues:
             error_msg = "Data integrity issues found:\n" + "\n".join(issues)
             raise CSVLoadError(error_msg)
         
-        print("[OK] Data integrity validated")
+        print("[OK] Catalog validated")
         return True
     
     @staticmethod
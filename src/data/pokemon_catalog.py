@@ -0,0 +1,421 @@
+"""
+Columnar Pokemon catalog
+
+Stores every Pokemon field as a column (plain lists for strings, typed
+arrays for codes and numbers, one weight column per version) instead of
+one object per Pokemon. The catalog is still a sequence: indexing or
+iterating it yields lightweight PokemonView rows with the same attributes
+and methods as Pokemon, so existing code keeps working, while hot loops
+read whole columns and filters run as vectorized masks. The fields only
+the details popup reads live in a ColdFieldStore and are decoded lazily.
+"""
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from .pokemon_data import Pokemon
+from .cold_store import ColdFieldStore
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional (not available on every build)
+    np = None
+
+
+# Versions with a weight column, in column order
+WEIGHT_VERSIONS = ("Red", "Blue", "Yellow")
+VERSION_COLUMNS = {version: column for column, version in enumerate(WEIGHT_VERSIONS)}
+
+# Type code for "no second type"
+NO_TYPE = -1
+
+
+class PokemonView:
+    """
+    Read-only row of a PokemonCatalog, interchangeable with Pokemon
+    
+    Holds only the catalog and a row index; every attribute is read from
+    the catalog's columns on access.
+    """
+    
+    __slots__ = ("_catalog", "row")
+    
+    def __init__(self, catalog: "PokemonCatalog", row: int):
+        """
+        Args:
+            catalog: Catalog holding the columns
+            row: Row index in the catalog
+        """
+        self._catalog = catalog
+        self.row = row
+    
+    @property
+    def number(self) -> str:
+        return self._catalog.numbers[self.row]
+    
+    @property
+    def name(self) -> str:
+        return self._catalog.names[self.row]
+    
+    @property
+    def type1(self) -> str:
+        return self._catalog.type_names[self._catalog.type1_codes[self.row]]
+    
+    @property
+    def type2(self) -> Optional[str]:
+        code = self._catalog.type2_codes[self.row]
+        return self._catalog.type_names[code] if code != NO_TYPE else None
+    
+    @property
+    def rarity(self) -> str:
+        return self._catalog.rarity_names[self._catalog.rarity_codes[self.row]]
+    
+    @property
+    def red_weight(self) -> int:
+        return self._catalog.weights[0][self.row]
+    
+    @property
+    def blue_weight(self) -> int:
+        return self._catalog.weights[1][self.row]
+    
+    @property
+    def yellow_weight(self) -> int:
+        return self._catalog.weights[2][self.row]
+    
+    @property
+    def image_path(self) -> str:
+        return self._catalog.image_paths[self.row]
+    
+    @property
+    def species(self) -> str:
+        return self._catalog.cold.get(self.row).species
+    
+    @property
+    def height_ft(self) -> float:
+        return self._catalog.cold.get(self.row).height_ft
+    
+    @property
+    def weight_lbs(self) -> float:
+        return self._catalog.cold.get(self.row).weight_lbs
+    
+    @property
+    def pokedex_entry(self) -> str:
+        return self._catalog.cold.get(self.row).pokedex_entry
+    
+    def get_pokedex_num(self) -> int:
+        """Returns numeric Pokédex number"""
+        return int(self.number)
+    
+    def has_dual_type(self) -> bool:
+        """Check if Pokémon has two types"""
+        return self._catalog.type2_codes[self.row] != NO_TYPE
+    
+    def get_weight_for_version(self, version: str) -> int:
+        """Get drop weight for specific version (Red, Blue, or Yellow)"""
+        column = VERSION_COLUMNS.get(version)
+        if column is None:
+            return 0
+        return self._catalog.weights[column][self.row]
+    
+    def to_pokemon(self) -> Pokemon:
+        """Copy this row into a standalone Pokemon"""
+        cold = self._catalog.cold.get(self.row)
+        return Pokemon(self.number, self.name, self.type1, self.type2, self.rarity,
+                       self.red_weight, self.blue_weight, self.yellow_weight, self.image_path,
+                       cold.species, cold.height_ft, cold.weight_lbs, cold.pokedex_entry)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PokemonView):
+            if other._catalog is self._catalog:
+                return other.row == self.row
+            return self.to_pokemon() == other.to_pokemon()
+        if isinstance(other, Pokemon):
+            return self.to_pokemon() == other
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash((id(self._catalog), self.row))
+    
+    def __repr__(self):
+        return f"PokemonView({self.number}, {self.name}, {self.rarity})"
+
+
+class PokemonCatalog:
+    """
+    Struct-of-arrays store for the Pokemon list
+    
+    Columns:
+        numbers, names, image_paths: lists of str
+        rarity_codes: array of indices into rarity_names
+        type1_codes, type2_codes: arrays of indices into type_names (NO_TYPE for none)
+        weights: one array per version in WEIGHT_VERSIONS
+        cold: ColdFieldStore with species, height, weight and Pokedex text
+    """
+    
+    def __init__(self, pokemon: Iterable[Pokemon] = ()):
+        """
+        Initialize catalog
+        
+        Args:
+            pokemon: Pokemon (or PokemonView) rows to store, in order
+        """
+        self.numbers: List[str] = []
+        self.names: List[str] = []
+        self.image_paths: List[str] = []
+        self.rarity_names: List[str] = []
+        self.type_names: List[str] = []
+        self.rarity_codes = array('h')
+        self.type1_codes = array('h')
+        self.type2_codes = array('h')
+        self.weights = [array('l') for _ in WEIGHT_VERSIONS]
+        self.cold = ColdFieldStore()
+        
+        self._rarity_positions: Dict[str, int] = {}
+        self._type_positions: Dict[str, int] = {}
+        self._views: List[Optional[PokemonView]] = []
+        self._np_weights = None
+        self._np_rarity_codes = None
+        self._np_type_codes = None
+        
+        for row in pokemon:
+            self.append(row)
+    
+    def append(self, pokemon: Pokemon):
+        """
+        Add one row to the end of the catalog
+        
+        Args:
+            pokemon: Pokemon (or PokemonView) to copy in
+        """
+        self.numbers.append(pokemon.number)
+        self.names.append(pokemon.name)
+        self.image_paths.append(pokemon.image_path)
+        self.rarity_codes.append(self._code(pokemon.rarity, self.rarity_names, self._rarity_positions))
+        self.type1_codes.append(self._code(pokemon.type1, self.type_names, self._type_positions))
+        self.type2_codes.append(self._code(pokemon.type2, self.type_names, self._type_positions)
+                                if pokemon.type2 else NO_TYPE)
+        self.weights[0].append(pokemon.red_weight)
+        self.weights[1].append(pokemon.blue_weight)
+        self.weights[2].append(pokemon.yellow_weight)
+        self.cold.append(pokemon.species, pokemon.height_ft, pokemon.weight_lbs, pokemon.pokedex_entry)
+        self._views.append(None)
+        self._np_weights = None
+        self._np_rarity_codes = None
+        self._np_type_codes = None
+    
+    @staticmethod
+    def _code(name: str, names: List[str], positions: Dict[str, int]) -> int:
+        """Intern a category name and return its code"""
+        code = positions.get(name)
+        if code is None:
+            code = len(names)
+            names.append(name)
+            positions[name] = code
+        return code
+    
+    # --- Sequence protocol (rows are PokemonView objects) ---
+    
+    def __len__(self) -> int:
+        return len(self.numbers)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        view = self._views[index]
+        if view is None:
+            # Views are created once so every access returns the same object
+            view = PokemonView(self, index)
+            self._views[index] = view
+        return view
+    
+    def __iter__(self) -> Iterator[PokemonView]:
+        for index in range(len(self)):
+            yield self[index]
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_views'] = None
+        state['_np_weights'] = None
+        state['_np_rarity_codes'] = None
+        state['_np_type_codes'] = None
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._views = [None] * len(self.numbers)
+    
+    def copy(self) -> List[PokemonView]:
+        """Rows as a plain list (like list.copy())"""
+        return list(self)
+    
+    def take(self, indices: Iterable[int]) -> "PokemonCatalog":
+        """
+        New catalog with the given rows, in the given order
+        
+        Args:
+            indices: Row indices
+            
+        Returns:
+            PokemonCatalog
+        """
+        return PokemonCatalog(self[index] for index in indices)
+    
+    # --- Column access ---
+    
+    def version_weights(self, version: str) -> Sequence[int]:
+        """
+        Weight column for a version (shared array, do not modify)
+        
+        Args:
+            version: "Red", "Blue", or "Yellow"
+            
+        Returns:
+            Array of weights aligned with the rows (all zero for unknown versions)
+        """
+        column = VERSION_COLUMNS.get(version)
+        if column is None:
+            return array('l', [0]) * len(self)
+        return self.weights[column]
+    
+    def rarity_column(self) -> List[str]:
+        """Rarity name of every row"""
+        names = self.rarity_names
+        return [names[code] for code in self.rarity_codes]
+    
+    def np_rarity_codes(self):
+        """Rarity codes as a NumPy array (requires NumPy)"""
+        if self._np_rarity_codes is None:
+            self._np_rarity_codes = np.frombuffer(self.rarity_codes, dtype=np.int16)
+        return self._np_rarity_codes
+    
+    def np_weights(self):
+        """versions x N NumPy weight matrix (requires NumPy)"""
+        if self._np_weights is None:
+            self._np_weights = np.array([np.frombuffer(column, dtype=column.typecode)
+                                         for column in self.weights], dtype=np.int64)
+        return self._np_weights
+    
+    # --- Filters ---
+    
+    def mask(self, available_in: Sequence[str] = (), unavailable_in: Sequence[str] = (),
+             rarity: Optional[str] = None, type_name: Optional[str] = None):
+        """
+        Boolean row mask for a combination of conditions
+        
+        Args:
+            available_in: Versions the Pokemon must have weight > 0 in
+            unavailable_in: Versions the Pokemon must have weight 0 in
+            rarity: Required rarity tier
+            type_name: Required type (either slot)
+            
+        Returns:
+            NumPy bool array, or a list of bool without NumPy
+        """
+        if np is not None:
+            return self._np_mask(available_in, unavailable_in, rarity, type_name)
+        
+        rarity_code = self._rarity_positions.get(rarity, -2) if rarity is not None else None
+        type_code = self._type_positions.get(type_name, -2) if type_name is not None else None
+        available = [self.version_weights(v) for v in available_in]
+        unavailable = [self.version_weights(v) for v in unavailable_in]
+        
+        result = []
+        for index in range(len(self)):
+            keep = (all(column[index] > 0 for column in available)
+                    and all(column[index] <= 0 for column in unavailable)
+                    and (rarity_code is None or self.rarity_codes[index] == rarity_code)
+                    and (type_code is None or self.type1_codes[index] == type_code
+                         or self.type2_codes[index] == type_code))
+            result.append(keep)
+        return result
+    
+    def _np_mask(self, available_in, unavailable_in, rarity, type_name):
+        """Vectorized mask()"""
+        result = np.ones(len(self), dtype=bool)
+        
+        if available_in or unavailable_in:
+            weights = self.np_weights()
+            for version in available_in:
+                column = VERSION_COLUMNS.get(version)
+                if column is None:
+                    return np.zeros(len(self), dtype=bool)
+                result &= weights[column] > 0
+            for version in unavailable_in:
+                column = VERSION_COLUMNS.get(version)
+                if column is not None:
+                    result &= weights[column] <= 0
+        
+        if rarity is not None:
+            result &= self.np_rarity_codes() == self._rarity_positions.get(rarity, -2)
+        
+        if type_name is not None:
+            if self._np_type_codes is None:
+                self._np_type_codes = (np.frombuffer(self.type1_codes, dtype=np.int16),
+                                       np.frombuffer(self.type2_codes, dtype=np.int16))
+            code = self._type_positions.get(type_name, -2)
+            result &= (self._np_type_codes[0] == code) | (self._np_type_codes[1] == code)
+        
+        return result
+    
+    def select(self, **conditions) -> List[int]:
+        """
+        Indices of the rows matching mask(**conditions)
+        
+        Returns:
+            List of row indices in catalog order
+        """
+        mask = self.mask(**conditions)
+        if np is not None:
+            return np.flatnonzero(mask).tolist()
+        return [index for index, keep in enumerate(mask) if keep]
+    
+    def rows(self, indices: Iterable[int]) -> List[PokemonView]:
+        """Rows for a list of indices"""
+        return [self[index] for index in indices]
+
+
+def version_weights(pokemon_list: Sequence, version: str) -> Sequence[int]:
+    """
+    Weight of every Pokemon for a version, read from the weight column when
+    pokemon_list is a PokemonCatalog
+    
+    Args:
+        pokemon_list: PokemonCatalog or list of Pokemon
+        version: "Red", "Blue", or "Yellow"
+        
+    Returns:
+        Sequence of weights aligned with pokemon_list
+    """
+    if isinstance(pokemon_list, PokemonCatalog):
+        return pokemon_list.version_weights(version)
+    return [pokemon.get_weight_for_version(version) for pokemon in pokemon_list]
+
+
+def number_column(pokemon_list: Sequence) -> List[str]:
+    """
+    Number of every Pokemon
+    
+    Args:
+        pokemon_list: PokemonCatalog or list of Pokemon
+        
+    Returns:
+        List of numbers aligned with pokemon_list
+    """
+    if isinstance(pokemon_list, PokemonCatalog):
+        return pokemon_list.numbers
+    return [pokemon.number for pokemon in pokemon_list]
+
+
+def rarity_column(pokemon_list: Sequence) -> List[str]:
+    """
+    Rarity name of every Pokemon
+    
+    Args:
+        pokemon_list: PokemonCatalog or list of Pokemon
+        
+    Returns:
+        List of rarity names aligned with pokemon_list
+    """
+    if isinstance(pokemon_list, PokemonCatalog):
+        return pokemon_list.rarity_column()
+    return [pokemon.rarity for pokemon in pokemon_list]
@@ -0,0 +1,113 @@
+"""
+Walker/Vose alias tables for constant-time weighted sampling
+"""
+import random
+from array import array
+from typing import List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional (not available on every build)
+    np = None
+
+
+class AliasTable:
+    """Precompiled alias table that draws a weighted index in O(1)"""
+    
+    def __init__(self, weights: Sequence[float]):
+        """
+        Build the alias table using Vose's method
+        
+        Args:
+            weights: Non-negative weights, one per outcome
+            
+        Raises:
+            ValueError: If there are no weights or they sum to zero
+        """
+        self.size = len(weights)
+        self._np_probabilities = None
+        self._np_aliases = None
+        total = float(sum(weights))
+        
+        if self.size == 0 or total <= 0:
+            raise ValueError("AliasTable needs at least one positive weight")
+        
+        self.probabilities: List[float] = [0.0] * self.size
+        self.aliases: List[int] = list(range(self.size))
+        
+        # Scale weights so the average column holds exactly 1.0
+        scaled = [w * self.size / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            
+            # Donate the unused part of the small column from the large one
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        
+        # Whatever is left is full up to floating point error
+        for i in large + small:
+            self.probabilities[i] = 1.0
+    
+    def sample(self, rng=random) -> int:
+        """
+        Draw one index
+        
+        Args:
+            rng: Object with a random() method returning floats in [0, 1)
+            
+        Returns:
+            Index into the original weights sequence
+        """
+        u = rng.random() * self.size
+        index = int(u)
+        if index >= self.size:
+            index = self.size - 1
+        
+        if u - index < self.probabilities[index]:
+            return index
+        return self.aliases[index]
+    
+    def sample_many(self, n: int, rng=None):
+        """
+        Draw n indices in one batch
+        
+        Uses NumPy when rng is a numpy.random.Generator, otherwise falls back
+        to calling sample() in a loop.
+        
+        Args:
+            n: Number of draws
+            rng: numpy.random.Generator, or object with a random() method
+            
+        Returns:
+            numpy int array, or array('l') on the stdlib path
+        """
+        if is_numpy_generator(rng):
+            if self._np_probabilities is None:
+                self._np_probabilities = np.asarray(self.probabilities, dtype=np.float64)
+                self._np_aliases = np.asarray(self.aliases, dtype=np.intp)
+            
+            u = rng.random(n) * self.size
+            index = u.astype(np.intp)
+            np.minimum(index, self.size - 1, out=index)
+            keep = (u - index) < self._np_probabilities[index]
+            return np.where(keep, index, self._np_aliases[index])
+        
+        if rng is None:
+            rng = random
+        sample = self.sample
+        return array('l', (sample(rng) for _ in range(n)))
+
+
+def is_numpy_generator(rng) -> bool:
+    """Check whether rng can be used for vectorized NumPy draws"""
+    return np is not None and isinstance(rng, np.random.Generator)
@@ -2,24 +2,179 @@
 Gacha roll logic with two-step weighted system
 """
 import random
-from typing import List, Dict
+from array import array
+from typing import List, Dict, Optional, Iterator, Sequence, Tuple
 from data.pokemon_data import Pokemon
+from data.pokemon_catalog import rarity_column, version_weights
 from data.rarity_data import Rarity
+from logic.alias_table import AliasTable, is_numpy_generator, np
+from logic.probability_table import ProbabilityTable, POKEMON_VERSIONS as VERSIONS
+
+
+class VersionTables:
+    """Compiled sampler tables for one gacha version (the Items machine reuses it for items)"""
+    
+    def __init__(self, rarity_names: List[str], rarity_table: Optional[AliasTable],
+                 tier_entries: Dict[str, list], tier_tables: Dict[str, AliasTable],
+                 flat_indices: List[int], flat_table: Optional[AliasTable], empty_tiers: List[str]):
+        """
+        Args:
+            rarity_names: Rarity tiers with a positive weight, in table order
+            rarity_table: Alias table over rarity_names (None if no tier has weight)
+            tier_entries: Rarity name -> eligible Pokemon (or items), in table order
+            tier_tables: Rarity name -> alias table over tier_entries
+            flat_indices: Source list index of every eligible entry
+            flat_table: Alias table over flat_indices using the combined
+                        (rarity x within-rarity) probability, for batch rolls
+            empty_tiers: Weighted rarity tiers that have no eligible entry
+        """
+        self.rarity_names = rarity_names
+        self.rarity_table = rarity_table
+        self.tier_entries = tier_entries
+        self.tier_tables = tier_tables
+        self.flat_indices = flat_indices
+        self.flat_table = flat_table
+        self.empty_tiers = empty_tiers
+        
+        # NumPy copy of flat_indices, built on first batch roll
+        self.np_flat_indices = None
+
+
+def compile_version_tables(rarities_dict: Dict[str, Rarity], version: str, entries: Sequence,
+                           rarities: Sequence[str], weights: Sequence[int]) -> VersionTables:
+    """
+    Build alias tables for the rarity roll, each rarity tier, and the
+    flattened single-step table used for batch rolls
+    
+    Args:
+        rarities_dict: Dictionary of rarity definitions
+        version: Machine whose rarity weights are used ("Red", "Items", ...)
+        entries: Pokemon (or items) that can drop
+        rarities: Rarity name of every entry
+        weights: Weight of every entry on this machine (0 = cannot drop)
+        
+    Returns:
+        Compiled VersionTables
+    """
+    rarity_names = []
+    rarity_weights = []
+    for rarity_name, rarity_obj in rarities_dict.items():
+        weight = rarity_obj.get_weight_for_version(version)
+        if weight > 0:
+            rarity_names.append(rarity_name)
+            rarity_weights.append(weight)
+    
+    rarity_table = AliasTable(rarity_weights) if rarity_names else None
+    
+    # Bucket eligible entries by rarity in a single pass
+    tier_entries: Dict[str, list] = {}
+    tier_indices: Dict[str, List[int]] = {}
+    tier_weights: Dict[str, List[int]] = {}
+    for index, weight in enumerate(weights):
+        if weight > 0:
+            rarity = rarities[index]
+            tier_entries.setdefault(rarity, []).append(entries[index])
+            tier_indices.setdefault(rarity, []).append(index)
+            tier_weights.setdefault(rarity, []).append(weight)
+    
+    tier_tables = {rarity: AliasTable(weights) for rarity, weights in tier_weights.items()}
+    
+    # Single-level table with the same distribution as the two-step roll
+    flat_indices = []
+    flat_weights = []
+    empty_tiers = []
+    total_rarity_weight = sum(rarity_weights)
+    for rarity_name, rarity_weight in zip(rarity_names, rarity_weights):
+        if rarity_name not in tier_weights:
+            empty_tiers.append(rarity_name)
+            continue
+        tier_total = sum(tier_weights[rarity_name])
+        for index, weight in zip(tier_indices[rarity_name], tier_weights[rarity_name]):
+            flat_indices.append(index)
+            flat_weights.append(rarity_weight / total_rarity_weight * weight / tier_total)
+    
+    flat_table = AliasTable(flat_weights) if flat_weights else None
+    
+    return VersionTables(rarity_names, rarity_table, tier_entries, tier_tables,
+                         flat_indices, flat_table, empty_tiers)
 
 
 class GachaSystem:
     """Handles gacha rolling logic"""
     
-    def __init__(self, pokemon_list: List[Pokemon], rarities_dict: Dict[str, Rarity]):
+    def __init__(self, pokemon_list: List[Pokemon], rarities_dict: Dict[str, Rarity], rng=None,
+                 probability_table: Optional[ProbabilityTable] = None):
         """
         Initialize gacha system
         
         Args:
             pokemon_list: List of all Pokemon
             rarities_dict: Dictionary of rarity definitions
+            rng: Random source with a random() method, e.g. a stream from
+                 RngStreamFactory (default: the global random module)
+            probability_table: Shared ProbabilityTable (built from the lists if None)
         """
         self.pokemon_list = pokemon_list
         self.rarities_dict = rarities_dict
+        self.rng = rng if rng is not None else random
+        if probability_table is None:
+            probability_table = ProbabilityTable(pokemon_list, rarities_dict)
+        self.probability_table = probability_table
+        self.rarity_names: List[str] = []
+        self._pokemon_rarity_indices: List[int] = []
+        self._np_pokemon_rarity_indices = None
+        self._tables: Dict[str, VersionTables] = {}
+        self.rebuild()
+    
+    def rebuild(self):
+        """
+        Recompile the sampler tables for every version.
+        Call this after pokemon_list or rarities_dict change (rebuild the
+        shared probability_table first).
+        """
+        self.rarity_names = list(self.rarities_dict)
+        rarity_positions = {name: index for index, name in enumerate(self.rarity_names)}
+        self._pokemon_rarity_indices = [rarity_positions.get(rarity, -1) for rarity in rarity_column(self.pokemon_list)]
+        self._np_pokemon_rarity_indices = None
+        self._tables = {version: self._compile_version(version) for version in VERSIONS}
+    
+    def adopt(self, other: "GachaSystem"):
+        """
+        Take over the data and compiled tables of another GachaSystem in
+        one step (hot reload compiles them off the main thread). The rng
+        and shared probability_table of this system are kept.
+        
+        Args:
+            other: GachaSystem built from the new data
+        """
+        self.pokemon_list = other.pokemon_list
+        self.rarities_dict = other.rarities_dict
+        self.rarity_names = other.rarity_names
+        self._pokemon_rarity_indices = other._pokemon_rarity_indices
+        self._np_pokemon_rarity_indices = other._np_pokemon_rarity_indices
+        self._tables = other._tables
+    
+    def _compile_version(self, version: str) -> VersionTables:
+        """
+        Build alias tables for the rarity roll, each rarity tier and batch rolls
+        
+        Args:
+            version: "Red", "Blue", or "Yellow"
+            
+        Returns:
+            Compiled VersionTables
+        """
+        return compile_version_tables(self.rarities_dict, version, self.pokemon_list,
+                                      rarity_column(self.pokemon_list),
+                                      version_weights(self.pokemon_list, version))
+    
+    def _get_tables(self, version: str) -> VersionTables:
+        """Get compiled tables for a version, compiling unknown versions on demand"""
+        tables = self._tables.get(version)
+        if tables is None:
+            tables = self._compile_version(version)
+            self._tables[version] = tables
+        return tables
     
     def roll_single(self, version: str) -> Pokemon:
         """
@@ -55,6 +210,68 @@ class GachaSystem:
         """
         return [self.roll_single(version) for _ in range(10)]
     
+    def roll_many(self, version: str, n: int, rng=None) -> Tuple:
+        """
+        Perform n gacha rolls in one batch, returning indices instead of objects
+        
+        Draws come from a single alias table over the combined
+        (rarity x within-rarity) probabilities, which has exactly the same
+        distribution as roll_single. With NumPy the whole batch is one
+        vectorized draw; passing a random.Random (or running without NumPy)
+        falls back to a plain loop over the same table.
+        
+        Args:
+            version: "Red", "Blue", or "Yellow"
+            n: Number of rolls
+            rng: numpy.random.Generator or random.Random (default: derived from self.rng)
+            
+        Returns:
+            Tuple of (rarity_indices, pokemon_indices). Rarity indices point into
+            self.rarity_names and Pokemon indices into self.pokemon_list.
+            Both are NumPy int arrays, or array('l') on the stdlib path.
+        """
+        tables = self._get_tables(version)
+        
+        if tables.rarity_table is None:
+            raise ValueError(f"No rarity tiers have weight in version '{version}'")
+        if tables.empty_tiers:
+            # roll_single would fail whenever it hit this tier, so refuse up front
+            raise ValueError(f"No eligible Pokemon found for rarity '{tables.empty_tiers[0]}' in version '{version}'")
+        
+        if rng is None:
+            rng = self.rng
+            if np is not None and not is_numpy_generator(rng):
+                # Seed a Generator from our own stream so batches stay reproducible
+                rng = np.random.default_rng(int(rng.random() * 2 ** 53))
+        
+        if is_numpy_generator(rng):
+            if tables.np_flat_indices is None:
+                tables.np_flat_indices = np.asarray(tables.flat_indices, dtype=np.int32)
+            if self._np_pokemon_rarity_indices is None:
+                self._np_pokemon_rarity_indices = np.asarray(self._pokemon_rarity_indices, dtype=np.int32)
+            
+            pokemon_indices = tables.np_flat_indices[tables.flat_table.sample_many(n, rng)]
+            return self._np_pokemon_rarity_indices[pokemon_indices], pokemon_indices
+        
+        flat_indices = tables.flat_indices
+        pokemon_indices = array('l', (flat_indices[i] for i in tables.flat_table.sample_many(n, rng)))
+        rarity_indices = array('l', (self._pokemon_rarity_indices[i] for i in pokemon_indices))
+        return rarity_indices, pokemon_indices
+    
+    def iter_pokemon(self, pokemon_indices) -> Iterator[Pokemon]:
+        """
+        Lazily turn indices from roll_many back into Pokemon objects
+        
+        Args:
+            pokemon_indices: Index array returned by roll_many
+            
+        Yields:
+            Pokemon for each index, in order
+        """
+        pokemon_list = self.pokemon_list
+        for index in pokemon_indices:
+            yield pokemon_list[int(index)]
+    
     def _roll_rarity(self, version: str) -> str:
         """
         Roll to determine rarity tier based on version weights
@@ -65,19 +282,12 @@ class GachaSystem:
         Returns:
             Rarity name (e.g., "Common", "Legendary")
         """
-        # Build weighted list of rarities
-        rarity_choices = []
-        rarity_weights = []
+        tables = self._get_tables(version)
         
-        for rarity_name, rarity_obj in self.rarities_dict.items():
-            weight = rarity_obj.get_weight_for_version(version)
-            if weight > 0:
-                rarity_choices.append(rarity_name)
-                rarity_weights.append(weight)
+        if tables.rarity_table is None:
+            raise ValueError(f"No rarity tiers have weight in version '{version}'")
         
-        # Perform weighted random choice
-        chosen_rarity = random.choices(rarity_choices, weights=rarity_weights, k=1)[0]
-        return chosen_rarity
+        return tables.rarity_names[tables.rarity_table.sample(self.rng)]
     
     def _roll_pokemon_from_rarity(self, version: str, rarity: str) -> Pokemon:
         """
@@ -90,28 +300,18 @@ class GachaSystem:
         Returns:
             Rolled Pokemon
         """
-        # Filter Pokemon by rarity and version availability
-        eligible_pokemon = []
-        pokemon_weights = []
-        
-        for pokemon in self.pokemon_list:
-            if pokemon.rarity == rarity:
-                weight = pokemon.get_weight_for_version(version)
-                if weight > 0:
-                    eligible_pokemon.append(pokemon)
-                    pokemon_weights.append(weight)
+        tables = self._get_tables(version)
+        tier_table = tables.tier_tables.get(rarity)
         
         # Sanity check
-        if not eligible_pokemon:
+        if tier_table is None:
             raise ValueError(f"No eligible Pokemon found for rarity '{rarity}' in version '{version}'")
         
-        # Perform weighted random choice
-        chosen_pokemon = random.choices(eligible_pokemon, weights=pokemon_weights, k=1)[0]
-        return chosen_pokemon
+        return tables.tier_entries[rarity][tier_table.sample(self.rng)]
     
     def get_rarity_probabilities(self, version: str) -> Dict[str, float]:
         """
-        Calculate probability of each rarity tier for a version
+        Get probability of each rarity tier for a version
         
         Args:
             version: "Red", "Blue", or "Yellow"
@@ -119,49 +319,17 @@ class GachaSystem:
         Returns:
             Dictionary mapping rarity name to probability (0.0 to 1.0)
         """
-        total_weight = sum(
-            rarity.get_weight_for_version(version) 
-            for rarity in self.rarities_dict.values()
-        )
-        
-        probabilities = {}
-        for rarity_name, rarity_obj in self.rarities_dict.items():
-            weight = rarity_obj.get_weight_for_version(version)
-            probabilities[rarity_name] = weight / total_weight if total_weight > 0 else 0.0
-        
-        return probabilities
+        return dict(self.probability_table.rarity_probabilities(version))
     
     def get_pokemon_probability(self, pokemon: Pokemon, version: str) -> float:
         """
-        Calculate the probability of rolling a specific Pokemon
+        Get the probability of rolling a specific Pokemon
         
         Args:
-            pokemon: Pokemon to calculate probability for
+            pokemon: Pokemon to get the probability for
             version: "Red", "Blue", or "Yellow"
             
         Returns:
             Probability as a float (0.0 to 1.0)
         """
-        # Get rarity probability
-        rarity_probs = self.get_rarity_probabilities(version)
-        rarity_prob = rarity_probs.get(pokemon.rarity, 0.0)
-        
-        # Get Pokemon's weight within its rarity
-        pokemon_weight = pokemon.get_weight_for_version(version)
-        if pokemon_weight == 0:
-            return 0.0
-        
-        # Calculate total weight of all Pokemon in this rarity for this version
-        total_rarity_weight = sum(
-            p.get_weight_for_version(version)
-            for p in self.pokemon_list
-            if p.rarity == pokemon.rarity
-        )
-        
-        # Pokemon probability = rarity_prob * (pokemon_weight / total_rarity_weight)
-        if total_rarity_weight > 0:
-            pokemon_prob_in_rarity = pokemon_weight / total_rarity_weight
-            return rarity_prob * pokemon_prob_in_rarity
-        else:
-            return 0.0
-
+        return self.probability_table.pokemon_probability(pokemon.number, version)
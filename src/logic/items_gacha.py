@@ -2,177 +2,217 @@
 Items Gacha Logic - Two-step weighted system for item drops
 """
 import random
-from typing import List, Dict
+from array import array
+from typing import List, Dict, Optional, Iterator, Tuple
+from data.item_data import Item
+from data.rarity_data import Rarity
+from logic.alias_table import is_numpy_generator, np
+from logic.gacha_logic import VersionTables, compile_version_tables
+from logic.probability_table import ProbabilityTable, ITEMS_VERSION
 
 
-def perform_items_gacha(items_list: List, rarities_dict: Dict, count: int = 1) -> List[str]:
-    """
-    Perform items gacha pull(s) using two-step weighted system
-    
-    Step 1: Roll for rarity tier based on rarity weights
-    Step 2: Roll for specific item within that rarity based on item weights
-    
-    Args:
-        items_list: List of all Item objects
-        rarities_dict: Dictionary of rarity name -> Rarity object
-        count: Number of pulls (1 or 10)
-        
-    Returns:
-        List of item numbers (e.g., ["001", "023", ...])
-    """
-    results = []
+class ItemsGachaSystem:
+    """Handles Items machine rolling with precompiled sampler tables"""
     
-    for _ in range(count):
-        # Step 1: Roll for rarity
-        rarity_name = _roll_for_rarity(rarities_dict)
+    def __init__(self, items_list: List[Item], rarities_dict: Dict[str, Rarity], rng=None):
+        """
+        Initialize items gacha system
         
-        # Step 2: Roll for item within that rarity
-        item = _roll_for_item_in_rarity(items_list, rarity_name)
+        Args:
+            items_list: List of all Item objects
+            rarities_dict: Dictionary of rarity definitions
+            rng: Random source with a random() method, e.g. a stream from
+                 RngStreamFactory (default: the global random module)
+        """
+        self.items_list = items_list
+        self.rarities_dict = rarities_dict
+        self.rng = rng if rng is not None else random
+        self.rarity_names: List[str] = []
+        self._item_rarity_indices: List[int] = []
+        self._np_item_rarity_indices = None
+        self._tables: Optional[VersionTables] = None
+        self.rebuild()
+    
+    def rebuild(self):
+        """
+        Recompile the sampler tables.
+        Call this after items_list or rarities_dict change.
+        """
+        self.rarity_names = list(self.rarities_dict)
+        rarity_positions = {name: index for index, name in enumerate(self.rarity_names)}
+        self._item_rarity_indices = [rarity_positions.get(item.rarity, -1) for item in self.items_list]
+        self._np_item_rarity_indices = None
+        self._tables = self._compile()
+    
+    def adopt(self, other: "ItemsGachaSystem"):
+        """
+        Take over the data and compiled tables of another ItemsGachaSystem
+        in one step (hot reload compiles them off the main thread). The rng
+        of this system is kept.
         
-        if item:
-            results.append(item.number)
-        else:
-            print(f"Warning: No item found for rarity {rarity_name}")
-    
-    return results
-
-
-def _roll_for_rarity(rarities_dict: Dict) -> str:
-    """
-    Roll for rarity tier using rarity weights
-    
-    Args:
-        rarities_dict: Dictionary of rarity name -> Rarity object
+        Args:
+            other: ItemsGachaSystem built from the new data
+        """
+        self.items_list = other.items_list
+        self.rarities_dict = other.rarities_dict
+        self.rarity_names = other.rarity_names
+        self._item_rarity_indices = other._item_rarity_indices
+        self._np_item_rarity_indices = other._np_item_rarity_indices
+        self._tables = other._tables
+    
+    def _compile(self) -> VersionTables:
+        """
+        Build alias tables for the rarity roll, each rarity tier, and the
+        flattened single-step table used for batch rolls
         
-    Returns:
-        Rarity name (e.g., "Common", "Legendary")
-    """
-    # Build weighted list
-    rarity_weights = []
-    rarity_names = []
-    
-    for rarity_name, rarity in rarities_dict.items():
+        Returns:
+            Compiled VersionTables (tier_entries holds Item objects)
+        """
         # Items use the Items_Weight from the rarity CSV
-        weight = rarity.get_weight_for_version("Items")
-        rarity_weights.append(weight)
-        rarity_names.append(rarity_name)
-    
-    # Weighted random choice
-    chosen_rarity = random.choices(rarity_names, weights=rarity_weights, k=1)[0]
-    return chosen_rarity
-
-
-def _roll_for_item_in_rarity(items_list: List, rarity_name: str):
-    """
-    Roll for specific item within a rarity tier
+        return compile_version_tables(self.rarities_dict, ITEMS_VERSION, self.items_list,
+                                      [item.rarity for item in self.items_list],
+                                      [item.weight for item in self.items_list])
     
-    Args:
-        items_list: List of all Item objects
-        rarity_name: Rarity to roll from
+    def roll_single(self) -> Item:
+        """
+        Perform a single Items roll
         
-    Returns:
-        Item object, or None if no items found
-    """
-    # Filter items by rarity
-    items_in_rarity = [item for item in items_list if item.rarity == rarity_name]
-    
-    if not items_in_rarity:
-        return None
-    
-    # Build weighted list
-    item_weights = [item.weight for item in items_in_rarity]
+        Two-step process:
+        1. Roll on Items rarity weights to determine rarity tier
+        2. Roll on item weights within that rarity for the specific item
+        
+        Returns:
+            Rolled Item
+        """
+        tables = self._tables
+        
+        if tables.rarity_table is None:
+            raise ValueError("No rarity tiers have weight for the Items machine")
+        
+        rarity_name = tables.rarity_names[tables.rarity_table.sample(self.rng)]
+        tier_table = tables.tier_tables.get(rarity_name)
+        
+        # Sanity check
+        if tier_table is None:
+            raise ValueError(f"No items found for rarity '{rarity_name}'")
+        
+        return tables.tier_entries[rarity_name][tier_table.sample(self.rng)]
     
-    # Weighted random choice
-    chosen_item = random.choices(items_in_rarity, weights=item_weights, k=1)[0]
-    return chosen_item
+    def roll_ten(self) -> List[Item]:
+        """
+        Perform 10 Items rolls
+        
+        Returns:
+            List of 10 rolled Items
+        """
+        return [self.roll_single() for _ in range(10)]
+    
+    def roll_many(self, n: int, rng=None) -> Tuple:
+        """
+        Perform n Items rolls in one batch, returning indices instead of objects
+        
+        Same approach as GachaSystem.roll_many: one draw per roll from the
+        flattened alias table, vectorized when rng is a NumPy Generator.
+        
+        Args:
+            n: Number of rolls
+            rng: numpy.random.Generator or random.Random (default: derived from self.rng)
+            
+        Returns:
+            Tuple of (rarity_indices, item_indices). Rarity indices point into
+            self.rarity_names and item indices into self.items_list.
+            Both are NumPy int arrays, or array('l') on the stdlib path.
+        """
+        tables = self._tables
+        
+        if tables.rarity_table is None:
+            raise ValueError("No rarity tiers have weight for the Items machine")
+        if tables.empty_tiers:
+            # roll_single would fail whenever it hit this tier, so refuse up front
+            raise ValueError(f"No items found for rarity '{tables.empty_tiers[0]}'")
+        
+        if rng is None:
+            rng = self.rng
+            if np is not None and not is_numpy_generator(rng):
+                # Seed a Generator from our own stream so batches stay reproducible
+                rng = np.random.default_rng(int(rng.random() * 2 ** 53))
+        
+        if is_numpy_generator(rng):
+            if tables.np_flat_indices is None:
+                tables.np_flat_indices = np.asarray(tables.flat_indices, dtype=np.int32)
+            if self._np_item_rarity_indices is None:
+                self._np_item_rarity_indices = np.asarray(self._item_rarity_indices, dtype=np.int32)
+            
+            item_indices = tables.np_flat_indices[tables.flat_table.sample_many(n, rng)]
+            return self._np_item_rarity_indices[item_indices], item_indices
+        
+        flat_indices = tables.flat_indices
+        item_indices = array('l', (flat_indices[i] for i in tables.flat_table.sample_many(n, rng)))
+        rarity_indices = array('l', (self._item_rarity_indices[i] for i in item_indices))
+        return rarity_indices, item_indices
+    
+    def iter_items(self, item_indices) -> Iterator[Item]:
+        """
+        Lazily turn indices from roll_many back into Item objects
+        
+        Args:
+            item_indices: Index array returned by roll_many
+            
+        Yields:
+            Item for each index, in order
+        """
+        items_list = self.items_list
+        for index in item_indices:
+            yield items_list[int(index)]
 
 
-def calculate_item_drop_rate(item, items_list: List, rarities_dict: Dict) -> float:
+def calculate_item_drop_rate(item, probability_table: ProbabilityTable) -> float:
     """
-    Calculate drop rate percentage for a specific item
+    Drop rate percentage for a specific item
     
     Args:
         item: Item object
-        items_list: List of all Item objects
-        rarities_dict: Dictionary of rarity name -> Rarity object
+        probability_table: Shared ProbabilityTable
         
     Returns:
         Drop rate as percentage (e.g., 0.5432 for 0.5432%)
     """
-    # Get total rarity weight for Items gacha
-    total_rarity_weight = sum(
-        rarity.get_weight_for_version("Items")
-        for rarity in rarities_dict.values()
-    )
-    
-    if total_rarity_weight == 0:
-        return 0.0
-    
-    # Get this item's rarity
-    rarity = rarities_dict.get(item.rarity)
-    if not rarity:
-        return 0.0
-    
-    rarity_weight = rarity.get_weight_for_version("Items")
-    
-    # Probability of this rarity
-    rarity_prob = rarity_weight / total_rarity_weight
-    
-    # Get all items in same rarity
-    items_in_rarity = [i for i in items_list if i.rarity == item.rarity]
-    total_rarity_item_weight = sum(i.weight for i in items_in_rarity)
-    
-    if total_rarity_item_weight == 0:
-        return 0.0
-    
-    # Probability within rarity
-    within_rarity_prob = item.weight / total_rarity_item_weight
-    
-    # Combined probability as percentage
-    return (rarity_prob * within_rarity_prob) * 100
+    return probability_table.item_probability(item.number) * 100
 
 
-def calculate_expected_value(items_list: List, rarities_dict: Dict) -> float:
+def calculate_expected_value(probability_table: ProbabilityTable) -> float:
     """
-    Calculate expected Pokédollar value per pull
+    Expected Pokédollar value per pull (cached on the table until it
+    is rebuilt)
     
     Formula: Sum of (item_value × drop_probability) for all items
     
     Args:
-        items_list: List of all Item objects
-        rarities_dict: Dictionary of rarity name -> Rarity object
+        probability_table: Shared ProbabilityTable
         
     Returns:
         Expected value in Pokédollars
     """
-    expected_value = 0.0
-    
-    for item in items_list:
-        drop_rate_percent = calculate_item_drop_rate(item, items_list, rarities_dict)
-        drop_probability = drop_rate_percent / 100.0  # Convert to 0.0-1.0 range
-        expected_value += item.value * drop_probability
-    
-    return expected_value
+    key = ('expected_value', ITEMS_VERSION)
+    value = probability_table.cache.get(key)
+    if value is None:
+        value = sum(item.value * calculate_item_drop_rate(item, probability_table)
+                    for item in probability_table.items_list) / 100
+        probability_table.cache[key] = value
+    return value
 
 
-def calculate_new_item_chance(items_list: List, rarities_dict: Dict, owned_items: Dict[str, int]) -> float:
+def calculate_new_item_chance(probability_table: ProbabilityTable, owned_items: Dict[str, int]) -> float:
     """
-    Calculate percentage chance of getting a new (unowned) item
+    Calculate percentage chance of getting a new (unowned) item.
+    For a per-frame value use GameData.new_item_tracker instead.
     
     Args:
-        items_list: List of all Item objects
-        rarities_dict: Dictionary of rarity name -> Rarity object
+        probability_table: Shared ProbabilityTable
         owned_items: Dictionary of owned item numbers
         
     Returns:
         Percentage chance (0-100)
     """
-    total_new_chance = 0.0
-    
-    for item in items_list:
-        if item.number not in owned_items:
-            drop_rate = calculate_item_drop_rate(item, items_list, rarities_dict)
-            total_new_chance += drop_rate
-    
-    return total_new_chance
-
+    return sum(calculate_item_drop_rate(item, probability_table)
+               for item in probability_table.items_list if item.number not in owned_items)
@@ -0,0 +1,88 @@
+"""
+Running "chance of something new" per machine, updated as things are collected
+"""
+from typing import Dict, Iterable, List
+
+
+class NewChanceTracker:
+    """
+    Keeps the probability mass of not-yet-owned drops for each machine.
+    
+    Built once from per-machine drop probabilities; acquire() updates it in
+    O(1) per machine the drop appears in, so reading chance() is free.
+    """
+    
+    def __init__(self, probabilities: Dict[str, Dict[str, float]], owned: Iterable[str] = ()):
+        """
+        Initialize tracker
+        
+        Args:
+            probabilities: Machine name -> {number: drop probability}
+            owned: Numbers already owned
+        """
+        self.probabilities = probabilities
+        self._machines_by_number: Dict[str, List[str]] = {}
+        self._unowned_mass: Dict[str, float] = {}
+        self._unowned_count: Dict[str, int] = {}
+        self._owned = set()
+        self.reset(owned)
+    
+    def reset(self, owned: Iterable[str] = ()):
+        """
+        Recompute every machine from scratch (e.g. after an inventory reset)
+        
+        Args:
+            owned: Numbers currently owned
+        """
+        self._owned = set(owned)
+        self._machines_by_number = {}
+        self._unowned_mass = {}
+        self._unowned_count = {}
+        
+        for machine, drops in self.probabilities.items():
+            mass = 0.0
+            count = 0
+            for number, prob in drops.items():
+                if prob <= 0:
+                    continue
+                self._machines_by_number.setdefault(number, []).append(machine)
+                if number not in self._owned:
+                    mass += prob
+                    count += 1
+            self._unowned_mass[machine] = mass
+            self._unowned_count[machine] = count
+    
+    def acquire(self, number: str):
+        """
+        Mark a number as owned (no-op if it already was)
+        
+        Args:
+            number: Pokemon or item number that was just obtained
+        """
+        if number in self._owned:
+            return
+        self._owned.add(number)
+        
+        for machine in self._machines_by_number.get(number, ()):
+            self._unowned_count[machine] -= 1
+            if self._unowned_count[machine] == 0:
+                # Avoid leaving float residue once everything is owned
+                self._unowned_mass[machine] = 0.0
+            else:
+                self._unowned_mass[machine] -= self.probabilities[machine][number]
+    
+    def chance(self, machine: str) -> float:
+        """
+        Probability that the next pull on a machine is something new
+        
+        Args:
+            machine: Machine name
+            
+        Returns:
+            Probability as a float (0.0 to 1.0)
+        """
+        return max(0.0, self._unowned_mass.get(machine, 0.0))
+    
+    def unowned_count(self, machine: str) -> int:
+        """Number of drops on a machine that are not owned yet"""
+        return self._unowned_count.get(machine, 0)
@@ -0,0 +1,257 @@
+"""
+Precomputed drop probabilities shared by the gacha, stats and UI code
+"""
+from typing import List, Dict, Optional, Tuple
+from data.pokemon_data import Pokemon
+from data.pokemon_catalog import PokemonCatalog, VERSION_COLUMNS, number_column, rarity_column, version_weights
+from logic.alias_table import np
+from data.rarity_data import Rarity
+from data.item_data import Item
+
+
+# Machines whose probabilities are computed up front
+POKEMON_VERSIONS = ("Red", "Blue", "Yellow")
+ITEMS_VERSION = "Items"
+
+
+class ProbabilityTable:
+    """
+    Dense version x Pokemon (and Items x item) drop probabilities plus
+    rarity marginals, built once per data load.
+    
+    Call rebuild() whenever rates change; it bumps revision and clears
+    cache, the slot callers use for values derived from the table.
+    """
+    
+    def __init__(self, pokemon_list: List[Pokemon], rarities_dict: Dict[str, Rarity],
+                 items_list: Optional[List[Item]] = None):
+        """
+        Initialize probability table
+        
+        Args:
+            pokemon_list: List of all Pokemon
+            rarities_dict: Dictionary of rarity definitions
+            items_list: List of all Item objects (optional)
+        """
+        self.pokemon_list = pokemon_list
+        self.rarities_dict = rarities_dict
+        self.items_list = items_list if items_list is not None else []
+        self.revision = 0
+        
+        # Derived values keyed by the caller (e.g. expected pulls); cleared on rebuild
+        self.cache: Dict[tuple, object] = {}
+        
+        self.pokemon_index: Dict[str, int] = {}
+        self.item_index: Dict[str, int] = {}
+        self.pokemon_matrix: List[List[float]] = []
+        self.item_probabilities: List[float] = []
+        self._pokemon_rows: Dict[str, List[float]] = {}
+        self._rarity_marginals: Dict[str, Dict[str, float]] = {}
+        self._available: Dict[str, Dict[str, float]] = {}
+        self._drop_rates: Dict[str, List[tuple]] = {}
+        self.rebuild()
+    
+    def rebuild(self):
+        """Recompute every probability from the current data"""
+        self.revision += 1
+        self.cache.clear()
+        self._rarity_marginals.clear()
+        self._available.clear()
+        self._drop_rates.clear()
+        
+        self.pokemon_index = {number: index for index, number in enumerate(number_column(self.pokemon_list))}
+        self.item_index = {item.number: index for index, item in enumerate(self.items_list)}
+        
+        self._pokemon_rows = {version: self._compute_pokemon_row(version) for version in POKEMON_VERSIONS}
+        self.pokemon_matrix = [self._pokemon_rows[version] for version in POKEMON_VERSIONS]
+        self.item_probabilities = self._compute_item_row()
+    
+    def adopt(self, other: "ProbabilityTable"):
+        """
+        Take over the data and probabilities of another table in one step,
+        so a table built off the main thread (hot reload) replaces this
+        one without recomputing anything. Bumps revision and clears cache.
+        
+        Args:
+            other: Freshly built ProbabilityTable
+        """
+        self.revision += 1
+        self.cache.clear()
+        self.pokemon_list = other.pokemon_list
+        self.rarities_dict = other.rarities_dict
+        self.items_list = other.items_list
+        self.pokemon_index = other.pokemon_index
+        self.item_index = other.item_index
+        self.pokemon_matrix = other.pokemon_matrix
+        self.item_probabilities = other.item_probabilities
+        self._pokemon_rows = other._pokemon_rows
+        self._rarity_marginals = other._rarity_marginals
+        self._available = other._available
+        self._drop_rates = other._drop_rates
+    
+    def rarity_probabilities(self, version: str) -> Dict[str, float]:
+        """
+        Probability of each rarity tier for a machine (shared dict, do not modify)
+        
+        Args:
+            version: "Red", "Blue", "Yellow", or "Items"
+            
+        Returns:
+            Dictionary mapping rarity name to probability (0.0 to 1.0)
+        """
+        marginals = self._rarity_marginals.get(version)
+        if marginals is None:
+            total_weight = sum(r.get_weight_for_version(version) for r in self.rarities_dict.values())
+            marginals = {
+                name: (rarity.get_weight_for_version(version) / total_weight if total_weight > 0 else 0.0)
+                for name, rarity in self.rarities_dict.items()
+            }
+            self._rarity_marginals[version] = marginals
+        return marginals
+    
+    def pokemon_row(self, version: str) -> List[float]:
+        """
+        Probability of every Pokemon for a version, aligned with pokemon_list
+        
+        Args:
+            version: "Red", "Blue", or "Yellow"
+            
+        Returns:
+            List of probabilities (shared list, do not modify)
+        """
+        row = self._pokemon_rows.get(version)
+        if row is None:
+            row = self._compute_pokemon_row(version)
+            self._pokemon_rows[version] = row
+        return row
+    
+    def pokemon_probability(self, pokemon_number: str, version: str) -> float:
+        """
+        Probability of rolling a specific Pokemon
+        
+        Args:
+            pokemon_number: Pokemon number (e.g., "001")
+            version: "Red", "Blue", or "Yellow"
+            
+        Returns:
+            Probability as a float (0.0 to 1.0)
+        """
+        index = self.pokemon_index.get(pokemon_number)
+        if index is None:
+            return 0.0
+        return self.pokemon_row(version)[index]
+    
+    def item_probability(self, item_number: str) -> float:
+        """
+        Probability of rolling a specific item from the Items machine
+        
+        Args:
+            item_number: Item number (e.g., "001")
+            
+        Returns:
+            Probability as a float (0.0 to 1.0)
+        """
+        index = self.item_index.get(item_number)
+        if index is None:
+            return 0.0
+        return self.item_probabilities[index]
+    
+    def version_probabilities(self, version: str) -> Dict[str, float]:
+        """
+        Probabilities of the Pokemon (or items) a machine can drop
+        
+        Args:
+            version: "Red", "Blue", "Yellow", or "Items"
+            
+        Returns:
+            Dict of {number: probability}, drops that cannot happen
+            omitted (shared dict, do not modify)
+        """
+        available = self._available.get(version)
+        if available is None:
+            if version == ITEMS_VERSION:
+                pairs = zip(self.items_list, self.item_probabilities)
+            else:
+                pairs = zip(self.pokemon_list, self.pokemon_row(version))
+            available = {entry.number: prob for entry, prob in pairs if prob > 0}
+            self._available[version] = available
+        return available
+    
+    def drop_rates(self, version: str) -> List[Tuple[object, float]]:
+        """
+        Drop rate list for an info popup
+        
+        Args:
+            version: "Red", "Blue", "Yellow", or "Items"
+            
+        Returns:
+            List of (Pokemon or Item, drop_rate_percent) tuples, sorted by
+            drop rate ascending (rarest first); Pokemon that cannot drop
+            are left out
+        """
+        rates = self._drop_rates.get(version)
+        if rates is None:
+            if version == ITEMS_VERSION:
+                rates = [(item, prob * 100) for item, prob in zip(self.items_list, self.item_probabilities)]
+            else:
+                rates = [(p, prob * 100) for p, prob in zip(self.pokemon_list, self.pokemon_row(version))
+                         if prob > 0]
+            rates.sort(key=lambda x: x[1])
+            self._drop_rates[version] = rates
+        return rates
+    
+    def _compute_pokemon_row(self, version: str) -> List[float]:
+        """Two-step probability of every Pokemon, using one pass for tier totals"""
+        rarity_probs = self.rarity_probabilities(version)
+        
+        if np is not None and isinstance(self.pokemon_list, PokemonCatalog) and version in VERSION_COLUMNS:
+            return self._compute_pokemon_row_numpy(version, rarity_probs)
+        
+        weights = version_weights(self.pokemon_list, version)
+        rarities = rarity_column(self.pokemon_list)
+        
+        tier_totals: Dict[str, int] = {}
+        for rarity, weight in zip(rarities, weights):
+            if weight > 0:
+                tier_totals[rarity] = tier_totals.get(rarity, 0) + weight
+        
+        row = []
+        for rarity, weight in zip(rarities, weights):
+            if weight <= 0:
+                row.append(0.0)
+                continue
+            row.append(rarity_probs.get(rarity, 0.0) * weight / tier_totals[rarity])
+        
+        return row
+    
+    def _compute_pokemon_row_numpy(self, version: str, rarity_probs: Dict[str, float]) -> List[float]:
+        """Same as _compute_pokemon_row, on the catalog's weight and rarity columns"""
+        catalog = self.pokemon_list
+        codes = catalog.np_rarity_codes()
+        weights = catalog.np_weights()[VERSION_COLUMNS[version]]
+        eligible = weights > 0
+        
+        tier_totals = np.bincount(codes[eligible], weights=weights[eligible], minlength=len(catalog.rarity_names))
+        tier_probs = np.array([rarity_probs.get(name, 0.0) for name in catalog.rarity_names])
+        
+        row = np.zeros(len(catalog))
+        row[eligible] = tier_probs[codes[eligible]] * weights[eligible] / tier_totals[codes[eligible]]
+        return row.tolist()
+    
+    def _compute_item_row(self) -> List[float]:
+        """Two-step probability of every item on the Items machine"""
+        rarity_probs = self.rarity_probabilities(ITEMS_VERSION)
+        
+        tier_totals: Dict[str, int] = {}
+        for item in self.items_list:
+            tier_totals[item.rarity] = tier_totals.get(item.rarity, 0) + item.weight
+        
+        row = []
+        for item in self.items_list:
+            tier_total = tier_totals[item.rarity]
+            if tier_total == 0:
+                row.append(0.0)
+                continue
+            row.append(rarity_probs.get(item.rarity, 0.0) * item.weight / tier_total)
+        
+        return row
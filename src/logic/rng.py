@@ -0,0 +1,98 @@
+"""
+Seeded random number streams for reproducible rolling and simulations
+"""
+import hashlib
+import random
+from typing import List, Optional, Tuple
+from logic.alias_table import np
+
+
+# (entropy, spawn_key) - small and picklable so it can be sent to worker processes
+StreamSeed = Tuple[int, Tuple[int, ...]]
+
+
+class RngStreamFactory:
+    """
+    Hands out independent random streams derived from one root seed.
+    
+    With NumPy installed every stream is a PCG64 Generator seeded from
+    SeedSequence(entropy, spawn_key), which is exactly what
+    SeedSequence.spawn() produces, so streams never overlap. Without NumPy
+    each stream is a random.Random seeded from a SHA-256 of the same pair.
+    The two backends give different (but each reproducible) sequences.
+    """
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize stream factory
+        
+        Args:
+            seed: Root seed; a random 128-bit seed is chosen if None
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(128)
+        self.entropy = int(seed)
+        self.spawned = 0
+    
+    def spawn_seeds(self, n: int) -> List[StreamSeed]:
+        """
+        Reserve the next n stream seeds
+        
+        Args:
+            n: Number of seeds
+            
+        Returns:
+            List of picklable StreamSeed tuples (pass to make_rng)
+        """
+        seeds = [(self.entropy, (self.spawned + i,)) for i in range(n)]
+        self.spawned += n
+        return seeds
+    
+    def spawn(self, n: int) -> list:
+        """
+        Create the next n independent streams
+        
+        Args:
+            n: Number of streams
+            
+        Returns:
+            List of RNG objects (see make_rng)
+        """
+        return [make_rng(seed) for seed in self.spawn_seeds(n)]
+    
+    def stream(self, key: int):
+        """
+        Get the stream for a fixed key (e.g. a worker or player id).
+        The same key always gives the same stream, independent of spawn().
+        
+        Args:
+            key: Non-negative stream id
+            
+        Returns:
+            RNG object (see make_rng)
+        """
+        return make_rng((self.entropy, (0x5EED, key)))
+
+
+def make_rng(stream_seed: StreamSeed, use_numpy: Optional[bool] = None):
+    """
+    Build the RNG for a stream seed
+    
+    Args:
+        stream_seed: (entropy, spawn_key) from RngStreamFactory
+        use_numpy: Force or forbid the NumPy backend (default: use it if installed)
+        
+    Returns:
+        numpy.random.Generator, or random.Random without NumPy
+    """
+    entropy, spawn_key = stream_seed
+    
+    if use_numpy is None:
+        use_numpy = np is not None
+    
+    if use_numpy:
+        sequence = np.random.SeedSequence(entropy, spawn_key=spawn_key)
+        return np.random.Generator(np.random.PCG64(sequence))
+    
+    digest = hashlib.sha256(f"{entropy}:{','.join(map(str, spawn_key))}".encode("ascii")).digest()
+    return random.Random(int.from_bytes(digest, "big"))
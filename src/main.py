@@ -12,8 +12,12 @@ from managers.save_manager import SaveManager
 from managers.game_data import GameData
 from managers.audio_manager import AudioManager
 from managers.font_manager import FontManager
+from managers.data_reloader import DataReloader
 from data.csv_loader import CSVLoader, CSVLoadError
 from logic.gacha_logic import GachaSystem
+from logic.items_gacha import ItemsGachaSystem
+from utils.task_graph import TaskGraph
+from utils import tracing
 
 # Import states
 from states.loading_state import LoadingState
@@ -26,6 +30,7 @@ from states.gacha_outcome_state import GachaOutcomeState
 class Game:
     """Main game class"""
     
+    @tracing.traced("Game.__init__")
     def __init__(self):
         """Initialize game"""
         print("=" * 60)
@@ -33,41 +38,150 @@ class Game:
         print("=" * 60)
         
         # Initialize pygame
-        pygame.init()
+        with tracing.span("pygame.init"):
+            pygame.init()
         # Note: pygame.mixer will be initialized by AudioManager with proper settings
         
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Pokémon Blue Gacha")
+        with tracing.span("display.set_mode"):
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Pokémon Blue Gacha")
         self.clock = pygame.time.Clock()
         self.running = True
         
-        # Initialize managers
+        # Put the window up before any loading starts
+        self._show_startup_frame()
+        
+        # Managers that must be created on the main thread
         print("\nInitializing managers...")
+        with tracing.span("ResourceManager"):
+            self.resource_manager = ResourceManager(SCALED_IMAGE_CACHE_BYTES)
+        with tracing.span("AudioManager"):
+            self.audio_manager = AudioManager()
+        
+        # Independent startup work runs concurrently (one at a time on web).
+        # SDL_ttf and SDL_mixer are not thread-safe, so fonts and sounds
+        # open on the main thread while the pool tasks run
+        startup = TaskGraph(parallel=not IS_WEB)
+        startup.add('save', self._load_save)
+        startup.add('fonts', self._open_fonts, main_thread=True)
+        startup.add('catalog', self.load_game_data)
+        startup.add('sounds', lambda: self.audio_manager.load_game_sounds(SOUNDS_PATH), main_thread=True)
+        startup.add('ui_images', self._decode_ui_images)
+        startup.add('ui_convert', self._add_ui_images, deps=('ui_images',), main_thread=True)
+        startup.add('atlas', lambda: self.resource_manager.decode_atlas(SPRITE_ATLAS_INDEX))
+        startup.add('atlas_convert', lambda atlas: self.resource_manager.add_atlas(atlas, BASE_PATH),
+                    deps=('atlas',), main_thread=True)
+        startup.add('gacha', self._create_gacha_systems, deps=('catalog',))
+        startup.add('trackers', self._attach_trackers, deps=('save', 'catalog'))
+        startup.add('states', self.register_states, deps=('save', 'fonts', 'ui_convert', 'gacha', 'trackers'),
+                    main_thread=True)
+        try:
+            startup.run(on_wait=pygame.event.pump)
+        except CSVLoadError as e:
+            # Task errors reach this (main) thread from startup.run()
+            print(f"\n[ERROR] FATAL ERROR: {e}")
+            print("Cannot continue without valid game data.")
+            self._abort_startup(f"FATAL ERROR: {e}")
+        except Exception as e:
+            print(f"\n[ERROR] UNEXPECTED ERROR: {e}")
+            self._abort_startup(f"UNEXPECTED ERROR: {e}")
+        
+        # Pick up CSV edits while running (source checkouts only)
+        self.data_reloader = None
+        if HOT_RELOAD:
+            self.data_reloader = DataReloader(
+                {
+                    'pokemon_list': POKEMON_CSV,
+                    'types_dict': TYPES_CSV,
+                    'rarities_dict': RARITY_CSV,
+                    'gacha_machines_dict': GACHA_MACHINES_CSV,
+                    'items_list': ITEMS_CSV,
+                },
+                self.resource_manager,
+                self.game_data,
+                self.gacha_system,
+                self.items_gacha_system,
+                interval=HOT_RELOAD_INTERVAL,
+                cache_path=CATALOG_CACHE_FILE
+            )
+            print("[OK] Watching data CSVs for changes")
+        
+        print("\n" + "=" * 60)
+        print("[OK] Initialization complete!")
+        print("=" * 60 + "\n")
+        
+        # Start with loading state
+        self.state_manager.change_state('loading')
+    
+    def _show_startup_frame(self):
+        """Draw a plain frame so the window is up while startup tasks run"""
+        self.screen.fill(COLOR_BLACK)
+        font = pygame.font.Font(None, 36)
+        text_surface = font.render("Loading...", True, COLOR_WHITE)
+        self.screen.blit(text_surface, text_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+        pygame.display.flip()
+        pygame.event.pump()
+    
+    def _load_save(self):
+        """Read the save file (startup task)"""
         self.save_manager = SaveManager(SAVE_FILE)
         self.game_data = GameData(self.save_manager)
-        self.resource_manager = ResourceManager()
-        self.audio_manager = AudioManager()
+    
+    def _open_fonts(self):
+        """Open the fonts at the sizes the UI uses (startup task)"""
         self.font_manager = FontManager(TITLE_FONT_PATH, BODY_FONT_PATH)
+        self.font_manager.preload(PRELOAD_FONT_SIZES)
+    
+    def _decode_ui_images(self) -> dict:
+        """
+        Decode the loading screen and menu images (startup task)
         
-        # Load game data
-        self.load_game_data()
+        Returns:
+            Dict of path -> decoded Surface (or None)
+        """
+        paths = [LOGO_PATH, GACHA_RED_PATH, GACHA_BLUE_PATH, GACHA_YELLOW_PATH,
+                 GACHA_ITEM_PATH, POKEDOLLAR_ICON_PATH, RAYS_PATH]
+        return {path: self.resource_manager.decode_image(path) for path in paths}
+    
+    def _add_ui_images(self, decoded: dict):
+        """
+        Convert the decoded UI images for the display (main thread)
         
-        # Initialize gacha system
+        Args:
+            decoded: Dict of path -> decoded Surface from _decode_ui_images
+        """
+        for path, image in decoded.items():
+            self.resource_manager.add_image(path, image)
+    
+    def _create_gacha_systems(self):
+        """Compile the sampler tables (startup task)"""
         self.gacha_system = GachaSystem(
             self.resource_manager.pokemon_list,
+            self.resource_manager.rarities_dict,
+            probability_table=self.resource_manager.probability_table
+        )
+        self.items_gacha_system = ItemsGachaSystem(
+            self.resource_manager.items_list,
             self.resource_manager.rarities_dict
         )
+    
+    def _attach_trackers(self):
+        """Sync the new-drop chance trackers with the save (startup task)"""
+        self.game_data.set_new_pokemon_tracker(self.resource_manager.create_new_pokemon_tracker())
+        self.game_data.set_new_item_tracker(self.resource_manager.create_new_item_tracker())
+    
+    def _abort_startup(self, message: str):
+        """
+        Stop after a failed startup task (main thread, inside an except block)
         
-        # Create state manager
-        self.state_manager = StateManager(self.screen, self.clock)
-        self.register_states()
-        
-        print("\n" + "=" * 60)
-        print("[OK] Initialization complete!")
-        print("=" * 60 + "\n")
-        
-        # Start with loading state
-        self.state_manager.change_state('loading')
+        Args:
+            message: Error message to display on web
+        """
+        if not IS_WEB:
+            sys.exit(1)
+        # On web, display error and prevent game from starting
+        self._show_fatal_error(message)
+        raise
     
     def _show_fatal_error(self, message: str):
         """
@@ -124,45 +238,37 @@ class Game:
         
         pygame.display.flip()
     
+    @tracing.traced()
     def load_game_data(self):
-        """Load all CSV data"""
+        """
+        Load all CSV data (startup task, may run on a worker thread)
+        
+        Raises:
+            CSVLoadError: If a file is missing or data invalid (reported
+                          by __init__ on the main thread)
+        """
         print("\nLoading game data...")
         
-        try:
-            # Load CSVs
-            self.resource_manager.pokemon_list = CSVLoader.load_pokemon(POKEMON_CSV)
-            self.resource_manager.types_dict = CSVLoader.load_types(TYPES_CSV)
-            self.resource_manager.rarities_dict = CSVLoader.load_rarities(RARITY_CSV)
-            self.resource_manager.gacha_machines_dict = CSVLoader.load_gacha_machines(GACHA_MACHINES_CSV)
-            self.resource_manager.items_list = CSVLoader.load_items(ITEMS_CSV)
-            
-            # Validate data integrity
-            CSVLoader.validate_data_integrity(
-                self.resource_manager.pokemon_list,
-                self.resource_manager.types_dict,
-                self.resource_manager.rarities_dict
-            )
-            
-        except CSVLoadError as e:
-            print(f"\n[ERROR] FATAL ERROR: {e}")
-            print("Cannot continue without valid game data.")
-            if not IS_WEB:
-                sys.exit(1)
-            else:
-                # On web, display error and prevent game from starting
-                self._show_fatal_error(f"FATAL ERROR: {e}")
-                raise  # Re-raise to prevent further initialization
-        except Exception as e:
-            print(f"\n[ERROR] UNEXPECTED ERROR: {e}")
-            if not IS_WEB:
-                sys.exit(1)
-            else:
-                self._show_fatal_error(f"UNEXPECTED ERROR: {e}")
-                raise
+        # Load and validate CSVs (or the compiled cache of them)
+        catalog = CSVLoader.load_catalog(
+            POKEMON_CSV, TYPES_CSV, RARITY_CSV, GACHA_MACHINES_CSV, ITEMS_CSV,
+            cache_path=CATALOG_CACHE_FILE
+        )
+        self.resource_manager.pokemon_list = catalog['pokemon_list']
+        self.resource_manager.types_dict = catalog['types_dict']
+        self.resource_manager.rarities_dict = catalog['rarities_dict']
+        self.resource_manager.gacha_machines_dict = catalog['gacha_machines_dict']
+        self.resource_manager.items_list = catalog['items_list']
+        
+        # Lookups and drop probabilities used by the gacha, stats and UI
+        self.resource_manager.build_indexes()
+        self.resource_manager.build_probability_table()
     
+    @tracing.traced()
     def register_states(self):
-        """Register all game states"""
+        """Create the state manager and register all game states"""
         print("\nRegistering game states...")
+        self.state_manager = StateManager(self.screen, self.clock)
         
         # Create state instances
         loading_state = LoadingState(
@@ -187,7 +293,8 @@ class Game:
             self.resource_manager,
             self.audio_manager,
             self.font_manager,
-            self.gacha_system
+            self.gacha_system,
+            self.items_gacha_system
         )
         
         gacha_animation_state = GachaAnimationState(
@@ -205,7 +312,8 @@ class Game:
             self.resource_manager,
             self.audio_manager,
             self.font_manager,
-            self.gacha_system
+            self.gacha_system,
+            self.items_gacha_system
         )
         
         # Register states
@@ -218,6 +326,7 @@ class Game:
     async def run(self):
         """Main game loop - async for web compatibility"""
         print("\nStarting main game loop...\n")
+        first_frame = True
         
         while self.running:
             try:
@@ -231,6 +340,10 @@ class Game:
                 
                 self.state_manager.handle_events(events)
                 
+                # Swap in edited CSV data between frames
+                if self.data_reloader is not None:
+                    self.data_reloader.poll()
+                
                 # Update
                 self.state_manager.update(dt)
                 
@@ -239,6 +352,10 @@ class Game:
                 self.state_manager.render()
                 pygame.display.flip()
                 
+                if first_frame:
+                    tracing.mark("first frame")
+                    first_frame = False
+            
             except Exception as e:
                 # Silently handle all exceptions on web (prevents Pygbag error popups)
                 # Print to console for debugging but don't let it crash the game
@@ -266,6 +383,12 @@ class Game:
         print("Saving game...")
         self.game_data.save()
         
+        # Timeline for POKEGACHA_TRACE (also written at exit as a fallback)
+        tracing.write_trace()
+        
+        if self.data_reloader is not None:
+            self.data_reloader.close()
+        
         pygame.quit()
         print("[OK] Goodbye!")
         
@@ -277,6 +400,9 @@ class Game:
 
 async def main():
     """Entry point - async for web compatibility"""
+    if TRACE_FILE:
+        tracing.enable(TRACE_FILE)
+    
     try:
         game = Game()
         await game.run()
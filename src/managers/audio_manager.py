@@ -6,6 +6,7 @@ import os
 import random
 from typing import Optional, List
 from config import IS_WEB
+from utils.tracing import span
 
 
 class AudioManager:
@@ -22,6 +23,7 @@ class AudioManager:
         self.pending_music = None  # Store music to play after user interaction
         self.audio_errors_logged = set()  # Track logged errors to avoid spam
         self.web_audio_initialized = False  # Track if Web Audio API is initialized
+        self.sounds_loaded = False  # Set once load_game_sounds() has run
         
         # Try to initialize pygame mixer with web-compatible settings
         try:
@@ -63,7 +65,8 @@ class AudioManager:
                 print(f"  [OK] Registered sound for web: {name}")
             else:
                 # Desktop: use pygame.mixer.Sound (works perfectly, allows multiple sounds)
-                sound = pygame.mixer.Sound(path)
+                with span("load_sound", path=path):
+                    sound = pygame.mixer.Sound(path)
                 sound.set_volume(self.sfx_volume)
                 self.sounds[name] = sound
                 print(f"  [OK] Loaded sound: {name}")
@@ -316,5 +319,6 @@ class AudioManager:
                             self.load_sound(alt_path, sound_name)
                         break
         
+        self.sounds_loaded = True
         print(f"[OK] Loaded {len(self.sounds)} sound effects")
 
@@ -0,0 +1,228 @@
+"""
+Live reload of edited CSV data
+
+Polls the mtime of every source CSV. When one changes, only that file is
+reparsed and validated against the data still in use, and only what
+depends on it (lookups, probability table, sampler tables, new-chance
+trackers) is rebuilt, on a worker thread. The finished result is swapped
+in on the main thread between two frames, so the game never sees
+half-updated data and never stalls on a rebuild, and the catalog cache is
+rewritten so the next start loads the edited data without reparsing. A
+file that fails to parse or validate is reported and the running data is
+kept.
+"""
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Set
+
+from data.csv_loader import CSVLoader, CSVLoadError
+from logic.gacha_logic import GachaSystem
+from logic.items_gacha import ItemsGachaSystem
+from logic.new_chance_tracker import NewChanceTracker
+from logic.probability_table import ProbabilityTable, POKEMON_VERSIONS, ITEMS_VERSION
+
+
+# Parser for each catalog key (keys match the ResourceManager attributes)
+_PARSERS = {
+    'pokemon_list': CSVLoader.load_pokemon,
+    'types_dict': CSVLoader.load_types,
+    'rarities_dict': CSVLoader.load_rarities,
+    'gacha_machines_dict': CSVLoader.load_gacha_machines,
+    'items_list': CSVLoader.load_items,
+}
+
+# Catalog keys each derived structure is built from
+_POKEMON_INPUTS = {'pokemon_list', 'rarities_dict'}
+_ITEM_INPUTS = {'items_list', 'rarities_dict'}
+
+
+class DataReloader:
+    """Watches the source CSVs and swaps in reloaded data"""
+    
+    def __init__(self, sources: Dict[str, str], resource_manager, game_data,
+                 gacha_system: GachaSystem, items_gacha_system: ItemsGachaSystem,
+                 interval: float = 1.0, cache_path: Optional[str] = None):
+        """
+        Initialize reloader (the data must already be loaded)
+        
+        Args:
+            sources: Catalog key -> CSV path
+            resource_manager: ResourceManager holding the loaded data
+            game_data: GameData whose new-chance trackers are replaced
+            gacha_system: GachaSystem to update
+            items_gacha_system: ItemsGachaSystem to update
+            interval: Seconds between mtime checks
+            cache_path: Catalog cache to rewrite after a reload (the one
+                        passed to CSVLoader.load_catalog; None for none)
+        """
+        self.sources = sources
+        self.resource_manager = resource_manager
+        self.game_data = game_data
+        self.gacha_system = gacha_system
+        self.items_gacha_system = items_gacha_system
+        self.interval = interval
+        self.cache_path = cache_path
+        
+        self._mtimes = self._read_mtimes()
+        self._next_poll = time.monotonic() + interval
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[Future] = None
+        self._pending_keys: Set[str] = set()
+    
+    def poll(self, now: Optional[float] = None) -> bool:
+        """
+        Check for edited CSVs; call once per frame (cheap between checks)
+        
+        Args:
+            now: Current time.monotonic() value (read if None)
+            
+        Returns:
+            True if reloaded data was swapped in during this call
+        """
+        if self._pending is not None:
+            if not self._pending.done():
+                return False
+            future, self._pending = self._pending, None
+            return self._install(future)
+        
+        now = time.monotonic() if now is None else now
+        if now < self._next_poll:
+            return False
+        self._next_poll = now + self.interval
+        
+        mtimes = self._read_mtimes()
+        changed = {key for key in self.sources if mtimes[key] != self._mtimes[key]}
+        if not changed or any(mtimes[key] is None for key in changed):
+            # Nothing new, or an editor is mid-save (file briefly missing)
+            return False
+        self._mtimes = mtimes
+        
+        names = ", ".join(sorted(os.path.basename(self.sources[key]) for key in changed))
+        print(f"\nReloading {names}...")
+        
+        # Snapshot the data in use now; the worker only reads it
+        current = {key: getattr(self.resource_manager, key) for key in self.sources}
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="data-reload")
+        self._pending = self._executor.submit(self._prepare, changed, current, mtimes)
+        self._pending_keys = changed
+        return False
+    
+    def close(self):
+        """Stop the worker thread (a reload in progress is dropped)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._pending = None
+    
+    def _read_mtimes(self) -> Dict[str, Optional[int]]:
+        """mtime of every source CSV (None if missing)"""
+        mtimes = {}
+        for key, filepath in self.sources.items():
+            try:
+                mtimes[key] = os.stat(filepath).st_mtime_ns
+            except OSError:
+                mtimes[key] = None
+        return mtimes
+    
+    def _prepare(self, changed: Set[str], current: Dict[str, object],
+                 mtimes: Dict[str, Optional[int]]) -> Optional[Dict[str, object]]:
+        """
+        Parse the changed CSVs and build everything derived from them
+        (runs on the worker thread; touches no live object)
+        
+        Args:
+            changed: Catalog keys whose CSV changed
+            current: Catalog key -> data in use
+            mtimes: Source mtimes the change was detected with
+            
+        Returns:
+            Dict of the new objects for _install(), or None if a file
+            changed again while it was read (the next poll picks it up)
+            
+        Raises:
+            CSVLoadError: If a changed file is invalid
+        """
+        data = dict(current)
+        for key in changed:
+            data[key] = _PARSERS[key](self.sources[key])
+        
+        if self._read_mtimes() != mtimes:
+            return None
+        
+        CSVLoader.validate_catalog(data)
+        
+        update: Dict[str, object] = {
+            'data': {key: data[key] for key in changed},
+            'mtimes': mtimes,
+            'indexes': self.resource_manager.compute_indexes(
+                data['pokemon_list'] if 'pokemon_list' in changed else None,
+                data['items_list'] if 'items_list' in changed else None
+            ),
+        }
+        
+        if changed & (_POKEMON_INPUTS | _ITEM_INPUTS):
+            table = ProbabilityTable(data['pokemon_list'], data['rarities_dict'], data['items_list'])
+            update['probability_table'] = table
+            
+            if changed & _POKEMON_INPUTS:
+                update['gacha_system'] = GachaSystem(data['pokemon_list'], data['rarities_dict'],
+                                                     probability_table=table)
+                update['pokemon_tracker'] = NewChanceTracker(
+                    {version: table.version_probabilities(version) for version in POKEMON_VERSIONS})
+            
+            if changed & _ITEM_INPUTS:
+                update['items_gacha_system'] = ItemsGachaSystem(data['items_list'], data['rarities_dict'])
+                update['item_tracker'] = NewChanceTracker(
+                    {ITEMS_VERSION: table.version_probabilities(ITEMS_VERSION)})
+        
+        return update
+    
+    def _install(self, future: Future) -> bool:
+        """
+        Swap a finished reload into the live objects (main thread)
+        
+        Args:
+            future: Finished _prepare() call
+            
+        Returns:
+            True if new data was swapped in
+        """
+        try:
+            update = future.result()
+        except CSVLoadError as e:
+            print(f"Warning: Not reloading, keeping current data: {e}")
+            return False
+        except Exception as e:
+            print(f"Warning: Reload failed, keeping current data: {e}")
+            return False
+        
+        if update is None:
+            # Still being written; pick it up on the next check
+            for key in self._pending_keys:
+                self._mtimes[key] = None
+            return False
+        
+        manager = self.resource_manager
+        for key, value in update['data'].items():
+            setattr(manager, key, value)
+        manager.install_indexes(update['indexes'])
+        
+        if 'probability_table' in update:
+            manager.probability_table.adopt(update['probability_table'])
+        if 'gacha_system' in update:
+            self.gacha_system.adopt(update['gacha_system'])
+            self.game_data.set_new_pokemon_tracker(update['pokemon_tracker'])
+        if 'items_gacha_system' in update:
+            self.items_gacha_system.adopt(update['items_gacha_system'])
+            self.game_data.set_new_item_tracker(update['item_tracker'])
+        
+        print(f"[OK] Reloaded {', '.join(sorted(update['data']))}")
+        
+        # The cache stamps the CSVs as they are now, so skip it if one has
+        # changed since it was read (the next poll reloads it anyway)
+        if self.cache_path and self._read_mtimes() == update['mtimes']:
+            CSVLoader.write_cache(self.cache_path, self.sources,
+                                  {key: getattr(manager, key) for key in self.sources})
+        return True
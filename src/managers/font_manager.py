@@ -56,6 +56,17 @@ class FontManager:
         
         return font_cache[size]
     
+    def preload(self, sizes):
+        """
+        Open the title and body fonts at the given sizes ahead of first use
+        
+        Args:
+            sizes: Font sizes in pixels
+        """
+        for size in sizes:
+            self.get_font(size, is_title=True)
+            self.get_font(size, is_title=False)
+    
     def get_title_font(self, size: int) -> pygame.font.Font:
         """
         Get title font of specified size
@@ -1,8 +1,9 @@
 """
 Game session data management
 """
-from typing import Dict
+from typing import Dict, Optional
 from .save_manager import SaveManager
+from logic.new_chance_tracker import NewChanceTracker
 
 
 class GameData:
@@ -21,6 +22,30 @@ class GameData:
         self.stats: dict = save_data['stats']
         self.collection_complete_sound_played: bool = save_data.get('collection_complete_sound_played', False)
         self.music_muted: bool = save_data.get('music_muted', False)
+        
+        # Chance of a new drop per machine, kept up to date by add_pokemon/add_item
+        self.new_pokemon_tracker: Optional[NewChanceTracker] = None
+        self.new_item_tracker: Optional[NewChanceTracker] = None
+    
+    def set_new_pokemon_tracker(self, tracker: NewChanceTracker):
+        """
+        Attach the new-Pokemon chance tracker and sync it with owned Pokemon
+        
+        Args:
+            tracker: NewChanceTracker over the Red/Blue/Yellow drops
+        """
+        self.new_pokemon_tracker = tracker
+        tracker.reset(self.pokemon_owned)
+    
+    def set_new_item_tracker(self, tracker: NewChanceTracker):
+        """
+        Attach the new-item chance tracker and sync it with owned items
+        
+        Args:
+            tracker: NewChanceTracker over the Items machine drops
+        """
+        self.new_item_tracker = tracker
+        tracker.reset(self.items_owned)
     
     def save(self) -> bool:
         """
@@ -79,6 +104,8 @@ class GameData:
         if is_new:
             self.pokemon_owned[pokemon_number] = 1
             self.newly_acquired.append(pokemon_number)
+            if self.new_pokemon_tracker:
+                self.new_pokemon_tracker.acquire(pokemon_number)
         else:
             self.pokemon_owned[pokemon_number] += 1
         
@@ -114,6 +141,10 @@ class GameData:
         self.stats['pulls_by_version'] = {'Red': 0, 'Blue': 0, 'Yellow': 0, 'Items': 0}
         # Reset collection complete sound flag
         self.collection_complete_sound_played = False
+        if self.new_pokemon_tracker:
+            self.new_pokemon_tracker.reset()
+        if self.new_item_tracker:
+            self.new_item_tracker.reset()
         print("Inventory, items, pull statistics, and currency reset")
     
     def get_total_owned_count(self) -> int:
@@ -168,6 +199,8 @@ class GameData:
         if is_new:
             self.items_owned[item_number] = 1
             self.newly_acquired_items.append(item_number)
+            if self.new_item_tracker:
+                self.new_item_tracker.acquire(item_number)
         else:
             self.items_owned[item_number] += 1
         
@@ -3,29 +3,64 @@ Resource management for images and assets
 """
 import pygame
 import os
-from typing import Dict, List, Optional
+import json
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
 from data.pokemon_data import Pokemon
+from data.pokemon_catalog import PokemonCatalog, version_weights
 from data.type_data import PokemonType
 from data.rarity_data import Rarity
 from data.gacha_machine_data import GachaMachine
 from data.item_data import Item
+from logic.new_chance_tracker import NewChanceTracker
+from logic.probability_table import ProbabilityTable, POKEMON_VERSIONS, ITEMS_VERSION
+from utils.tracing import span
+
+
+# Layout version of atlas.json this code reads
+ATLAS_FORMAT = 1
 
 
 class ResourceManager:
     """Manages loading and caching of game resources"""
     
-    def __init__(self):
+    def __init__(self, scaled_cache_bytes: int = 32 * 1024 * 1024):
+        """
+        Initialize resource manager
+        
+        Args:
+            scaled_cache_bytes: Memory budget of the scaled-image cache
+        """
         # Data storage (loaded by main.py)
-        self.pokemon_list: List[Pokemon] = []
+        self.pokemon_list: PokemonCatalog = PokemonCatalog()
         self.types_dict: Dict[str, PokemonType] = {}
         self.rarities_dict: Dict[str, Rarity] = {}
         self.gacha_machines_dict: Dict[str, GachaMachine] = {}
         self.items_list: List[Item] = []
         
+        # Drop probabilities shared by gacha, stats and UI (built after data load)
+        self.probability_table: Optional[ProbabilityTable] = None
+        
+        # Lookup indexes (built by build_indexes after data load)
+        self.pokemon_by_number: Dict[str, Pokemon] = {}
+        self.pokemon_by_rarity: Dict[str, List[Pokemon]] = {}
+        self.pokemon_by_type: Dict[str, List[Pokemon]] = {}
+        self.pokemon_by_version: Dict[str, List[Pokemon]] = {}
+        self.item_by_number: Dict[str, Item] = {}
+        self.items_by_rarity: Dict[str, List[Item]] = {}
+        # (rarity, availability in each of POKEMON_VERSIONS) -> catalog rows
+        self._pokemon_buckets: Dict[Tuple[str, Tuple[bool, ...]], List[int]] = {}
+        
         # Image cache
         self.images: Dict[str, pygame.Surface] = {}
         self.placeholder_image: Optional[pygame.Surface] = None
         
+        # Scaled copies of cached images, least recently used first:
+        # (path, size, smooth) -> (source surface, scaled surface)
+        self._scaled: 'OrderedDict[Tuple[str, Tuple[int, int], bool], Tuple[pygame.Surface, pygame.Surface]]' = OrderedDict()
+        self._scaled_bytes = 0
+        self.scaled_cache_bytes = scaled_cache_bytes
+        
         # Special images
         self.gacha_item_image: Optional[pygame.Surface] = None
         
@@ -55,25 +90,219 @@ class ResourceManager:
         if path in self.images:
             return self.images[path]
         
-        # Try to load
+        with span("load_image", path=path):
+            return self.add_image(path, self.decode_image(path), convert_alpha)
+    
+    def decode_image(self, path: str) -> Optional[pygame.Surface]:
+        """
+        Read and decode an image file without converting it for the
+        display, so it can run on a worker thread
+        
+        Args:
+            path: Path to image file
+            
+        Returns:
+            Decoded pygame Surface, or None if missing or unreadable
+        """
         if not os.path.exists(path):
             # Use ascii encoding to avoid Unicode errors in console
             safe_path = path.encode('ascii', 'replace').decode('ascii')
             print(f"Warning: Image not found: {safe_path}")
+            return None
+        
+        try:
+            with span("decode_image", path=path):
+                return pygame.image.load(path)
+        except Exception as e:
+            print(f"Error loading image {path}: {e}")
+            return None
+    
+    def add_image(self, path: str, image: Optional[pygame.Surface], convert_alpha: bool = True) -> pygame.Surface:
+        """
+        Convert a decoded image for the display and cache it (main thread)
+        
+        Args:
+            path: Path the image was decoded from (cache key)
+            image: Surface from decode_image(), or None
+            convert_alpha: Whether to convert with alpha channel
+            
+        Returns:
+            Cached pygame Surface, or placeholder if image is None
+        """
+        if image is None:
             return self.placeholder_image
         
         try:
-            image = pygame.image.load(path)
             if convert_alpha:
                 image = image.convert_alpha()
             else:
                 image = image.convert()
-            
-            self.images[path] = image
-            return image
         except Exception as e:
             print(f"Error loading image {path}: {e}")
             return self.placeholder_image
+        
+        self.images[path] = image
+        return image
+    
+    def get_scaled_image(self, path: str, size: Tuple[int, int], smooth: bool = False) -> Optional[pygame.Surface]:
+        """
+        Get a cached image scaled to size, scaling it only the first time
+        
+        The returned surface is shared with every other caller asking for
+        the same size (and is the cached image itself when the size already
+        matches): treat it as read-only and copy() it before drawing on it,
+        tinting it or changing its alpha.
+        
+        Args:
+            path: Path of an image already in the cache
+            size: Target (width, height)
+            smooth: Use smoothscale instead of scale
+            
+        Returns:
+            Shared, read-only scaled pygame Surface, or None if the image
+            is not loaded
+        """
+        image = self.images.get(path)
+        if image is None:
+            return None
+        return self._get_scaled(path, image, size, smooth)
+    
+    def load_scaled_image(self, path: str, size: Tuple[int, int], smooth: bool = False) -> pygame.Surface:
+        """
+        Load an image (see load_image) and get it scaled to size
+        
+        Like get_scaled_image(), the returned surface is shared and must be
+        treated as read-only.
+        
+        Args:
+            path: Path to image file
+            size: Target (width, height)
+            smooth: Use smoothscale instead of scale
+            
+        Returns:
+            Shared, read-only scaled pygame Surface (scaled placeholder if
+            not found)
+        """
+        return self._get_scaled(path, self.load_image(path), size, smooth)
+    
+    def clear_scaled_images(self):
+        """Drop every cached scaled image"""
+        self._scaled.clear()
+        self._scaled_bytes = 0
+    
+    def _get_scaled(self, path: str, image: pygame.Surface, size: Tuple[int, int], smooth: bool) -> pygame.Surface:
+        """Scaled-image cache lookup; scales and evicts on a miss (result is shared)"""
+        size = (max(0, int(size[0])), max(0, int(size[1])))
+        key = (path, size, smooth)
+        entry = self._scaled.get(key)
+        if entry is not None and entry[0] is image:
+            self._scaled.move_to_end(key)
+            return entry[1]
+        
+        if image.get_size() == size:
+            scaled = image
+        elif smooth and image.get_bitsize() in (24, 32):
+            scaled = pygame.transform.smoothscale(image, size)
+        else:
+            scaled = pygame.transform.scale(image, size)
+        
+        if entry is not None:
+            # The source image was replaced since this entry was made
+            self._forget_scaled(key)
+        cost = size[0] * size[1] * scaled.get_bytesize()
+        if scaled is image or cost > self.scaled_cache_bytes:
+            return scaled
+        
+        self._scaled[key] = (image, scaled)
+        self._scaled_bytes += cost
+        while self._scaled_bytes > self.scaled_cache_bytes:
+            self._forget_scaled(next(iter(self._scaled)))
+        return scaled
+    
+    def _forget_scaled(self, key: Tuple[str, Tuple[int, int], bool]):
+        """Remove one scaled-image cache entry"""
+        _, scaled = self._scaled.pop(key)
+        width, height = scaled.get_size()
+        self._scaled_bytes -= width * height * scaled.get_bytesize()
+    
+    def decode_atlas(self, index_path: str) -> Optional[Tuple[Dict, List[Optional[pygame.Surface]]]]:
+        """
+        Read a sprite atlas index and decode its pages without converting
+        them, so it can run on a worker thread
+        
+        Args:
+            index_path: Path to atlas.json (see scripts/build_sprite_atlas.py)
+            
+        Returns:
+            Tuple of (index dict, decoded pages), or None if there is no
+            usable atlas (sprites are then loaded file by file)
+        """
+        if not os.path.exists(index_path):
+            return None
+        
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('format') != ATLAS_FORMAT:
+                print(f"Warning: Ignoring sprite atlas with unknown format: {index_path}")
+                return None
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read sprite atlas {index_path}: {e}")
+            return None
+        
+        atlas_dir = os.path.dirname(index_path)
+        pages = [self.decode_image(os.path.join(atlas_dir, name)) for name in index['pages']]
+        return index, pages
+    
+    def add_atlas(self, decoded: Optional[Tuple[Dict, List[Optional[pygame.Surface]]]], base_path: str = "") -> int:
+        """
+        Convert decoded atlas pages and cache every sprite on them as a
+        subsurface, so load_image() finds it without opening its file
+        (main thread)
+        
+        Args:
+            decoded: Result of decode_atlas() (None does nothing)
+            base_path: Asset base path the CSV image paths are resolved with
+            
+        Returns:
+            Number of sprites added
+        """
+        if decoded is None:
+            return 0
+        
+        index, pages = decoded
+        converted = []
+        for page in pages:
+            try:
+                converted.append(page.convert_alpha() if page is not None else None)
+            except pygame.error as e:
+                print(f"Error converting sprite atlas page: {e}")
+                converted.append(None)
+        
+        added = 0
+        for sprite_path, (page, x, y, width, height) in index['sprites'].items():
+            surface = converted[page]
+            path = os.path.join(base_path, sprite_path) if base_path else sprite_path
+            if surface is None or path in self.images:
+                continue
+            self.images[path] = surface.subsurface((x, y, width, height))
+            added += 1
+        
+        print(f"[OK] Loaded {added} sprites from {len(converted)} atlas pages")
+        return added
+    
+    def load_atlas(self, index_path: str, base_path: str = "") -> int:
+        """
+        Load a sprite atlas (decode_atlas() followed by add_atlas())
+        
+        Args:
+            index_path: Path to atlas.json
+            base_path: Asset base path the CSV image paths are resolved with
+            
+        Returns:
+            Number of sprites added
+        """
+        return self.add_atlas(self.decode_atlas(index_path), base_path)
     
     def get_pokemon_sprite(self, pokemon_number: str) -> pygame.Surface:
         """
@@ -85,10 +314,9 @@ class ResourceManager:
         Returns:
             Pokemon sprite Surface
         """
-        # Find Pokemon in list
-        for pokemon in self.pokemon_list:
-            if pokemon.number == pokemon_number:
-                return self.load_image(pokemon.image_path)
+        pokemon = self.pokemon_by_number.get(pokemon_number)
+        if pokemon:
+            return self.load_image(pokemon.image_path)
         
         print(f"Warning: Pokemon {pokemon_number} not found")
         return self.placeholder_image
@@ -111,10 +339,7 @@ class ResourceManager:
     
     def get_pokemon_by_number(self, pokemon_number: str) -> Optional[Pokemon]:
         """Get Pokemon data object by number"""
-        for pokemon in self.pokemon_list:
-            if pokemon.number == pokemon_number:
-                return pokemon
-        return None
+        return self.pokemon_by_number.get(pokemon_number)
     
     def get_type(self, type_name: str) -> Optional[PokemonType]:
         """Get type data object by name"""
@@ -130,10 +355,140 @@ class ResourceManager:
     
     def get_item_by_number(self, item_number: str) -> Optional[Item]:
         """Get Item data object by number"""
-        for item in self.items_list:
-            if item.number == item_number:
-                return item
-        return None
+        return self.item_by_number.get(item_number)
+    
+    def build_indexes(self):
+        """
+        Build the number, rarity, type and version lookups over the loaded
+        data. Call after the CSV data is (re)loaded.
+        """
+        self.install_indexes(self.compute_indexes(self.pokemon_list, self.items_list))
+    
+    @staticmethod
+    def compute_indexes(pokemon_list: Optional[Sequence[Pokemon]] = None,
+                        items_list: Optional[List[Item]] = None) -> Dict[str, object]:
+        """
+        Compute the lookups for the given data without touching any
+        ResourceManager (hot reload builds them off the main thread)
+        
+        Args:
+            pokemon_list: Pokemon to index (None to skip the Pokemon lookups)
+            items_list: Items to index (None to skip the item lookups)
+            
+        Returns:
+            Dict of attribute name -> lookup, for install_indexes()
+        """
+        indexes: Dict[str, object] = {}
+        
+        if pokemon_list is not None:
+            pokemon_by_rarity: Dict[str, List[Pokemon]] = {}
+            pokemon_by_type: Dict[str, List[Pokemon]] = {}
+            for pokemon in pokemon_list:
+                pokemon_by_rarity.setdefault(pokemon.rarity, []).append(pokemon)
+                pokemon_by_type.setdefault(pokemon.type1, []).append(pokemon)
+                if pokemon.type2:
+                    pokemon_by_type.setdefault(pokemon.type2, []).append(pokemon)
+            
+            weights = [version_weights(pokemon_list, version) for version in POKEMON_VERSIONS]
+            pokemon_by_version: Dict[str, List[Pokemon]] = {version: [] for version in POKEMON_VERSIONS}
+            pokemon_buckets: Dict[Tuple[str, Tuple[bool, ...]], List[int]] = {}
+            for index, pokemon in enumerate(pokemon_list):
+                available = tuple(column[index] > 0 for column in weights)
+                for version, is_available in zip(POKEMON_VERSIONS, available):
+                    if is_available:
+                        pokemon_by_version[version].append(pokemon)
+                pokemon_buckets.setdefault((pokemon.rarity, available), []).append(index)
+            
+            indexes['pokemon_by_number'] = {pokemon.number: pokemon for pokemon in pokemon_list}
+            indexes['pokemon_by_rarity'] = pokemon_by_rarity
+            indexes['pokemon_by_type'] = pokemon_by_type
+            indexes['pokemon_by_version'] = pokemon_by_version
+            indexes['_pokemon_buckets'] = pokemon_buckets
+        
+        if items_list is not None:
+            items_by_rarity: Dict[str, List[Item]] = {}
+            for item in items_list:
+                items_by_rarity.setdefault(item.rarity, []).append(item)
+            
+            indexes['item_by_number'] = {item.number: item for item in items_list}
+            indexes['items_by_rarity'] = items_by_rarity
+        
+        return indexes
+    
+    def install_indexes(self, indexes: Dict[str, object]):
+        """
+        Replace lookups with ones from compute_indexes()
+        
+        Args:
+            indexes: Dict of attribute name -> lookup
+        """
+        for name, index in indexes.items():
+            setattr(self, name, index)
+    
+    def find_pokemon(self, available_in: Sequence[str] = (), unavailable_in: Sequence[str] = (),
+                     rarity: Optional[str] = None) -> List[Pokemon]:
+        """
+        Pokemon matching availability and rarity conditions, from the
+        prebuilt buckets (cost grows with the matches, not the catalog)
+        
+        Args:
+            available_in: Versions the Pokemon must drop from
+            unavailable_in: Versions the Pokemon must not drop from
+            rarity: Required rarity tier (None for any)
+            
+        Returns:
+            Matching Pokemon in Pokedex order
+        """
+        required = [POKEMON_VERSIONS.index(v) for v in available_in if v in POKEMON_VERSIONS]
+        excluded = [POKEMON_VERSIONS.index(v) for v in unavailable_in if v in POKEMON_VERSIONS]
+        if len(required) < len(available_in):
+            return []
+        
+        indices = []
+        for (bucket_rarity, available), bucket in self._pokemon_buckets.items():
+            if rarity is not None and bucket_rarity != rarity:
+                continue
+            if all(available[i] for i in required) and not any(available[i] for i in excluded):
+                indices.extend(bucket)
+        
+        indices.sort()
+        return [self.pokemon_list[index] for index in indices]
+    
+    def build_probability_table(self) -> ProbabilityTable:
+        """
+        Build the shared probability table, or rebuild it in place so every
+        holder sees the new rates. Call after the CSV data is (re)loaded.
+        
+        Returns:
+            The shared ProbabilityTable
+        """
+        if self.probability_table is None:
+            self.probability_table = ProbabilityTable(self.pokemon_list, self.rarities_dict, self.items_list)
+        else:
+            self.probability_table.pokemon_list = self.pokemon_list
+            self.probability_table.rarities_dict = self.rarities_dict
+            self.probability_table.items_list = self.items_list
+            self.probability_table.rebuild()
+        return self.probability_table
+    
+    def create_new_pokemon_tracker(self) -> NewChanceTracker:
+        """
+        Create a new-Pokemon chance tracker over the Red/Blue/Yellow drops
+        
+        Returns:
+            NewChanceTracker (attach it with GameData.set_new_pokemon_tracker)
+        """
+        return NewChanceTracker({version: self.probability_table.version_probabilities(version)
+                                 for version in POKEMON_VERSIONS})
+    
+    def create_new_item_tracker(self) -> NewChanceTracker:
+        """
+        Create a new-item chance tracker over the Items machine drops
+        
+        Returns:
+            NewChanceTracker (attach it with GameData.set_new_item_tracker)
+        """
+        return NewChanceTracker({ITEMS_VERSION: self.probability_table.version_probabilities(ITEMS_VERSION)})
     
     def get_item_icon(self, item_number: str) -> pygame.Surface:
         """
@@ -8,7 +8,8 @@ from abc import ABC, abstractmethod
 class GameState(ABC):
     """Base class for all game states"""
     
-    def __init__(self, state_manager, game_data, resource_manager, audio_manager, font_manager=None, gacha_system=None):
+    def __init__(self, state_manager, game_data, resource_manager, audio_manager, font_manager=None, gacha_system=None,
+                 items_gacha_system=None):
         """
         Initialize game state
         
@@ -19,6 +20,7 @@ class GameState(ABC):
             audio_manager: AudioManager instance
             font_manager: FontManager instance (optional)
             gacha_system: GachaSystem instance (optional)
+            items_gacha_system: ItemsGachaSystem instance (optional)
         """
         self.state_manager = state_manager
         self.game_data = game_data
@@ -26,6 +28,7 @@ class GameState(ABC):
         self.audio_manager = audio_manager
         self.font_manager = font_manager
         self.gacha_system = gacha_system
+        self.items_gacha_system = items_gacha_system
         self.screen = state_manager.screen
         self.clock = state_manager.clock
     
@@ -5,7 +5,7 @@ import pygame
 import math
 import random
 from states.base_state import GameState
-from config import COLOR_WHITE, COLOR_BLACK, SCREEN_WIDTH, SCREEN_HEIGHT
+from config import COLOR_WHITE, COLOR_BLACK, SCREEN_WIDTH, SCREEN_HEIGHT, RAYS_PATH
 
 class GachaAnimationState(GameState):
     """State for animating the gacha pull result"""
@@ -180,19 +180,13 @@ class GachaAnimationState(GameState):
         if hasattr(self.resource_manager, 'rays') and self.resource_manager.rays:
             self._render_rays_effect(screen, result.rarity, rarity_color, progress)
         
-        # Get image (Pokemon sprite or item icon)
-        if self.is_items_gacha:
-            image = self.resource_manager.get_item_icon(result.number)
-        else:
-            image = self.resource_manager.images.get(result.image_path)
+        # Get image scaled (Pokemon sprite or item icon)
+        base_size = 200
+        image = self._get_scaled_result_image(result, base_size)
         
         if not image:
             return
         
-        # Scale image
-        base_size = 200
-        image = pygame.transform.scale(image, (base_size, base_size))
-        
         # Apply effects based on progress and rarity
         image = self._apply_animation_effects(image, result.rarity, progress)
         
@@ -241,19 +235,13 @@ class GachaAnimationState(GameState):
                     rarity_color = rarity_obj.get_color_rgb()
                     self._render_rays_effect_at_position(screen, result.rarity, rarity_color, item_progress, center_x, center_y, scale_multiplier=0.4)
             
-            # Get image (Pokemon sprite or item icon)
-            if self.is_items_gacha:
-                image = self.resource_manager.get_item_icon(result.number)
-            else:
-                image = self.resource_manager.images.get(result.image_path)
+            # Get image scaled smaller for 10-pull (Pokemon sprite or item icon)
+            size = 80
+            image = self._get_scaled_result_image(result, size)
             
             if not image:
                 continue
             
-            # Scale smaller for 10-pull
-            size = 80
-            image = pygame.transform.scale(image, (size, size))
-            
             # Apply scale-up effect during appearance
             if item_progress < 1.0:
                 scale_factor = 0.5 + item_progress * 0.5
@@ -279,6 +267,12 @@ class GachaAnimationState(GameState):
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
             screen.blit(text_surface, text_rect)
     
+    def _get_scaled_result_image(self, result, size: int):
+        """Pokemon sprite or item icon of a result, scaled to size x size"""
+        if self.is_items_gacha:
+            return self.resource_manager.load_scaled_image(result.get_icon_path(), (size, size))
+        return self.resource_manager.get_scaled_image(result.image_path, (size, size))
+    
     def _render_rays_effect(self, screen, rarity: str, rarity_color: tuple, progress: float):
         """
         Render rays background effect with rarity-based scaling and colorization
@@ -310,7 +304,7 @@ class GachaAnimationState(GameState):
         scaled_size = int(base_size * scale)
         
         # Scale rays
-        scaled_rays = pygame.transform.scale(rays, (scaled_size, scaled_size))
+        scaled_rays = self.resource_manager.load_scaled_image(RAYS_PATH, (scaled_size, scaled_size))
         
         # Create a copy for colorization
         colorized_rays = scaled_rays.copy()
@@ -375,7 +369,7 @@ class GachaAnimationState(GameState):
         scaled_size = int(base_size * scale)
         
         # Scale and colorize rays
-        scaled_rays = pygame.transform.scale(rays, (scaled_size, scaled_size))
+        scaled_rays = self.resource_manager.load_scaled_image(RAYS_PATH, (scaled_size, scaled_size))
         colorized_rays = scaled_rays.copy()
         
         # Apply rarity color tint
@@ -4,14 +4,15 @@ GachaBuy state - Select and purchase gacha rolls
 import pygame
 import random
 from .base_state import GameState
-from config import COLOR_WHITE, COLOR_BLACK, COLOR_GRAY, SCREEN_WIDTH, SCREEN_HEIGHT
+from config import (COLOR_WHITE, COLOR_BLACK, COLOR_GRAY, SCREEN_WIDTH, SCREEN_HEIGHT, GACHA_RED_PATH,
+                    GACHA_BLUE_PATH, GACHA_YELLOW_PATH, GACHA_ITEM_PATH, POKEDOLLAR_ICON_PATH)
 from ui.button import Button
 from ui.currency_display import CurrencyDisplay
 from ui.gacha_info_popup import GachaInfoPopup
 from ui.items_info_popup import ItemsInfoPopup
 from ui.pokemon_details_popup import PokemonDetailsPopup
 from utils.gacha_stats import GachaStats
-from logic.items_gacha import perform_items_gacha, calculate_new_item_chance
+from logic.items_gacha import calculate_new_item_chance
 
 
 class GachaBuyState(GameState):
@@ -37,19 +38,20 @@ class GachaBuyState(GameState):
             "Items": self.resource_manager.get_gacha_machine("Items")
         }
         
-        # Calculate recommended machine (needs most pulls)
+        # Calculate recommended machine (cheapest expected way to complete)
         # Don't show recommendation if collection is complete
         total_pokemon = len(self.resource_manager.pokemon_list)
         owned_count = self.game_data.get_total_owned_count()
         
         if owned_count >= total_pokemon:
-            self.recommended_machine = None  # No recommendation when complete
+            self.pull_plan = None  # No recommendation when complete
         else:
-            self.recommended_machine, _ = GachaStats.find_recommended_version(
-                self.resource_manager.pokemon_list,
-                self.resource_manager.rarities_dict,
-                self.game_data.pokemon_owned
+            self.pull_plan = GachaStats.find_recommended_version(
+                self.resource_manager.probability_table,
+                self.game_data.pokemon_owned,
+                self.machines
             )
+        self.recommended_machine = self.pull_plan.machine if self.pull_plan else None
         
         # Currency click hold tracking
         self.currency_held = False
@@ -213,64 +215,54 @@ class GachaBuyState(GameState):
         self.featured_items = {}
         
         # RED: Show version exclusives (Pokemon with Blue_Weight=0 and Red_Weight>0)
-        red_exclusives = [p for p in self.resource_manager.pokemon_list 
-                         if p.red_weight > 0 and p.blue_weight == 0]
+        red_exclusives = self.resource_manager.find_pokemon(available_in=["Red"], unavailable_in=["Blue"])
         if len(red_exclusives) >= 3:
             self.featured_pokemon["Red"] = random.sample(red_exclusives, 3)
         else:
             # Fallback: just show random Pokemon from Red
-            red_available = [p for p in self.resource_manager.pokemon_list 
-                           if p.red_weight > 0]
+            red_available = self.resource_manager.pokemon_by_version["Red"]
             self.featured_pokemon["Red"] = random.sample(red_available, min(3, len(red_available)))
         
         # BLUE: Show version exclusives (Pokemon with Red_Weight=0 and Blue_Weight>0)
-        blue_exclusives = [p for p in self.resource_manager.pokemon_list 
-                          if p.blue_weight > 0 and p.red_weight == 0]
+        blue_exclusives = self.resource_manager.find_pokemon(available_in=["Blue"], unavailable_in=["Red"])
         if len(blue_exclusives) >= 3:
             self.featured_pokemon["Blue"] = random.sample(blue_exclusives, 3)
         else:
             # Fallback: just show random Pokemon from Blue
-            blue_available = [p for p in self.resource_manager.pokemon_list 
-                            if p.blue_weight > 0]
+            blue_available = self.resource_manager.pokemon_by_version["Blue"]
             self.featured_pokemon["Blue"] = random.sample(blue_available, min(3, len(blue_available)))
         
         # YELLOW: Show Legendary Pokemon
-        legendaries = [p for p in self.resource_manager.pokemon_list 
-                      if p.rarity == "Legendary" and p.yellow_weight > 0]
+        legendaries = self.resource_manager.find_pokemon(available_in=["Yellow"], rarity="Legendary")
         if len(legendaries) >= 3:
             self.featured_pokemon["Yellow"] = random.sample(legendaries, 3)
         else:
             # If less than 3 legendaries, show all legendaries + some epics
-            epics = [p for p in self.resource_manager.pokemon_list 
-                    if p.rarity == "Epic" and p.yellow_weight > 0]
+            epics = self.resource_manager.find_pokemon(available_in=["Yellow"], rarity="Epic")
             all_featured = legendaries + random.sample(epics, min(3 - len(legendaries), len(epics)))
             self.featured_pokemon["Yellow"] = all_featured[:3]
         
         # ITEMS: Show high-value items (Legendary and Epic)
-        high_value_items = [i for i in self.resource_manager.items_list 
-                           if i.rarity in ["Legendary", "Epic"]]
+        high_value_items = (self.resource_manager.items_by_rarity.get("Legendary", [])
+                            + self.resource_manager.items_by_rarity.get("Epic", []))
         if len(high_value_items) >= 3:
             self.featured_items["Items"] = random.sample(high_value_items, 3)
         else:
             # Show all high-value + some rare
-            rare_items = [i for i in self.resource_manager.items_list if i.rarity == "Rare"]
+            rare_items = self.resource_manager.items_by_rarity.get("Rare", [])
             all_featured = high_value_items + random.sample(rare_items, min(3 - len(high_value_items), len(rare_items)))
             self.featured_items["Items"] = all_featured[:3]
     
     def _calculate_new_pokemon_chance(self, version: str) -> float:
         """Calculate % chance of getting a new (unowned) Pokemon"""
-        # Get available Pokemon for this version
-        available = [p for p in self.resource_manager.pokemon_list 
-                    if p.get_weight_for_version(version) > 0]
-        
-        if not available:
-            return 0.0
-        
-        # Count unowned Pokemon
-        unowned_count = sum(1 for p in available if not self.game_data.has_pokemon(p.number))
-        
-        # Simple calculation: unowned / total available
-        return (unowned_count / len(available)) * 100.0
+        # Maintained incrementally as Pokemon are added, so this is free per frame
+        if self.game_data.new_pokemon_tracker:
+            return self.game_data.new_pokemon_tracker.chance(version) * 100.0
+        
+        # Fallback: sum the drop probabilities of unowned Pokemon
+        probabilities = self.resource_manager.probability_table.version_probabilities(version)
+        return sum(prob for number, prob in probabilities.items()
+                   if not self.game_data.has_pokemon(number)) * 100.0
     
     def _single_pull(self):
         """Perform single pull"""
@@ -284,15 +276,7 @@ class GachaBuyState(GameState):
             # Check if this is Items gacha
             if self.selected_machine == "Items":
                 # Perform items gacha
-                item_numbers = perform_items_gacha(
-                    self.resource_manager.items_list,
-                    self.resource_manager.rarities_dict,
-                    count=1
-                )
-                
-                # Get item objects
-                results = [self.resource_manager.get_item_by_number(num) for num in item_numbers]
-                results = [r for r in results if r is not None]  # Filter None
+                results = [self.items_gacha_system.roll_single()]
                 
                 try:
                     print(f"Single pull from Items machine! Got {results[0].name} ({results[0].rarity})! Gold: {self.game_data.gold}")
@@ -339,7 +323,7 @@ class GachaBuyState(GameState):
                 f"You need {machine.cost_single:,} Pokédollars but only have {self.game_data.gold:,}.",
                 self.font_manager,
                 add_gold_callback=add_gold,
-                pokedollar_icon=self.resource_manager.pokedollar_icon,
+                pokedollar_icon=self.resource_manager.load_scaled_image(POKEDOLLAR_ICON_PATH, (18, 18)),
                 audio_manager=self.audio_manager
             )
     
@@ -355,15 +339,7 @@ class GachaBuyState(GameState):
             # Check if this is Items gacha
             if self.selected_machine == "Items":
                 # Perform items gacha
-                item_numbers = perform_items_gacha(
-                    self.resource_manager.items_list,
-                    self.resource_manager.rarities_dict,
-                    count=10
-                )
-                
-                # Get item objects
-                results = [self.resource_manager.get_item_by_number(num) for num in item_numbers]
-                results = [r for r in results if r is not None]  # Filter None
+                results = self.items_gacha_system.roll_ten()
                 
                 print(f"10-pull from Items machine! Gold: {self.game_data.gold}")
                 for item in results:
@@ -409,7 +385,7 @@ class GachaBuyState(GameState):
                 f"You need {machine.cost_10pull:,} Pokédollars but only have {self.game_data.gold:,}.",
                 self.font_manager,
                 add_gold_callback=add_gold,
-                pokedollar_icon=self.resource_manager.pokedollar_icon,
+                pokedollar_icon=self.resource_manager.load_scaled_image(POKEDOLLAR_ICON_PATH, (18, 18)),
                 audio_manager=self.audio_manager
             )
     
@@ -426,8 +402,7 @@ class GachaBuyState(GameState):
                 SCREEN_HEIGHT // 2,
                 800,
                 600,
-                self.resource_manager.items_list,
-                self.resource_manager.rarities_dict,
+                self.resource_manager.probability_table,
                 self.font_manager,
                 callback=None,
                 audio_manager=self.audio_manager
@@ -440,8 +415,7 @@ class GachaBuyState(GameState):
                 700,
                 600,
                 self.selected_machine,
-                self.resource_manager.pokemon_list,
-                self.resource_manager.rarities_dict,
+                self.resource_manager.probability_table,
                 self.font_manager,
                 callback=None,
                 audio_manager=self.audio_manager
@@ -556,15 +530,16 @@ class GachaBuyState(GameState):
         self.screen.fill(COLOR_BLACK)
         
         # Draw gacha machine image based on selection
-        machine_image = None
+        machine_path = None
         if self.selected_machine == "Red":
-            machine_image = self.resource_manager.gacha_red
+            machine_path = GACHA_RED_PATH
         elif self.selected_machine == "Blue":
-            machine_image = self.resource_manager.gacha_blue
+            machine_path = GACHA_BLUE_PATH
         elif self.selected_machine == "Yellow":
-            machine_image = self.resource_manager.gacha_yellow
+            machine_path = GACHA_YELLOW_PATH
         elif self.selected_machine == "Items":
-            machine_image = self.resource_manager.gacha_item
+            machine_path = GACHA_ITEM_PATH
+        machine_image = self.resource_manager.images.get(machine_path)
         
         if machine_image:
             # Scale machine image to fit screen (max 400x400)
@@ -576,7 +551,7 @@ class GachaBuyState(GameState):
             if scale_factor < 1.0:
                 new_width = int(original_size[0] * scale_factor)
                 new_height = int(original_size[1] * scale_factor)
-                scaled_image = pygame.transform.smoothscale(machine_image, (new_width, new_height))
+                scaled_image = self.resource_manager.get_scaled_image(machine_path, (new_width, new_height), smooth=True)
             else:
                 scaled_image = machine_image
             
@@ -637,19 +612,20 @@ class GachaBuyState(GameState):
                 self.featured_pokemon_rects.append((box_rect, pokemon))
                 
                 # Draw Pokemon sprite
-                image = self.resource_manager.images.get(pokemon.image_path)
-                if image:
-                    scaled_image = pygame.transform.scale(image, (sprite_size - 10, sprite_size - 10))
+                scaled_image = self.resource_manager.get_scaled_image(pokemon.image_path, (sprite_size - 10, sprite_size - 10))
+                if scaled_image:
                     img_rect = scaled_image.get_rect(center=box_rect.center)
                     self.screen.blit(scaled_image, img_rect)
         
         # Draw % chance for new Pokemon/Items
         if self.selected_machine == "Items":
-            new_chance = calculate_new_item_chance(
-                self.resource_manager.items_list,
-                self.resource_manager.rarities_dict,
-                self.game_data.items_owned
-            )
+            if self.game_data.new_item_tracker:
+                new_chance = self.game_data.new_item_tracker.chance("Items") * 100.0
+            else:
+                new_chance = calculate_new_item_chance(
+                    self.resource_manager.probability_table,
+                    self.game_data.items_owned
+                )
             chance_text = f"New Item Chance: {new_chance:.1f}%"
         else:
             new_chance = self._calculate_new_pokemon_chance(self.selected_machine)
@@ -692,7 +668,7 @@ class GachaBuyState(GameState):
             currency_x,
             currency_y,
             self.game_data.gold,
-            self.resource_manager.pokedollar_icon,
+            self.resource_manager.load_scaled_image(POKEDOLLAR_ICON_PATH, (28, 28)),
             self.font_manager,
             font_size=28,
             color=COLOR_WHITE,
@@ -704,6 +680,16 @@ class GachaBuyState(GameState):
         self.single_pull_button.render(self.screen)
         self.ten_pull_button.render(self.screen)
         
+        # Mark the pull size the plan suggests on the recommended machine
+        if self.pull_plan and self.selected_machine == self.recommended_machine:
+            best_button = self.ten_pull_button if self.pull_plan.ten_pull else self.single_pull_button
+            badge_rect = pygame.Rect(0, 0, 110, 20)
+            badge_rect.midtop = (best_button.rect.centerx, best_button.rect.bottom - 8)
+            pygame.draw.rect(self.screen, (255, 255, 0), badge_rect)
+            pygame.draw.rect(self.screen, (200, 200, 0), badge_rect, 2)  # Border
+            best_text = self.font_manager.render_text("BEST VALUE", 12, (0, 0, 0), is_title=True)
+            self.screen.blit(best_text, best_text.get_rect(center=badge_rect.center))
+        
         # Draw currency costs INSIDE pull buttons
         machine = self.machines[self.selected_machine]
         
@@ -713,7 +699,7 @@ class GachaBuyState(GameState):
             self.single_pull_button.rect.centerx,
             self.single_pull_button.rect.centery + 20,
             machine.cost_single,
-            self.resource_manager.pokedollar_icon,
+            self.resource_manager.load_scaled_image(POKEDOLLAR_ICON_PATH, (18, 18)),
             self.font_manager,
             font_size=18,
             color=COLOR_WHITE,
@@ -726,7 +712,7 @@ class GachaBuyState(GameState):
             self.ten_pull_button.rect.centerx,
             self.ten_pull_button.rect.centery + 20,
             machine.cost_10pull,
-            self.resource_manager.pokedollar_icon,
+            self.resource_manager.load_scaled_image(POKEDOLLAR_ICON_PATH, (18, 18)),
             self.font_manager,
             font_size=18,
             color=COLOR_WHITE,
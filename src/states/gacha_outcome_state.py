@@ -3,19 +3,20 @@ Gacha Outcome State - Shows results with Pokemon/Item tiles
 """
 import pygame
 from states.base_state import GameState
-from config import COLOR_WHITE, COLOR_BLACK, SCREEN_WIDTH, SCREEN_HEIGHT, IS_WEB
+from config import COLOR_WHITE, COLOR_BLACK, SCREEN_WIDTH, SCREEN_HEIGHT, IS_WEB, POKEDOLLAR_ICON_PATH
 from ui.button import Button
 from ui.pokemon_tile import PokemonTile
 from ui.item_tile import ItemTile
 from ui.currency_display import CurrencyDisplay
 from ui.pokemon_details_popup import PokemonDetailsPopup
-from logic.items_gacha import perform_items_gacha
 
 class GachaOutcomeState(GameState):
     """State for displaying gacha pull results"""
     
-    def __init__(self, state_manager, game_data, resource_manager, audio_manager, font_manager=None, gacha_system=None):
-        super().__init__(state_manager, game_data, resource_manager, audio_manager, font_manager, gacha_system)
+    def __init__(self, state_manager, game_data, resource_manager, audio_manager, font_manager=None, gacha_system=None,
+                 items_gacha_system=None):
+        super().__init__(state_manager, game_data, resource_manager, audio_manager, font_manager, gacha_system,
+                         items_gacha_system)
         self.results = []
         self.is_ten_pull = False
         self.is_items_gacha = False
@@ -287,15 +288,10 @@ class GachaOutcomeState(GameState):
         # Check if this is Items gacha
         if self.is_items_gacha:
             # Perform items gacha
-            item_numbers = perform_items_gacha(
-                self.resource_manager.items_list,
-                self.resource_manager.rarities_dict,
-                count=pull_count
-            )
-            
-            # Get item objects
-            results = [self.resource_manager.get_item_by_number(num) for num in item_numbers]
-            results = [r for r in results if r is not None]  # Filter None
+            if self.is_ten_pull:
+                results = self.items_gacha_system.roll_ten()
+            else:
+                results = [self.items_gacha_system.roll_single()]
             
             print(f"{pull_count}-pull from Items machine! Gold: {self.game_data.gold}")
             for item in results:
@@ -490,7 +486,7 @@ class GachaOutcomeState(GameState):
             currency_x,
             currency_y,
             self.game_data.gold,
-            self.resource_manager.pokedollar_icon,
+            self.resource_manager.load_scaled_image(POKEDOLLAR_ICON_PATH, (28, 28)),
             self.font_manager,
             font_size=28,
             color=COLOR_WHITE,
@@ -527,7 +523,7 @@ class GachaOutcomeState(GameState):
                 self.roll_same_button.rect.centerx,
                 self.roll_same_button.rect.centery + 20,
                 self.roll_same_cost,
-                self.resource_manager.pokedollar_icon,
+                self.resource_manager.load_scaled_image(POKEDOLLAR_ICON_PATH, (18, 18)),
                 self.font_manager,
                 font_size=18,
                 color=COLOR_WHITE,
@@ -3,7 +3,7 @@ Inventory/Pokédex State - Shows all 151 Pokemon with sorting and filtering
 """
 import pygame
 from states.base_state import GameState
-from config import COLOR_WHITE, COLOR_BLACK, SCREEN_WIDTH, SCREEN_HEIGHT, IS_WEB
+from config import COLOR_WHITE, COLOR_BLACK, SCREEN_WIDTH, SCREEN_HEIGHT, IS_WEB, POKEDOLLAR_ICON_PATH
 from ui.button import Button
 from ui.checkbox import Checkbox
 from ui.sort_button import SortButton, SortOrder
@@ -285,32 +285,28 @@ class InventoryState(GameState):
         blue_pulls = self.game_data.get_pulls_by_version("Blue")
         yellow_pulls = self.game_data.get_pulls_by_version("Yellow")
         
-        # Calculate expected remaining pulls
+        # Calculate expected pulls to complete each version (memoized per owned set)
         red_expected = GachaStats.calculate_expected_pulls_for_version(
-            self.resource_manager.pokemon_list,
-            self.resource_manager.rarities_dict,
+            self.resource_manager.probability_table,
             "Red",
             self.game_data.pokemon_owned
         )
         
         blue_expected = GachaStats.calculate_expected_pulls_for_version(
-            self.resource_manager.pokemon_list,
-            self.resource_manager.rarities_dict,
+            self.resource_manager.probability_table,
             "Blue",
             self.game_data.pokemon_owned
         )
         
         yellow_expected = GachaStats.calculate_expected_pulls_for_version(
-            self.resource_manager.pokemon_list,
-            self.resource_manager.rarities_dict,
+            self.resource_manager.probability_table,
             "Yellow",
             self.game_data.pokemon_owned
         )
         
         # Calculate total expected from scratch (returns sum)
         total_expected = GachaStats.calculate_expected_pulls_from_scratch(
-            self.resource_manager.pokemon_list,
-            self.resource_manager.rarities_dict
+            self.resource_manager.probability_table
         )
         
         # Calculate optimal strategy cost
@@ -320,8 +316,7 @@ class InventoryState(GameState):
             "Yellow": self.resource_manager.get_gacha_machine("Yellow")
         }
         optimal_cost = GachaStats.calculate_optimal_strategy_cost(
-            self.resource_manager.pokemon_list,
-            self.resource_manager.rarities_dict,
+            self.resource_manager.probability_table,
             machines
         )
         
@@ -513,7 +508,7 @@ class InventoryState(GameState):
             currency_x,
             currency_y,
             self.game_data.gold,
-            self.resource_manager.pokedollar_icon,
+            self.resource_manager.load_scaled_image(POKEDOLLAR_ICON_PATH, (28, 28)),
             self.font_manager,
             font_size=28,
             color=COLOR_WHITE,
@@ -4,8 +4,11 @@ Loading screen state - loads all game assets
 import pygame
 import math
 from .base_state import GameState
+from utils import tracing
+from utils.decode_pool import DecodePool
 from config import (COLOR_WHITE, COLOR_BLACK, LOGO_PATH, GACHA_RED_PATH, 
-                    GACHA_BLUE_PATH, GACHA_YELLOW_PATH, GACHA_ITEM_PATH, POKEDOLLAR_ICON_PATH, RAYS_PATH, SOUNDS_PATH, LOADING_TIME)
+                    GACHA_BLUE_PATH, GACHA_YELLOW_PATH, GACHA_ITEM_PATH, POKEDOLLAR_ICON_PATH, RAYS_PATH, SOUNDS_PATH, LOADING_TIME,
+                    IS_WEB)
 
 
 class LoadingState(GameState):
@@ -26,18 +29,14 @@ class LoadingState(GameState):
         self.showing_complete = False
         
         # Async loading state
-        self.pokemon_index = 0
-        self.types_loaded = False
+        self.decode_pool = None
+        self.sprites_total = 0
         self.ui_loaded = False
         self.audio_loaded = False
         
         # Try to load logo for display
         try:
             self.logo = self.resource_manager.load_image(LOGO_PATH)
-            # Scale logo to reasonable size
-            logo_width = min(400, self.logo.get_width())
-            logo_height = int(self.logo.get_height() * (logo_width / self.logo.get_width()))
-            self.logo = pygame.transform.scale(self.logo, (logo_width, logo_height))
         except:
             self.logo = None
         
@@ -45,6 +44,9 @@ class LoadingState(GameState):
     
     def exit(self):
         """Clean up loading state"""
+        if self.decode_pool is not None:
+            self.decode_pool.close()
+            self.decode_pool = None
         print("Exited LoadingState")
     
     def handle_events(self, events):
@@ -67,6 +69,11 @@ class LoadingState(GameState):
             # This ensures audio works properly on web
             return
         
+        with tracing.span(f"LoadingState: {self.load_stages[self.load_stage]}"):
+            self._update_stage()
+    
+    def _update_stage(self):
+        """Run this frame's share of the current loading stage"""
         # Stage 0: Load UI images
         if self.load_stage == 0:
             self.current_stage_text = self.load_stages[0]
@@ -80,38 +87,41 @@ class LoadingState(GameState):
             else:
                 self.load_stage = 1
         
-        # Stage 1: Load Pokemon sprites (gradually)
+        # Stage 1: Load Pokemon sprites and type icons (decoded on worker
+        # threads, converted here as they arrive)
         elif self.load_stage == 1:
             self.current_stage_text = self.load_stages[1]
             
-            # Load Pokemon sprites in batches for smoother progress
-            pokemon_list = self.resource_manager.pokemon_list
-            batch_size = 5  # Load 5 Pokemon per frame
+            if self.decode_pool is None:
+                # Sprites already cached (e.g. from the sprite atlas) are skipped
+                paths = [pokemon.image_path for pokemon in self.resource_manager.pokemon_list]
+                paths += [poke_type.image_path for poke_type in self.resource_manager.types_dict.values()]
+                paths = [path for path in dict.fromkeys(paths) if path not in self.resource_manager.images]
+                self.decode_pool = DecodePool(self.resource_manager.decode_image, parallel=not IS_WEB)
+                self.decode_pool.submit(paths)
+                self.sprites_total = len(paths)
             
-            if self.pokemon_index < len(pokemon_list):
-                end_index = min(self.pokemon_index + batch_size, len(pokemon_list))
-                for i in range(self.pokemon_index, end_index):
-                    self.resource_manager.load_image(pokemon_list[i].image_path)
-                self.pokemon_index = end_index
-                
-                # Update progress (UI=10%, Pokemon=70%, Audio=20%)
-                pokemon_progress = (self.pokemon_index / len(pokemon_list)) * 0.7
-                self.progress = 0.1 + pokemon_progress
-            else:
-                # Pokemon loading complete, move to types
-                if not self.types_loaded:
-                    for type_name, poke_type in self.resource_manager.types_dict.items():
-                        self.resource_manager.load_image(poke_type.image_path)
-                    self.types_loaded = True
-                    self.progress = 0.8
-                else:
-                    self.load_stage = 2
+            # Without threads (web) 5 sprites are decoded per frame
+            for path, image in self.decode_pool.collect(batch_size=5):
+                self.resource_manager.add_image(path, image)
+            
+            # Update progress (UI=10%, sprites=70%, Audio=20%)
+            if self.sprites_total:
+                done = self.sprites_total - self.decode_pool.pending
+                self.progress = 0.1 + (done / self.sprites_total) * 0.7
+            
+            if self.decode_pool.pending == 0:
+                self.decode_pool.close()
+                self.progress = 0.8
+                self.load_stage = 2
         
         # Stage 2: Load audio
         elif self.load_stage == 2:
             self.current_stage_text = self.load_stages[2]
             if not self.audio_loaded:
-                self.audio_manager.load_game_sounds(SOUNDS_PATH)
+                # Usually already decoded by the startup tasks
+                if not self.audio_manager.sounds_loaded:
+                    self.audio_manager.load_game_sounds(SOUNDS_PATH)
                 self.audio_manager.load_background_music_tracks(SOUNDS_PATH)
                 self.audio_manager.play_random_background_music()
                 self.audio_loaded = True
@@ -125,6 +135,7 @@ class LoadingState(GameState):
             self.progress = 1.0
             self.loading_complete = True
             self.showing_complete = True
+            tracing.mark("loading complete")
     
     def render(self):
         """Render loading screen"""
@@ -133,7 +144,7 @@ class LoadingState(GameState):
         # Display logo as full-screen background if available
         if self.logo:
             # Scale logo to cover the entire screen
-            logo_scaled = pygame.transform.scale(self.logo, (self.screen.get_width(), self.screen.get_height()))
+            logo_scaled = self.resource_manager.load_scaled_image(LOGO_PATH, self.screen.get_size())
             self.screen.blit(logo_scaled, (0, 0))
             
             # Add a semi-transparent dark overlay for better text readability
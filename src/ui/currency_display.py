@@ -30,8 +30,10 @@ class CurrencyDisplay:
         Returns:
             Rect of the rendered currency display
         """
-        # Scale icon
-        scaled_icon = pygame.transform.scale(icon, (icon_size, icon_size))
+        # Scale icon (callers pass one already scaled by ResourceManager)
+        scaled_icon = icon
+        if icon.get_size() != (icon_size, icon_size):
+            scaled_icon = pygame.transform.scale(icon, (icon_size, icon_size))
         
         # Render amount text
         amount_text = f"{amount:,}"  # Format with commas
@@ -82,8 +84,10 @@ class CurrencyDisplay:
         Returns:
             Rect of the rendered currency display
         """
-        # Scale icon
-        scaled_icon = pygame.transform.scale(icon, (icon_size, icon_size))
+        # Scale icon (callers pass one already scaled by ResourceManager)
+        scaled_icon = icon
+        if icon.get_size() != (icon_size, icon_size):
+            scaled_icon = pygame.transform.scale(icon, (icon_size, icon_size))
         
         # Render text
         amount_text = f"{amount:,}"
@@ -4,7 +4,7 @@ Gacha Info Popup - Shows all possible Pokemon and their drop rates
 import pygame
 from config import COLOR_WHITE, COLOR_BLACK, SCREEN_WIDTH, SCREEN_HEIGHT, IS_WEB
 from ui.button import Button
-from typing import Optional, List, Dict
+from typing import Optional
 
 
 class GachaInfoPopup:
@@ -12,8 +12,7 @@ class GachaInfoPopup:
     
     def __init__(self, x: int, y: int, width: int, height: int,
                  machine_name: str,
-                 pokemon_list: List,
-                 rarities_dict: Dict,
+                 probability_table,
                  font_manager,
                  callback: Optional[callable] = None,
                  audio_manager = None):
@@ -24,8 +23,7 @@ class GachaInfoPopup:
             x, y: Center position
             width, height: Popup dimensions
             machine_name: Name of the gacha machine (Red, Blue, Yellow)
-            pokemon_list: List of all Pokemon
-            rarities_dict: Dictionary of rarity data
+            probability_table: Shared ProbabilityTable
             font_manager: FontManager instance
             callback: Optional callback when closed
             audio_manager: AudioManager instance for click sounds (optional)
@@ -37,8 +35,10 @@ class GachaInfoPopup:
         self.machine_name = machine_name
         self.audio_manager = audio_manager
         
-        # Calculate drop rates
-        self.drop_rates = self._calculate_drop_rates(pokemon_list, rarities_dict, machine_name)
+        # Drop rates come precomputed (rarest first)
+        self.drop_rates = probability_table.drop_rates(machine_name)
+        if not self.drop_rates:
+            print(f"Warning: No Pokemon available for {machine_name}")
         
         # Scroll state
         self.scroll_offset = 0
@@ -71,71 +71,6 @@ class GachaInfoPopup:
             audio_manager=audio_manager
         )
     
-    def _calculate_drop_rates(self, pokemon_list: List, rarities_dict: Dict, version: str) -> List[tuple]:
-        """
-        Calculate drop rate for each Pokemon in this version
-        
-        Returns:
-            List of (pokemon, drop_rate_percent) tuples, sorted by drop rate descending
-        """
-        try:
-            # Filter Pokemon available in this version
-            available_pokemon = [p for p in pokemon_list if p.get_weight_for_version(version) > 0]
-            
-            if not available_pokemon:
-                print(f"Warning: No Pokemon available for {version}")
-                return []
-            
-            # Calculate total rarity weight
-            total_rarity_weight = sum(r.get_weight_for_version(version) for r in rarities_dict.values())
-            
-            if total_rarity_weight == 0:
-                print(f"Warning: Total rarity weight is 0 for {version}")
-                return []
-            
-            rates = []
-            
-            for pokemon in available_pokemon:
-                rarity = rarities_dict.get(pokemon.rarity)
-                if not rarity:
-                    print(f"Warning: Rarity '{pokemon.rarity}' not found for Pokemon #{pokemon.number}")
-                    continue
-                
-                # Probability of this rarity
-                rarity_weight = rarity.get_weight_for_version(version)
-                if rarity_weight == 0:
-                    continue
-                    
-                rarity_prob = rarity_weight / total_rarity_weight
-                
-                # Count Pokemon in same rarity (in this version)
-                same_rarity_pokemon = [p for p in available_pokemon if p.rarity == pokemon.rarity]
-                total_rarity_pokemon_weight = sum(p.get_weight_for_version(version) 
-                                                 for p in same_rarity_pokemon)
-                
-                if total_rarity_pokemon_weight == 0:
-                    continue
-                
-                # Probability within rarity
-                within_rarity_prob = pokemon.get_weight_for_version(version) / total_rarity_pokemon_weight
-                
-                # Combined probability (as percentage)
-                drop_rate_percent = (rarity_prob * within_rarity_prob) * 100
-                
-                rates.append((pokemon, drop_rate_percent))
-            
-            # Sort by drop rate descending (rarest first for visual appeal)
-            rates.sort(key=lambda x: x[1])
-            
-            print(f"Calculated {len(rates)} drop rates for {version}")
-            return rates
-            
-        except Exception as e:
-            print(f"Error calculating drop rates: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
-    
     def close(self):
         """Close the popup"""
         self.showing = False
@@ -48,12 +48,10 @@ class ItemTile:
         pygame.draw.rect(surface, rarity_color, self.rect, border_width)
         
         # Draw item icon
-        icon = self.resource_manager.get_item_icon(self.item.number)
-        if icon:
-            # Scale icon to fit nicely (leave space for name)
-            icon_size = min(self.rect.width - 40, self.rect.height - 80)
-            scaled_icon = pygame.transform.scale(icon, (icon_size, icon_size))
-            
+        # Scale icon to fit nicely (leave space for name)
+        icon_size = min(self.rect.width - 40, self.rect.height - 80)
+        scaled_icon = self.resource_manager.load_scaled_image(self.item.get_icon_path(), (icon_size, icon_size))
+        if scaled_icon:
             icon_x = self.rect.centerx - icon_size // 2
             icon_y = self.rect.top + 20
             surface.blit(scaled_icon, (icon_x, icon_y))
@@ -4,16 +4,16 @@ Items Info Popup - Shows all possible items and their drop rates
 import pygame
 from config import COLOR_WHITE, COLOR_BLACK, SCREEN_WIDTH, SCREEN_HEIGHT, IS_WEB
 from ui.button import Button
-from typing import Optional, List, Dict
-from logic.items_gacha import calculate_item_drop_rate, calculate_expected_value
+from typing import Optional
+from logic.probability_table import ITEMS_VERSION
+from logic.items_gacha import calculate_expected_value
 
 
 class ItemsInfoPopup:
     """Popup displaying all item drop rates for the Items gacha"""
     
     def __init__(self, x: int, y: int, width: int, height: int,
-                 items_list: List,
-                 rarities_dict: Dict,
+                 probability_table,
                  font_manager,
                  callback: Optional[callable] = None,
                  audio_manager = None):
@@ -23,8 +23,7 @@ class ItemsInfoPopup:
         Args:
             x, y: Center position
             width, height: Popup dimensions
-            items_list: List of all Item objects
-            rarities_dict: Dictionary of rarity data
+            probability_table: Shared ProbabilityTable
             font_manager: FontManager instance
             callback: Optional callback when closed
             audio_manager: AudioManager instance for click sounds (optional)
@@ -35,9 +34,9 @@ class ItemsInfoPopup:
         self.showing = True
         self.audio_manager = audio_manager
         
-        # Calculate drop rates and expected value
-        self.drop_rates = self._calculate_drop_rates(items_list, rarities_dict)
-        self.expected_value = calculate_expected_value(items_list, rarities_dict)
+        # Drop rates come precomputed (rarest first)
+        self.drop_rates = probability_table.drop_rates(ITEMS_VERSION)
+        self.expected_value = calculate_expected_value(probability_table)
         
         # Scroll state
         self.scroll_offset = 0
@@ -70,24 +69,6 @@ class ItemsInfoPopup:
             audio_manager=audio_manager
         )
     
-    def _calculate_drop_rates(self, items_list: List, rarities_dict: Dict) -> List[tuple]:
-        """
-        Calculate drop rate for each item
-        
-        Returns:
-            List of (item, drop_rate_percent) tuples, sorted by drop rate ascending
-        """
-        rates = []
-        
-        for item in items_list:
-            drop_rate = calculate_item_drop_rate(item, items_list, rarities_dict)
-            rates.append((item, drop_rate))
-        
-        # Sort by drop rate ascending (rarest first for visual appeal)
-        rates.sort(key=lambda x: x[1])
-        
-        return rates
-    
     def close(self):
         """Close the popup"""
         self.showing = False
@@ -115,10 +115,9 @@ class PokemonDetailsPopup:
         col2_width = self.popup_width - col1_width - padding * 2 - 40
         
         # Draw Pokemon image (column 1, top)
-        image = self.resource_manager.images.get(self.pokemon.image_path)
-        if image:
-            img_size = 150
-            scaled_image = pygame.transform.scale(image, (img_size, img_size))
+        img_size = 150
+        scaled_image = self.resource_manager.get_scaled_image(self.pokemon.image_path, (img_size, img_size))
+        if scaled_image:
             img_x = col1_x + (col1_width - img_size) // 2
             surface.blit(scaled_image, (img_x, content_y))
         
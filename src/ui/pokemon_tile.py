@@ -35,37 +35,67 @@ class PokemonTile:
         
         # Get rarity object for colors
         self.rarity_obj = resource_manager.rarities_dict.get(pokemon.rarity)
+        
+        # Contents drawn once and reused until what they show changes
+        self._surface: Optional[pygame.Surface] = None
+        self._surface_key: Optional[tuple] = None
     
     def render(self, surface: pygame.Surface):
-        """Render the Pokemon tile"""
+        """Render the Pokemon tile (redrawn only when its contents change)"""
+        # Looked up each frame so a reloaded rarity color is picked up
+        rarity_obj = self.resource_manager.rarities_dict.get(self.pokemon.rarity)
+        key = self._content_key(rarity_obj)
+        if self._surface is None or key != self._surface_key:
+            self._surface = pygame.Surface(self.rect.size).convert()
+            self._draw(self._surface, self._surface.get_rect(), rarity_obj)
+            self._surface_key = key
+        surface.blit(self._surface, self.rect.topleft)
+    
+    def invalidate(self):
+        """Force the tile to be redrawn on the next render"""
+        self._surface = None
+    
+    def _content_key(self, rarity_obj) -> tuple:
+        """Everything that can change what the cached surface shows"""
+        color = rarity_obj.color_hex if rarity_obj else None
+        has_image = self.pokemon.image_path in self.resource_manager.images
+        return (self.count, self.show_count, self.show_new_badge, color, self.rect.size, has_image)
+    
+    def _draw(self, surface: pygame.Surface, rect: pygame.Rect, rarity_obj):
+        """
+        Draw the tile contents
+        
+        Args:
+            surface: Surface to draw on
+            rect: Area of surface the tile covers
+            rarity_obj: Current Rarity of the Pokemon (None if unknown)
+        """
         # Draw background
         bg_color = (40, 40, 50)
-        pygame.draw.rect(surface, bg_color, self.rect)
+        pygame.draw.rect(surface, bg_color, rect)
         
         # Draw rarity border
-        if self.rarity_obj:
-            border_color = self.rarity_obj.get_color_rgb()
-            pygame.draw.rect(surface, border_color, self.rect, 3)
-        
-        # Draw Pokemon image
-        image = self.resource_manager.images.get(self.pokemon.image_path)
-        if image:
-            # Scale to fit (leave room for text)
-            img_size = min(self.rect.width - 20, self.rect.height - 60)
-            scaled_image = pygame.transform.scale(image, (img_size, img_size))
-            img_x = self.rect.x + (self.rect.width - img_size) // 2
-            img_y = self.rect.y + 10
+        if rarity_obj:
+            border_color = rarity_obj.get_color_rgb()
+            pygame.draw.rect(surface, border_color, rect, 3)
+        
+        # Draw Pokemon image, scaled to fit (leave room for text)
+        img_size = min(rect.width - 20, rect.height - 60)
+        scaled_image = self.resource_manager.get_scaled_image(self.pokemon.image_path, (img_size, img_size))
+        if scaled_image:
+            img_x = rect.x + (rect.width - img_size) // 2
+            img_y = rect.y + 10
             surface.blit(scaled_image, (img_x, img_y))
         
         # Draw Pokemon name (with padding above)
-        name_y = self.rect.y + self.rect.height - 40
+        name_y = rect.y + rect.height - 40
         if self.font_manager:
             # Use smaller font and truncate name to fit tile width
             font_size = 12
             name = self.pokemon.name
             
             # Check if name fits, truncate if needed
-            max_width = self.rect.width - 10  # 5px padding on each side
+            max_width = rect.width - 10  # 5px padding on each side
             while len(name) > 0:
                 text_width, _ = self.font_manager.get_text_size(name, font_size)
                 if text_width <= max_width:
@@ -73,35 +103,35 @@ class PokemonTile:
                 name = name[:-1]
             
             name_surface = self.font_manager.render_text(name, font_size, (255, 255, 255))
-            name_rect = name_surface.get_rect(center=(self.rect.centerx, name_y))
+            name_rect = name_surface.get_rect(center=(rect.centerx, name_y))
             surface.blit(name_surface, name_rect)
         
         # Draw types
-        self._render_types(surface)
+        self._render_types(surface, rect)
         
         # Draw "NEW!" badge if applicable
         if self.show_new_badge:
-            self._render_new_badge(surface)
+            self._render_new_badge(surface, rect)
         
         # Draw count if applicable
         if self.show_count and self.count > 0:
-            self._render_count(surface)
+            self._render_count(surface, rect)
     
-    def _render_types(self, surface: pygame.Surface):
+    def _render_types(self, surface: pygame.Surface, rect: pygame.Rect):
         """Render Pokemon type icons/text"""
         types = [self.pokemon.type1]
         if self.pokemon.has_dual_type():
             types.append(self.pokemon.type2)
         
-        type_y = self.rect.y + self.rect.height - 25
+        type_y = rect.y + rect.height - 25
         
         if len(types) == 1:
             # Single type - centered
-            self._render_single_type(surface, types[0], self.rect.centerx, type_y)
+            self._render_single_type(surface, types[0], rect.centerx, type_y)
         else:
             # Dual type - side by side
             spacing = 35
-            start_x = self.rect.centerx - spacing // 2
+            start_x = rect.centerx - spacing // 2
             self._render_single_type(surface, types[0], start_x, type_y)
             self._render_single_type(surface, types[1], start_x + spacing, type_y)
     
@@ -111,16 +141,14 @@ class PokemonTile:
         if not type_obj:
             return
         
-        # Get type icon
-        icon = self.resource_manager.images.get(type_obj.image_path)
-        if icon:
-            # Scale icon
-            icon_size = 20
-            scaled_icon = pygame.transform.scale(icon, (icon_size, icon_size))
+        # Get type icon (scaled)
+        icon_size = 20
+        scaled_icon = self.resource_manager.get_scaled_image(type_obj.image_path, (icon_size, icon_size))
+        if scaled_icon:
             icon_rect = scaled_icon.get_rect(center=(x, y))
             surface.blit(scaled_icon, icon_rect)
     
-    def _render_new_badge(self, surface: pygame.Surface):
+    def _render_new_badge(self, surface: pygame.Surface, rect: pygame.Rect):
         """Render "NEW!" badge in top-right corner"""
         if not self.font_manager:
             return
@@ -133,8 +161,8 @@ class PokemonTile:
         # Background rectangle
         padding = 3
         bg_rect = pygame.Rect(
-            self.rect.right - text_surface.get_width() - padding * 2 - 5,
-            self.rect.top + 5,
+            rect.right - text_surface.get_width() - padding * 2 - 5,
+            rect.top + 5,
             text_surface.get_width() + padding * 2,
             text_surface.get_height() + padding * 2
         )
@@ -146,7 +174,7 @@ class PokemonTile:
         text_y = bg_rect.y + padding
         surface.blit(text_surface, (text_x, text_y))
     
-    def _render_count(self, surface: pygame.Surface):
+    def _render_count(self, surface: pygame.Surface, rect: pygame.Rect):
         """Render owned count in top-left corner"""
         if not self.font_manager or self.count <= 0:
             return
@@ -157,8 +185,8 @@ class PokemonTile:
         # Background
         padding = 3
         bg_rect = pygame.Rect(
-            self.rect.left + 5,
-            self.rect.top + 5,
+            rect.left + 5,
+            rect.top + 5,
             text_surface.get_width() + padding * 2,
             text_surface.get_height() + padding * 2
         )
@@ -2,7 +2,7 @@
 Scrollable Grid UI Component for Pokemon tiles
 """
 import pygame
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from ui.pokemon_tile import PokemonTile
 
 
@@ -34,6 +34,11 @@ class ScrollableGrid:
         
         self.tiles: List[PokemonTile] = []
         self.pokemon_list = []
+        
+        # Unowned tiles baked once: the dashed frame shared by all of them,
+        # and each grayed tile by (Pokemon number, sprite path)
+        self._grayed_frame: Optional[pygame.Surface] = None
+        self._grayed_tiles: Dict[Tuple[str, str], pygame.Surface] = {}
     
     def set_pokemon_list(self, pokemon_list, resource_manager, font_manager, game_data):
         """
@@ -167,67 +172,88 @@ class ScrollableGrid:
     
     def _render_grayed_tile(self, surface: pygame.Surface, tile: PokemonTile):
         """
-        Render a grayed-out tile for unowned Pokemon
+        Render a grayed-out tile for unowned Pokemon (baked on first use)
         
         Args:
             surface: Surface to draw on
             tile: PokemonTile to render
         """
-        # Create a temporary surface for the tile
-        temp_surface = pygame.Surface((tile.rect.width, tile.rect.height), pygame.SRCALPHA)
+        baked = self._grayed_tiles.get((tile.pokemon.number, tile.pokemon.image_path))
+        if baked is None:
+            baked = self._bake_grayed_tile(tile)
+        surface.blit(baked, tile.rect.topleft)
+    
+    def _get_grayed_frame(self) -> pygame.Surface:
+        """Background and dashed border shared by every unowned tile"""
+        if self._grayed_frame is not None:
+            return self._grayed_frame
         
-        # Render tile normally to temp surface
-        temp_surface.fill((0, 0, 0, 0))  # Clear with transparency
+        width, height = self.tile_width, self.tile_height
+        frame = pygame.Surface((width, height), pygame.SRCALPHA)
         
         # Draw background
         bg_color = (30, 30, 40)
-        pygame.draw.rect(temp_surface, bg_color, pygame.Rect(0, 0, tile.rect.width, tile.rect.height))
+        pygame.draw.rect(frame, bg_color, pygame.Rect(0, 0, width, height))
         
         # Draw dashed border (unowned)
         border_color = (100, 100, 100)
-        rect = pygame.Rect(0, 0, tile.rect.width, tile.rect.height)
         
         # Top and bottom
-        for x in range(0, tile.rect.width, 10):
-            pygame.draw.line(temp_surface, border_color, (x, 0), (min(x + 5, tile.rect.width), 0), 2)
-            pygame.draw.line(temp_surface, border_color, (x, tile.rect.height - 1), (min(x + 5, tile.rect.width), tile.rect.height - 1), 2)
+        for x in range(0, width, 10):
+            pygame.draw.line(frame, border_color, (x, 0), (min(x + 5, width), 0), 2)
+            pygame.draw.line(frame, border_color, (x, height - 1), (min(x + 5, width), height - 1), 2)
         
         # Left and right
-        for y in range(0, tile.rect.height, 10):
-            pygame.draw.line(temp_surface, border_color, (0, y), (0, min(y + 5, tile.rect.height)), 2)
-            pygame.draw.line(temp_surface, border_color, (tile.rect.width - 1, y), (tile.rect.width - 1, min(y + 5, tile.rect.height)), 2)
+        for y in range(0, height, 10):
+            pygame.draw.line(frame, border_color, (0, y), (0, min(y + 5, height)), 2)
+            pygame.draw.line(frame, border_color, (width - 1, y), (width - 1, min(y + 5, height)), 2)
         
-        # Draw Pokemon image (grayed)
-        image = tile.resource_manager.images.get(tile.pokemon.image_path)
-        if image:
-            img_size = min(tile.rect.width - 20, tile.rect.height - 60)
-            scaled_image = pygame.transform.scale(image, (img_size, img_size))
+        self._grayed_frame = frame
+        return frame
+    
+    def _bake_grayed_tile(self, tile: PokemonTile) -> pygame.Surface:
+        """
+        Draw an unowned tile once and cache it
+        
+        Args:
+            tile: PokemonTile to bake
             
+        Returns:
+            Tile-sized surface (only cached once the sprite is loaded)
+        """
+        baked = self._get_grayed_frame().copy()
+        width, height = baked.get_size()
+        
+        # Draw Pokemon image (grayed)
+        img_size = min(width - 20, height - 60)
+        scaled_image = tile.resource_manager.get_scaled_image(tile.pokemon.image_path, (img_size, img_size))
+        if scaled_image:
             # Make it gray
             gray_image = scaled_image.copy()
             gray_image.set_alpha(80)  # 30% opacity
             
-            img_x = (tile.rect.width - img_size) // 2
+            img_x = (width - img_size) // 2
             img_y = 10
-            temp_surface.blit(gray_image, (img_x, img_y))
+            baked.blit(gray_image, (img_x, img_y))
         
         # Draw "???" instead of name
-        name_y = tile.rect.height - 45
+        name_y = height - 45
         if tile.font_manager:
             name_surface = tile.font_manager.render_text("???", 12, (120, 120, 120))
-            name_rect = name_surface.get_rect(center=(tile.rect.width // 2, name_y))
-            temp_surface.blit(name_surface, name_rect)
+            name_rect = name_surface.get_rect(center=(width // 2, name_y))
+            baked.blit(name_surface, name_rect)
         
         # Draw Pokédex number
-        number_y = tile.rect.height - 25
+        number_y = height - 25
         if tile.font_manager:
             number_text = f"#{tile.pokemon.number}"
             number_surface = tile.font_manager.render_text(number_text, 12, (100, 100, 100))
-            number_rect = number_surface.get_rect(center=(tile.rect.width // 2, number_y))
-            temp_surface.blit(number_surface, number_rect)
+            number_rect = number_surface.get_rect(center=(width // 2, number_y))
+            baked.blit(number_surface, number_rect)
         
-        # Blit temp surface to main surface
-        surface.blit(temp_surface, tile.rect.topleft)
+        if scaled_image:
+            self._grayed_tiles[(tile.pokemon.number, tile.pokemon.image_path)] = baked
+        return baked
     
     def get_scroll_percentage(self) -> float:
         """Get current scroll position as percentage (0.0 to 1.0)"""
@@ -29,11 +29,11 @@ class StatsPopup:
             width, height: Popup dimensions
             total_pulls: Total pulls across all versions
             red_pulls: Pulls from Red machine
-            red_expected: Expected pulls to get rarest remaining Red Pokemon
+            red_expected: Expected pulls to complete the remaining Red Pokemon
             blue_pulls: Pulls from Blue machine
-            blue_expected: Expected pulls to get rarest remaining Blue Pokemon
+            blue_expected: Expected pulls to complete the remaining Blue Pokemon
             yellow_pulls: Pulls from Yellow machine
-            yellow_expected: Expected pulls to get rarest remaining Yellow Pokemon
+            yellow_expected: Expected pulls to complete the remaining Yellow Pokemon
             total_expected_from_scratch: Total expected pulls from scratch (sum)
             optimal_cost: Expected Pokédollar cost using optimal strategy
             font_manager: FontManager instance
@@ -175,7 +175,7 @@ class StatsPopup:
         y_offset += 20
         
         # Section: Expected Remaining Pulls
-        self._render_line(surface, "Expected Pulls (Rarest Pokemon):", y_offset, 20, (255, 255, 100))
+        self._render_line(surface, "Expected Pulls to Complete:", y_offset, 20, (255, 255, 100))
         y_offset += line_height
         
         self._render_line(surface, f"  Red:    ~{int(self.red_expected):,} pulls", y_offset, 18, COLOR_WHITE)
@@ -224,7 +224,7 @@ class StatsPopup:
         
         y_offset += line_height - 5
         
-        self._render_line(surface, "(Yellow first then Red/Blue for exclusives)", 
+        self._render_line(surface, "(Cheapest machine at every step, using 10-pulls)", 
                          y_offset, 13, (180, 180, 180))
         
         # Close button
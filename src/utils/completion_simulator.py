@@ -0,0 +1,508 @@
+"""
+Monte Carlo collection-completion simulator
+
+Runs many independent virtual players and reports the distribution of
+pulls and Pokédollars they needed. There are two modes:
+
+- One machine (--version Red, Blue, Yellow or Items): every player keeps
+  pulling from that machine until they own everything it can drop. This
+  is the cost of one machine's pool, not the full Pokedex, since each
+  version machine only drops the Pokemon with a weight for that version.
+- Pokedex (--version Pokedex): every player picks a machine for each
+  purchase and stops once they own every Pokemon any machine can drop.
+  The "planner" policy follows PullPlanner's recommendation from the
+  player's current collection; "rotate" cycles Red, Blue, Yellow. The
+  planner re-plans as the collection grows, so it runs far slower than
+  rotate (use fewer players).
+
+Usage (from src/):
+    python -m utils.completion_simulator --version Red --players 100000
+    python -m utils.completion_simulator --version Pokedex --policy planner --players 10000
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+from data.pokemon_catalog import number_column, version_weights
+from logic.alias_table import is_numpy_generator, np
+from logic.gacha_logic import GachaSystem
+from logic.items_gacha import ItemsGachaSystem
+from logic.probability_table import ProbabilityTable, POKEMON_VERSIONS
+from logic.rng import make_rng
+from utils.pull_planner import PullPlanner
+
+
+# Pseudo-version that completes the whole Pokedex across the machines
+POKEDEX = "Pokedex"
+
+# Machine choice policies for Pokedex mode
+POLICIES = ("planner", "rotate")
+
+# Draws taken from a machine at a time in Pokedex mode. Draws from one
+# machine are independent, so buffering them does not change the result
+_DRAW_BUFFER = 1024
+
+# Planner decisions remembered per worker before the memo is flushed
+_MAX_DECISIONS = 100000
+
+# Per-process simulation context, set up once by _init_worker
+_WORKER_CONTEXT = None
+
+
+class CompletionStats:
+    """Distribution of pulls (and cost) needed to complete a machine's pool or the Pokedex"""
+    
+    def __init__(self, version: str, histogram: Dict[int, int],
+                 cost_single: Optional[int], cost_10pull: Optional[int], ten_pull: bool,
+                 cost_histogram: Optional[Dict[int, int]] = None, policy: Optional[str] = None):
+        """
+        Initialize completion stats
+        
+        Args:
+            version: Machine that was simulated ("Red", "Blue", "Yellow",
+                     "Items"), or "Pokedex"
+            histogram: Pulls-to-complete -> number of players
+            cost_single: Machine single pull cost (None for the Pokedex)
+            cost_10pull: Machine 10-pull cost (None for the Pokedex)
+            ten_pull: Whether players buy 10-pulls (True) or single pulls
+            cost_histogram: Pokédollars-to-complete -> number of players
+                            (default: priced from histogram with the machine costs)
+            policy: Machine choice policy used for the Pokedex
+        """
+        self.version = version
+        self.histogram = histogram
+        self.cost_single = cost_single
+        self.cost_10pull = cost_10pull
+        self.ten_pull = ten_pull
+        self.policy = policy
+        self.players = sum(histogram.values())
+        self._sorted_pulls = sorted(histogram)
+        
+        if cost_histogram is None:
+            cost_histogram = {}
+            for pulls, count in histogram.items():
+                cost = self.cost_for_pulls(pulls)
+                cost_histogram[cost] = cost_histogram.get(cost, 0) + count
+        self.cost_histogram = cost_histogram
+        self._sorted_costs = sorted(cost_histogram)
+    
+    def cost_for_pulls(self, pulls: int) -> int:
+        """Pokédollars spent to make at least this many pulls (one machine only)"""
+        if self.ten_pull:
+            return -(-pulls // 10) * self.cost_10pull
+        return pulls * self.cost_single
+    
+    def mean_pulls(self) -> float:
+        """Average pulls to complete"""
+        if self.players == 0:
+            return 0.0
+        return sum(pulls * count for pulls, count in self.histogram.items()) / self.players
+    
+    def mean_cost(self) -> float:
+        """Average Pokédollars to complete"""
+        if self.players == 0:
+            return 0.0
+        return sum(cost * count for cost, count in self.cost_histogram.items()) / self.players
+    
+    def percentile_pulls(self, percent: float) -> int:
+        """
+        Pulls needed by the given share of players
+        
+        Args:
+            percent: Percentile (0-100)
+            
+        Returns:
+            Smallest pull count reached by at least percent% of players
+        """
+        return self._percentile(self.histogram, self._sorted_pulls, percent)
+    
+    def percentile_cost(self, percent: float) -> int:
+        """Pokédollars needed by the given share of players"""
+        return self._percentile(self.cost_histogram, self._sorted_costs, percent)
+    
+    def _percentile(self, histogram: Dict[int, int], sorted_values: List[int], percent: float) -> int:
+        """Smallest value reached by at least percent% of players"""
+        if self.players == 0:
+            return 0
+        
+        target = self.players * percent / 100.0
+        cumulative = 0
+        for value in sorted_values:
+            cumulative += histogram[value]
+            if cumulative >= target:
+                return value
+        return sorted_values[-1]
+    
+    def summary(self) -> dict:
+        """Summary as a plain dict (mean, p50, p90, p99 for pulls and cost)"""
+        return {
+            "version": self.version,
+            "policy": self.policy,
+            "players": self.players,
+            "ten_pull": self.ten_pull,
+            "pulls": {
+                "mean": self.mean_pulls(),
+                "p50": self.percentile_pulls(50),
+                "p90": self.percentile_pulls(90),
+                "p99": self.percentile_pulls(99),
+            },
+            "cost": {
+                "mean": self.mean_cost(),
+                "p50": self.percentile_cost(50),
+                "p90": self.percentile_cost(90),
+                "p99": self.percentile_cost(99),
+            },
+        }
+
+
+def _init_worker(pokemon_list: List, rarities_dict: Dict, items_list: List, version: str,
+                 gacha_machines: Dict, policy: str, ten_pull: bool):
+    """Build the sampler and target pool once per worker process"""
+    global _WORKER_CONTEXT
+    
+    if version == POKEDEX:
+        _WORKER_CONTEXT = _pokedex_context(pokemon_list, rarities_dict, gacha_machines, policy, ten_pull)
+        return
+    
+    if version == "Items":
+        items_gacha_system = ItemsGachaSystem(items_list, rarities_dict)
+        target = [i for i, item in enumerate(items_list) if item.weight > 0]
+        pool_size = len(items_list)
+        
+        def draw(n, rng):
+            return items_gacha_system.roll_many(n, rng)[1]
+    else:
+        gacha_system = GachaSystem(pokemon_list, rarities_dict)
+        target = [i for i, weight in enumerate(version_weights(pokemon_list, version)) if weight > 0]
+        pool_size = len(pokemon_list)
+        
+        def draw(n, rng):
+            return gacha_system.roll_many(version, n, rng)[1]
+    
+    _WORKER_CONTEXT = (draw, pool_size, target)
+
+
+def _pokedex_context(pokemon_list: List, rarities_dict: Dict, gacha_machines: Dict,
+                     policy: str, ten_pull: bool) -> tuple:
+    """
+    Build the samplers and machine choice for Pokedex mode
+    
+    Returns:
+        Tuple of (draw, choose, purchase_costs, target, pull_size)
+    """
+    table = ProbabilityTable(pokemon_list, rarities_dict)
+    gacha_system = GachaSystem(pokemon_list, rarities_dict, probability_table=table)
+    machines = [machine for machine in POKEMON_VERSIONS if machine in gacha_machines]
+    rows = [table.version_probabilities(machine) for machine in machines]
+    numbers = number_column(pokemon_list)
+    
+    target = [i for i, number in enumerate(numbers) if any(number in row for row in rows)]
+    contested = frozenset(i for i in target if not all(numbers[i] in row for row in rows))
+    
+    # Pokemon with the same drop chance on every machine are interchangeable
+    # for the planner, so decisions are keyed by missing count per class
+    vectors = {i: tuple(row.get(numbers[i], 0.0) for row in rows) for i in target}
+    class_ids = {vector: class_id for class_id, vector in enumerate(sorted(set(vectors.values())))}
+    pokemon_class = {i: class_ids[vectors[i]] for i in target}
+    pull_size = 10 if ten_pull else 1
+    purchase_costs = {machine: (gacha_machines[machine].cost_10pull if ten_pull
+                                else gacha_machines[machine].cost_single)
+                      for machine in machines}
+    
+    def draw(machine, n, rng):
+        return gacha_system.roll_many(machine, n, rng)[1].tolist()
+    
+    if policy == "rotate":
+        def choose(missing, turn):
+            return machines[turn % len(machines)]
+    else:
+        planner = PullPlanner(table, gacha_machines)
+        decisions: Dict[tuple, str] = {}
+        
+        def choose(missing, turn):
+            # While contested Pokemon are missing, the planner's choice only
+            # depends on which of them are (see PullPlanner)
+            counts = [0] * len(class_ids)
+            for i in (missing & contested or missing):
+                counts[pokemon_class[i]] += 1
+            key = tuple(counts)
+            machine = decisions.get(key)
+            if machine is None:
+                owned = {numbers[i]: 1 for i in target if i not in missing}
+                machine = planner.plan(owned).machine
+                if len(decisions) >= _MAX_DECISIONS:
+                    decisions.clear()
+                decisions[key] = machine
+            return machine
+    
+    return draw, choose, purchase_costs, target, pull_size
+
+
+def _chunk_pulls_numpy(draw, pool_size: int, target: List[int], players: int, rng):
+    """
+    Simulate a group of players at once, each pulling until every index in
+    target has been seen. Players still incomplete after a round get another,
+    twice as long, round of draws.
+    
+    Returns:
+        NumPy array with the pulls each player needed
+    """
+    missing = np.zeros((players, pool_size), dtype=bool)
+    missing[:, target] = True
+    remaining = np.full(players, len(target), dtype=np.int64)
+    result = np.zeros(players, dtype=np.int64)
+    active = np.arange(players)
+    offset = 0
+    length = max(64, len(target) * 8)
+    
+    while active.size:
+        batch = np.asarray(draw(active.size * length, rng), dtype=np.int64).reshape(active.size, length)
+        
+        # First position of every value for every player in this round
+        keys = (np.arange(active.size, dtype=np.int64)[:, None] * pool_size + batch).ravel()
+        first_seen = np.full(active.size * pool_size, length, dtype=np.int64)
+        np.minimum.at(first_seen, keys, np.tile(np.arange(length, dtype=np.int64), active.size))
+        first_seen = first_seen.reshape(active.size, pool_size)
+        
+        is_new = missing[active] & (first_seen < length)
+        new_counts = np.count_nonzero(is_new, axis=1)
+        last_new = np.where(is_new, first_seen, -1).max(axis=1)
+        
+        done = new_counts == remaining[active]
+        result[active[done]] = offset + last_new[done] + 1
+        
+        missing[active] &= ~is_new
+        remaining[active] -= new_counts
+        active = active[~done]
+        offset += length
+        length *= 2
+    
+    return result
+
+
+def _player_pulls_stdlib(draw, target: List[int], rng) -> int:
+    """
+    Simulate one player pulling until every index in target has been seen
+    
+    Returns:
+        Number of pulls it took
+    """
+    missing = set(target)
+    pulls = 0
+    batch_size = max(64, len(target) * 8)
+    
+    while missing:
+        for index in draw(batch_size, rng):
+            pulls += 1
+            if index in missing:
+                missing.discard(index)
+                if not missing:
+                    break
+        batch_size *= 2
+    
+    return pulls
+
+
+def _pokedex_player(rng) -> Tuple[int, int]:
+    """
+    Simulate one player completing the Pokedex, choosing a machine for
+    every purchase
+    
+    Returns:
+        Tuple of (pulls until the last missing Pokemon, Pokédollars spent)
+    """
+    draw, choose, purchase_costs, target, pull_size = _WORKER_CONTEXT
+    missing = set(target)
+    buffers: Dict[str, List[int]] = {machine: [] for machine in purchase_costs}
+    pulls = 0
+    cost = 0
+    turn = 0
+    
+    while missing:
+        machine = choose(missing, turn)
+        turn += 1
+        cost += purchase_costs[machine]
+        buffer = buffers[machine]
+        for _ in range(pull_size):
+            if not buffer:
+                buffer.extend(draw(machine, _DRAW_BUFFER, rng))
+            pulls += 1
+            missing.discard(buffer.pop())
+            if not missing:
+                break
+    
+    return pulls, cost
+
+
+def _simulate_pokedex_chunk(entropy: int, chunk_index: int, player_count: int) -> Dict[Tuple[int, int], int]:
+    """
+    Simulate one chunk of Pokedex players (streams as in _simulate_chunk)
+    
+    Returns:
+        Partial histogram of (pulls, Pokédollars) to complete
+    """
+    rng = make_rng((entropy, (chunk_index,)))
+    histogram: Dict[Tuple[int, int], int] = {}
+    for _ in range(player_count):
+        outcome = _pokedex_player(rng)
+        histogram[outcome] = histogram.get(outcome, 0) + 1
+    return histogram
+
+
+def _simulate_chunk(entropy: int, chunk_index: int, player_count: int) -> Dict[int, int]:
+    """
+    Simulate one chunk of players in the current process
+    
+    Each chunk draws from its own stream (entropy, (chunk_index,)), so the
+    merged histogram only depends on the seed and chunk size, not on how
+    many workers ran the chunks or in which order they finished.
+    
+    Returns:
+        Partial histogram of pulls-to-complete
+    """
+    draw, pool_size, target = _WORKER_CONTEXT
+    rng = make_rng((entropy, (chunk_index,)))
+    histogram: Dict[int, int] = {}
+    
+    if not target:
+        return {0: player_count}
+    
+    if is_numpy_generator(rng):
+        pulls_per_player = _chunk_pulls_numpy(draw, pool_size, target, player_count, rng)
+        values, counts = np.unique(pulls_per_player, return_counts=True)
+        return {int(pulls): int(count) for pulls, count in zip(values, counts)}
+    
+    for _ in range(player_count):
+        pulls = _player_pulls_stdlib(draw, target, rng)
+        histogram[pulls] = histogram.get(pulls, 0) + 1
+    
+    return histogram
+
+
+def _merge_histogram(total: Dict, partial: Dict):
+    """Add a partial histogram into the running total"""
+    for pulls, count in partial.items():
+        total[pulls] = total.get(pulls, 0) + count
+
+
+def simulate_completion(pokemon_list: List, rarities_dict: Dict, items_list: List,
+                        gacha_machines: Dict, version: str, players: int,
+                        seed: int = 0, ten_pull: bool = True,
+                        workers: Optional[int] = None,
+                        chunk_size: int = 1000, policy: str = "planner") -> CompletionStats:
+    """
+    Run the completion simulation, fanning out over a process pool
+    
+    Args:
+        pokemon_list: List of all Pokemon
+        rarities_dict: Dictionary of rarity data
+        items_list: List of all Item objects
+        gacha_machines: Dict of gacha machine data (for costs)
+        version: "Red", "Blue", "Yellow", "Items", or "Pokedex"
+        players: Number of virtual players
+        seed: Root seed; the same seed and chunk_size give the same histogram
+              for any worker count
+        ten_pull: Price pulls as 10-pulls (True) or single pulls
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+        chunk_size: Players per task
+        policy: Machine choice for the Pokedex ("planner" or "rotate")
+        
+    Returns:
+        CompletionStats for the simulated players
+        
+    Raises:
+        ValueError: If policy is unknown
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy '{policy}' (expected one of {', '.join(POLICIES)})")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    simulate_chunk = _simulate_pokedex_chunk if version == POKEDEX else _simulate_chunk
+    chunks = [(index, min(chunk_size, players - start))
+              for index, start in enumerate(range(0, players, chunk_size))]
+    init_args = (pokemon_list, rarities_dict, items_list, version, gacha_machines, policy, ten_pull)
+    histogram: Dict = {}
+    
+    if workers <= 1:
+        _init_worker(*init_args)
+        for index, count in chunks:
+            _merge_histogram(histogram, simulate_chunk(seed, index, count))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=init_args) as executor:
+            futures = [executor.submit(simulate_chunk, seed, index, count) for index, count in chunks]
+            # Merge as chunks finish so memory stays flat regardless of player count
+            for future in as_completed(futures):
+                _merge_histogram(histogram, future.result())
+    
+    if version == POKEDEX:
+        pulls_histogram: Dict[int, int] = {}
+        cost_histogram: Dict[int, int] = {}
+        for (pulls, cost), count in histogram.items():
+            pulls_histogram[pulls] = pulls_histogram.get(pulls, 0) + count
+            cost_histogram[cost] = cost_histogram.get(cost, 0) + count
+        return CompletionStats(POKEDEX, pulls_histogram, None, None, ten_pull,
+                               cost_histogram=cost_histogram, policy=policy)
+    
+    machine = gacha_machines[version]
+    return CompletionStats(version, histogram, machine.cost_single, machine.cost_10pull, ten_pull)
+
+
+def main():
+    """Command line entry point"""
+    from config import POKEMON_CSV, RARITY_CSV, ITEMS_CSV, GACHA_MACHINES_CSV
+    from data.csv_loader import CSVLoader
+    
+    parser = argparse.ArgumentParser(
+        description="Simulate pulls needed to collect everything one gacha machine can drop, "
+                    "or the whole Pokedex across the machines")
+    parser.add_argument("--version", default="Red", choices=["Red", "Blue", "Yellow", "Items", POKEDEX],
+                        help="Machine whose pool is completed, or Pokedex for all of them")
+    parser.add_argument("--policy", default="planner", choices=POLICIES,
+                        help="Pokedex only: follow PullPlanner or rotate Red, Blue, Yellow")
+    parser.add_argument("--players", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--single", action="store_true", help="Price pulls as single pulls instead of 10-pulls")
+    args = parser.parse_args()
+    
+    pokemon_list = CSVLoader.load_pokemon(POKEMON_CSV)
+    items_list = CSVLoader.load_items(ITEMS_CSV)
+    if args.version == "Items":
+        pool = f"{sum(1 for item in items_list if item.weight > 0)} of {len(items_list)} items"
+    elif args.version == POKEDEX:
+        columns = [version_weights(pokemon_list, version) for version in POKEMON_VERSIONS]
+        pool = f"{sum(1 for weights in zip(*columns) if any(weights))} of {len(pokemon_list)} Pokemon"
+    else:
+        weights = version_weights(pokemon_list, args.version)
+        pool = f"{sum(1 for weight in weights if weight > 0)} of {len(pokemon_list)} Pokemon"
+    
+    stats = simulate_completion(
+        pokemon_list,
+        CSVLoader.load_rarities(RARITY_CSV),
+        items_list,
+        CSVLoader.load_gacha_machines(GACHA_MACHINES_CSV),
+        args.version,
+        args.players,
+        seed=args.seed,
+        ten_pull=not args.single,
+        workers=args.workers,
+        policy=args.policy
+    )
+    
+    summary = stats.summary()
+    if args.version == POKEDEX:
+        print(f"\nCompleting the Pokedex ({pool}) with the {summary['policy']} policy, "
+              f"{summary['players']:,} players")
+    else:
+        print(f"\nCompleting the {summary['version']} machine pool ({pool}), {summary['players']:,} players")
+    for label in ("pulls", "cost"):
+        values = summary[label]
+        print(f"  {label:<5} mean {values['mean']:>12,.1f}  p50 {values['p50']:>10,}  "
+              f"p90 {values['p90']:>10,}  p99 {values['p99']:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Exact expected draws for the unequal-probability coupon collector
+
+Uses the Poissonization identity: if draws arrive as a rate-1 Poisson
+process, coupon i shows up by time t with probability 1 - e^(-p_i t)
+independently of the others, so
+
+    E[T] = integral from 0 to inf of (1 - prod_i (1 - e^(-p_i t))) dt
+    
+and because the process has rate 1 this is also the expected number of
+discrete draws. The probabilities only need to cover the coupons still
+wanted; the remaining mass (duplicates, other drops) is implicit.
+"""
+import math
+from typing import Dict, List, Sequence, Tuple
+
+from logic.alias_table import np
+
+
+# Simpson intervals over log(t); the integrand is smooth in log(t) so this
+# is accurate to well under one draw for any realistic pool
+QUADRATURE_INTERVALS = 2048
+
+# Stop integrating once the integrand is below this
+TAIL_EPSILON = 1e-12
+
+
+def group_probabilities(probabilities: Sequence[float]) -> List[Tuple[float, int]]:
+    """
+    Collapse equal probabilities into (probability, multiplicity) pairs
+    
+    Args:
+        probabilities: Per-coupon draw probabilities (zeros are ignored)
+        
+    Returns:
+        List of (probability, count) pairs sorted by probability
+    """
+    groups: Dict[float, int] = {}
+    for p in probabilities:
+        if p > 0:
+            groups[p] = groups.get(p, 0) + 1
+    return sorted(groups.items())
+
+
+def expected_draws_to_complete(probabilities: Sequence[float]) -> float:
+    """
+    Expected number of draws until every coupon has been seen at least once
+    
+    Args:
+        probabilities: Draw probability of each wanted coupon, per draw.
+                       They may sum to less than 1 (other outcomes are
+                       simply wasted draws).
+                       
+    Returns:
+        Expected draws (0.0 if nothing is wanted)
+    """
+    return expected_draws_from_groups(group_probabilities(probabilities))
+
+
+def expected_draws_from_groups(groups: List[Tuple[float, int]]) -> float:
+    """
+    Same as expected_draws_to_complete, for already grouped probabilities
+    
+    Args:
+        groups: (probability, multiplicity) pairs with probability > 0
+        
+    Returns:
+        Expected draws (0.0 if groups is empty)
+    """
+    if len(groups) == 1 and groups[0][1] == 1:
+        return 1.0 / groups[0][0]
+    
+    return _integrate([(p, 0.0, multiplicity) for p, multiplicity in groups])
+
+
+def expected_draws_after_exposure(probabilities: Sequence[float], exposures: Sequence[float]) -> float:
+    """
+    Expected further draws to see every coupon, when each coupon has
+    already had some Poisson "exposure" (e.g. draws spent on other
+    machines) and is therefore already collected with probability 1 - e^-x
+    
+    Args:
+        probabilities: Draw probability of each wanted coupon, per draw
+        exposures: Exposure x of each coupon so far (sum of p * draws)
+        
+    Returns:
+        Expected further draws
+    """
+    groups: Dict[Tuple[float, float], int] = {}
+    for p, x in zip(probabilities, exposures):
+        if p > 0:
+            groups[(p, x)] = groups.get((p, x), 0) + 1
+    return _integrate([(p, x, multiplicity) for (p, x), multiplicity in sorted(groups.items())])
+
+
+def _integrate(groups: List[Tuple[float, float, int]]) -> float:
+    """
+    Integrate P(some coupon still missing at time t) over t >= 0
+    
+    Args:
+        groups: (probability, exposure, multiplicity) triples with probability > 0
+        
+    Returns:
+        Value of the integral
+    """
+    if not groups:
+        return 0.0
+    
+    p_min = min(p for p, _, _ in groups)
+    p_max = max(p for p, _, _ in groups)
+    coupons = sum(m for _, _, m in groups)
+    
+    # Below t_low the integrand is nearly flat; beyond t_high it is below TAIL_EPSILON
+    t_low = 1e-3 / p_max
+    t_high = math.log(coupons / TAIL_EPSILON) / p_min
+    
+    s_low = math.log(t_low)
+    step = (math.log(t_high) - s_low) / QUADRATURE_INTERVALS
+    
+    if np is not None:
+        total = _simpson_numpy(groups, s_low, step)
+    else:
+        total = _simpson_python(groups, s_low, step)
+    
+    head = t_low * (_integrand_python(groups, 0.0) + _integrand_python(groups, t_low)) / 2.0
+    return head + total
+
+
+def _simpson_numpy(groups: List[Tuple[float, float, int]], s_low: float, step: float) -> float:
+    """Composite Simpson's rule over s = log(t), all nodes at once"""
+    t = np.exp(s_low + step * np.arange(QUADRATURE_INTERVALS + 1))
+    
+    log_all_seen = np.zeros_like(t)
+    for p, exposure, multiplicity in groups:
+        x = exposure + p * t
+        # log(1 - e^-x), accurate for both small and large x
+        log_seen = np.where(x < math.log(2.0),
+                            np.log(-np.expm1(-np.minimum(x, math.log(2.0)))),
+                            np.log1p(-np.exp(-np.maximum(x, math.log(2.0)))))
+        log_all_seen += multiplicity * log_seen
+    
+    values = -np.expm1(log_all_seen) * t
+    weights = np.ones(QUADRATURE_INTERVALS + 1)
+    weights[1:-1:2] = 4.0
+    weights[2:-1:2] = 2.0
+    return float(np.dot(weights, values) * step / 3.0)
+
+
+def _simpson_python(groups: List[Tuple[float, float, int]], s_low: float, step: float) -> float:
+    """Composite Simpson's rule over s = log(t), without NumPy"""
+    total = 0.0
+    for i in range(QUADRATURE_INTERVALS + 1):
+        if i == 0 or i == QUADRATURE_INTERVALS:
+            weight = 1.0
+        elif i % 2:
+            weight = 4.0
+        else:
+            weight = 2.0
+        
+        t = math.exp(s_low + step * i)
+        total += weight * _integrand_python(groups, t) * t
+    
+    return total * step / 3.0
+
+
+def _integrand_python(groups: List[Tuple[float, float, int]], t: float) -> float:
+    """Probability that some coupon is still missing at Poisson time t"""
+    log_all_seen = 0.0
+    for p, exposure, multiplicity in groups:
+        x = exposure + p * t
+        if x <= 0:
+            # Nothing drawn yet, so this coupon is certainly missing
+            return 1.0
+        if x < math.log(2.0):
+            log_all_seen += multiplicity * math.log(-math.expm1(-x))
+        else:
+            log_all_seen += multiplicity * math.log1p(-math.exp(-x))
+    return -math.expm1(log_all_seen)
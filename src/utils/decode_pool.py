@@ -0,0 +1,99 @@
+"""
+Background image decoding for the loading screen
+
+Worker threads decode image files (the slow part of loading a sprite) and
+post the decoded surfaces to a queue; the main thread collects them each
+frame and does the display conversion. Loading then takes about as long
+as decoding every file once instead of a fixed number of frames per
+batch. With parallel=False (web builds, which have no threads) nothing
+runs in the background and each collect() call decodes one batch itself.
+"""
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, Tuple
+
+
+class DecodePool:
+    """Decodes queued paths on worker threads"""
+    
+    def __init__(self, decode: Callable[[str], object], parallel: bool = True,
+                 max_workers: Optional[int] = None):
+        """
+        Initialize pool (threads start with the first submit)
+        
+        Args:
+            decode: Thread-safe function path -> decoded image (or None)
+            parallel: Decode on worker threads (False decodes in collect())
+            max_workers: Thread pool size (None for the executor default)
+        """
+        self.decode = decode
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.pending = 0
+        self._results: "queue.Queue[Tuple[str, object]]" = queue.Queue()
+        self._waiting: List[str] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+    
+    def submit(self, paths: Sequence[str]):
+        """
+        Queue paths for decoding
+        
+        Args:
+            paths: Image paths
+        """
+        self.pending += len(paths)
+        if not self.parallel:
+            self._waiting.extend(paths)
+            return
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="decode")
+        for path in paths:
+            self._executor.submit(self._decode_one, path)
+    
+    def collect(self, batch_size: int) -> List[Tuple[str, object]]:
+        """
+        Take finished decodes without waiting (call once per frame)
+        
+        Args:
+            batch_size: Paths decoded per call when not parallel
+            
+        Returns:
+            List of (path, decoded image or None)
+        """
+        if not self.parallel:
+            batch, self._waiting = self._waiting[:batch_size], self._waiting[batch_size:]
+            done = [(path, self._decode(path)) for path in batch]
+        else:
+            done = []
+            while True:
+                try:
+                    done.append(self._results.get_nowait())
+                except queue.Empty:
+                    break
+        
+        self.pending -= len(done)
+        return done
+    
+    def close(self):
+        """Stop the workers (decodes not yet started are dropped)"""
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._waiting = []
+    
+    def _decode(self, path: str):
+        """Decode one path, reporting errors as a missing image"""
+        try:
+            return self.decode(path)
+        except Exception as e:
+            print(f"Error decoding image {path}: {e}")
+            return None
+    
+    def _decode_one(self, path: str):
+        """Worker: decode one path and post the result"""
+        if self._closed:
+            return
+        self._results.put((path, self._decode(path)))
@@ -0,0 +1,279 @@
+"""
+Approximate expected-cost-minimizing pull planner across the Pokemon machines
+
+Pokemon that every machine can drop are collected whichever machine is
+used, so the machine choice only matters for the "contested" ones that
+some machine cannot drop. The planner runs a dynamic program over the
+contested Pokemon, grouped by which machines drop them, and then prices
+the remaining all-machine Pokemon with the coupon-collector engine,
+crediting the draws the contested phase already made on each machine.
+
+The result is an estimate, not an exact optimum. The starting state is the
+player's real missing set, but later DP states only count how many
+Pokemon are missing per group and assume those are the group's rarest
+(the likeliest ones to be left), and the all-machine tail is priced
+separately from the contested phase. Tracking the exact missing set is
+out of reach: the Gen 1 exclusives alone form millions of states.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from logic.alias_table import np
+from logic.probability_table import POKEMON_VERSIONS
+from utils.coupon_collector import expected_draws_after_exposure
+
+
+# Average draws left unused when a 10-pull finishes the collection early
+TEN_PULL_OVERSHOOT = 4.5
+
+# Entries kept in ProbabilityTable.cache before it is flushed
+_MAX_CACHE_ENTRIES = 256
+
+
+class PullPlan:
+    """Recommended next pull and the estimated cost of finishing from here"""
+    
+    def __init__(self, machine: Optional[str], ten_pull: bool, estimated_cost: float,
+                 estimated_pulls: float, pulls_by_machine: Dict[str, float]):
+        """
+        Args:
+            machine: Machine to pull next (None if the collection is complete)
+            ten_pull: Whether a 10-pull is cheaper than single pulls from here
+            estimated_cost: Estimated Pokédollars to complete, following the plan
+            estimated_pulls: Estimated pulls to complete, following the plan
+            pulls_by_machine: Estimated pulls on each machine
+        """
+        self.machine = machine
+        self.ten_pull = ten_pull
+        self.estimated_cost = estimated_cost
+        self.estimated_pulls = estimated_pulls
+        self.pulls_by_machine = pulls_by_machine
+    
+    def __repr__(self):
+        return (f"PullPlan({self.machine}, ten_pull={self.ten_pull}, "
+                f"cost={self.estimated_cost:,.0f}, pulls={self.estimated_pulls:,.1f})")
+
+
+class PullPlanner:
+    """Plans which machine to pull to complete the Pokedex for the fewest Pokédollars (approximately)"""
+    
+    def __init__(self, probability_table, gacha_machines: Dict):
+        """
+        Initialize pull planner
+        
+        Args:
+            probability_table: Shared ProbabilityTable
+            gacha_machines: Dict of gacha machine data (for costs)
+        """
+        self.probability_table = probability_table
+        self.machines = [m for m in POKEMON_VERSIONS if m in gacha_machines]
+        
+        # Planning assumes 10-pulls; single pulls are only suggested near the end
+        self.cost_per_pull = [gacha_machines[m].cost_10pull / 10.0 for m in self.machines]
+        self.cost_single = [gacha_machines[m].cost_single for m in self.machines]
+    
+    def plan(self, owned_pokemon: Dict[str, int]) -> PullPlan:
+        """
+        Plan the next pull from the current collection (memoized per owned set)
+        
+        Args:
+            owned_pokemon: Dict of owned Pokemon {number: count}
+            
+        Returns:
+            PullPlan
+        """
+        table = self.probability_table
+        rows = {m: table.version_probabilities(m) for m in self.machines}
+        droppable = set()
+        for probabilities in rows.values():
+            droppable.update(probabilities)
+        
+        owned_fingerprint = frozenset(number for number in owned_pokemon if number in droppable)
+        cache_key = ("pull_plan", tuple(self.cost_per_pull), tuple(self.cost_single), owned_fingerprint)
+        cached = table.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        missing = [number for number in droppable if number not in owned_fingerprint]
+        plan = self._solve(missing, rows)
+        
+        if len(table.cache) >= _MAX_CACHE_ENTRIES:
+            table.cache.clear()
+        table.cache[cache_key] = plan
+        return plan
+    
+    def _solve(self, missing: List[str], rows: Dict[str, Dict[str, float]]) -> PullPlan:
+        """Run the contested-Pokemon DP and price the all-machine tail"""
+        machine_count = len(self.machines)
+        vectors = {number: tuple(rows[m].get(number, 0.0) for m in self.machines) for number in missing}
+        
+        # Group contested Pokemon by the set of machines that drop them
+        groups: Dict[Tuple[bool, ...], List[Tuple[float, ...]]] = {}
+        universal = []
+        for number in sorted(missing):
+            vector = vectors[number]
+            signature = tuple(p > 0 for p in vector)
+            if all(signature):
+                universal.append(vector)
+            else:
+                groups.setdefault(signature, []).append(vector)
+        
+        # Approximation: within a group the rarer Pokemon tend to be the ones
+        # left over, so with k missing the DP assumes they are the k rarest
+        # of the current ones
+        group_prefix = []
+        for members in groups.values():
+            members.sort(key=lambda vector: sum(vector))
+            prefix = [[0.0] for _ in range(machine_count)]
+            for vector in members:
+                for m in range(machine_count):
+                    prefix[m].append(prefix[m][-1] + vector[m])
+            group_prefix.append(prefix)
+        
+        value, draws, policy = self._contested_dp(group_prefix)
+        
+        # All-machine Pokemon: credit what the contested phase drew, then
+        # finish on whichever machine is cheapest for the rest
+        tail_cost = 0.0
+        tail_draws = 0.0
+        tail_machine = None
+        if universal:
+            exposures = [sum(vector[m] * draws[m] for m in range(machine_count)) for vector in universal]
+            for m in range(machine_count):
+                expected = expected_draws_after_exposure([vector[m] for vector in universal], exposures)
+                if tail_machine is None or expected * self.cost_per_pull[m] < tail_cost:
+                    tail_machine = m
+                    tail_cost = expected * self.cost_per_pull[m]
+                    tail_draws = expected
+        
+        pulls_by_machine = {machine: draws[m] for m, machine in enumerate(self.machines)}
+        if tail_machine is not None:
+            pulls_by_machine[self.machines[tail_machine]] += tail_draws
+        
+        next_machine = policy if policy is not None else tail_machine
+        if next_machine is None:
+            return PullPlan(None, False, 0.0, 0.0, pulls_by_machine)
+        
+        estimated_pulls = sum(draws) + tail_draws
+        ten_cost = self.cost_per_pull[next_machine] * (estimated_pulls + TEN_PULL_OVERSHOOT)
+        ten_pull = ten_cost <= self.cost_single[next_machine] * estimated_pulls
+        
+        return PullPlan(self.machines[next_machine], ten_pull, value + tail_cost,
+                        estimated_pulls, pulls_by_machine)
+    
+    def _contested_dp(self, group_prefix: List[List[List[float]]]):
+        """
+        Expected cost over states (missing count per group), solved bottom-up
+        
+        From state s, pulling machine m costs c_m and moves to s - e_g with
+        probability P_m,g(s) (the missing mass of group g on m), otherwise it
+        stays in s. Solving the self-loop gives
+            V(s) = min_m (c_m + sum_g P_m,g V(s - e_g)) / sum_g P_m,g
+            
+        Args:
+            group_prefix: Per group, per machine, prefix sums of the member
+                          probabilities (rarest first)
+                          
+        Returns:
+            Tuple of (root cost, expected draws per machine at the root,
+            best machine index at the root or None if nothing is contested)
+        """
+        machine_count = len(self.machines)
+        if not group_prefix:
+            return 0.0, [0.0] * machine_count, None
+        
+        dims = [len(prefix[0]) for prefix in group_prefix]
+        strides = []
+        size = 1
+        for dim in dims:
+            strides.append(size)
+            size *= dim
+        
+        if np is not None:
+            return self._contested_dp_numpy(group_prefix, dims, strides, size)
+        
+        value = [0.0] * size
+        draws = [[0.0] * machine_count for _ in range(size)]
+        best = [None] * size
+        counts = [0] * len(dims)
+        
+        for index in range(1, size):
+            # Advance the mixed-radix counter to this state
+            g = 0
+            while counts[g] == dims[g] - 1:
+                counts[g] = 0
+                g += 1
+            counts[g] += 1
+            
+            best_value = None
+            for m in range(machine_count):
+                total = 0.0
+                expected = 0.0
+                for g, prefix in enumerate(group_prefix):
+                    if counts[g]:
+                        p = prefix[m][counts[g]]
+                        total += p
+                        expected += p * value[index - strides[g]]
+                if total <= 0:
+                    continue
+                candidate = (self.cost_per_pull[m] + expected) / total
+                if best_value is None or candidate < best_value:
+                    best_value = candidate
+                    best[index] = (m, total)
+            
+            value[index] = best_value
+            m, total = best[index]
+            state_draws = draws[index]
+            state_draws[m] += 1.0 / total
+            for g, prefix in enumerate(group_prefix):
+                if counts[g]:
+                    share = prefix[m][counts[g]] / total
+                    previous = draws[index - strides[g]]
+                    for k in range(machine_count):
+                        state_draws[k] += share * previous[k]
+        
+        root = size - 1
+        return value[root], draws[root], best[root][0]
+    
+    def _contested_dp_numpy(self, group_prefix, dims, strides, size):
+        """Same DP as the loop version, vectorized over each layer of equal total missing"""
+        machine_count = len(self.machines)
+        counts = np.stack(np.unravel_index(np.arange(size), dims[::-1])[::-1], axis=1)
+        layers = counts.sum(axis=1)
+        
+        # probs[m][g]: missing mass of group g on machine m for every state
+        probs = np.stack([
+            np.stack([np.asarray(prefix[m])[counts[:, g]] for g, prefix in enumerate(group_prefix)])
+            for m in range(machine_count)
+        ])
+        strides = np.asarray(strides)
+        costs = np.asarray(self.cost_per_pull)
+        
+        value = np.zeros(size)
+        draws = np.zeros((size, machine_count))
+        best = np.zeros(size, dtype=np.intp)
+        
+        for layer in range(1, int(layers[-1]) + 1):
+            index = np.nonzero(layers == layer)[0]
+            # s - e_g for every group (clamped where the group is already complete)
+            previous = np.maximum(index[None, :] - strides[:, None], 0)
+            
+            candidates = np.full((machine_count, index.size), np.inf)
+            for m in range(machine_count):
+                p = probs[m][:, index]
+                total = p.sum(axis=0)
+                expected = (p * value[previous]).sum(axis=0)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    candidates[m] = np.where(total > 0, (costs[m] + expected) / total, np.inf)
+            
+            choice = candidates.argmin(axis=0)
+            best[index] = choice
+            value[index] = candidates[choice, np.arange(index.size)]
+            
+            p = probs[choice, :, index]
+            total = p.sum(axis=1)
+            share = p / total[:, None]
+            draws[index] = np.einsum("sg,gsk->sk", share, draws[previous])
+            draws[index, choice] += 1.0 / total
+        
+        root = size - 1
+        return float(value[root]), [float(d) for d in draws[root]], int(best[root])
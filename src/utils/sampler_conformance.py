@@ -0,0 +1,391 @@
+"""
+Statistical conformance check for the gacha samplers
+
+Draws large batches from GachaSystem and ItemsGachaSystem and tests the
+observed counts against the analytic rates from the probability table,
+per rarity tier and per Pokemon (or item), with Pearson chi-square and
+G-tests. Any drift in the samplers shows up as a tiny p-value; the script
+exits with status 1 if any test fails, so it can gate changes to the
+rolling code.
+
+Usage (from src/):
+    python -m utils.sampler_conformance --draws 10000000
+"""
+import argparse
+import json
+import math
+import sys
+from typing import Dict, List, Optional, Sequence
+
+from logic.alias_table import is_numpy_generator, np
+from logic.gacha_logic import GachaSystem
+from logic.items_gacha import ItemsGachaSystem
+from logic.probability_table import ITEMS_VERSION, POKEMON_VERSIONS, ProbabilityTable
+from logic.rng import make_rng
+
+
+# Bins expected to see fewer draws than this are pooled so the chi-square
+# approximation holds
+MIN_EXPECTED_COUNT = 5.0
+
+# roll_many batch size, to keep memory flat at 10^7+ draws
+CHUNK_SIZE = 1 << 20
+
+# Relative error target for the incomplete gamma function
+_GAMMA_EPSILON = 1e-15
+_GAMMA_MAX_ITERATIONS = 10000
+
+
+class ConformanceResult:
+    """Outcome of one goodness-of-fit test"""
+    
+    def __init__(self, machine: str, level: str, path: str, draws: int, df: int,
+                 chi2: float, chi2_p: float, g: float, g_p: float,
+                 worst_label: Optional[str], worst_z: float, impossible: int):
+        """
+        Args:
+            machine: "Red", "Blue", "Yellow", or "Items"
+            level: "rarity" or "pokemon"/"item"
+            path: Sampler path tested ("roll_many" or "roll_single")
+            draws: Number of draws
+            df: Degrees of freedom (bins after pooling - 1)
+            chi2: Pearson chi-square statistic
+            chi2_p: Its p-value
+            g: G (log-likelihood ratio) statistic
+            g_p: Its p-value
+            worst_label: Bin with the largest standardized residual
+            worst_z: That residual, (observed - expected) / sqrt(expected)
+            impossible: Draws that landed on a zero-probability outcome
+        """
+        self.machine = machine
+        self.level = level
+        self.path = path
+        self.draws = draws
+        self.df = df
+        self.chi2 = chi2
+        self.chi2_p = chi2_p
+        self.g = g
+        self.g_p = g_p
+        self.worst_label = worst_label
+        self.worst_z = worst_z
+        self.impossible = impossible
+    
+    def p_value(self) -> float:
+        """Smaller of the two p-values (0.0 if an impossible outcome was drawn)"""
+        if self.impossible:
+            return 0.0
+        return min(self.chi2_p, self.g_p)
+    
+    def to_dict(self) -> dict:
+        """Result as a plain dict"""
+        return dict(self.__dict__)
+
+
+def chi2_survival(statistic: float, df: int) -> float:
+    """
+    Upper tail probability of the chi-square distribution
+    
+    Args:
+        statistic: Observed statistic
+        df: Degrees of freedom
+        
+    Returns:
+        P(X >= statistic) for X ~ chi-square(df)
+    """
+    if df <= 0:
+        return 1.0
+    if statistic <= 0:
+        return 1.0
+    return _regularized_gamma_q(df / 2.0, statistic / 2.0)
+
+
+def _regularized_gamma_q(a: float, x: float) -> float:
+    """Q(a, x) = Gamma(a, x) / Gamma(a), by series below a + 1 and continued fraction above"""
+    log_prefactor = a * math.log(x) - x - math.lgamma(a)
+    
+    if x < a + 1.0:
+        # Series for P(a, x)
+        term = 1.0 / a
+        total = term
+        denominator = a
+        for _ in range(_GAMMA_MAX_ITERATIONS):
+            denominator += 1.0
+            term *= x / denominator
+            total += term
+            if abs(term) < abs(total) * _GAMMA_EPSILON:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefactor))
+    
+    # Modified Lentz continued fraction for Q(a, x)
+    tiny = 1e-300
+    b = x + 1.0 - a
+    c = 1.0 / tiny
+    d = 1.0 / b
+    h = d
+    for i in range(1, _GAMMA_MAX_ITERATIONS):
+        an = -i * (i - a)
+        b += 2.0
+        d = an * d + b
+        if abs(d) < tiny:
+            d = tiny
+        c = b + an / c
+        if abs(c) < tiny:
+            c = tiny
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < _GAMMA_EPSILON:
+            break
+    return math.exp(log_prefactor) * h
+
+
+def goodness_of_fit(machine: str, level: str, path: str, observed: Sequence[int],
+                    probabilities: Sequence[float], labels: Sequence[str]) -> ConformanceResult:
+    """
+    Chi-square and G-test of observed counts against expected probabilities
+    
+    Args:
+        machine: Machine name (for the report)
+        level: "rarity", "pokemon" or "item" (for the report)
+        path: Sampler path (for the report)
+        observed: Count per outcome
+        probabilities: Analytic probability per outcome (same order)
+        labels: Name per outcome (same order)
+        
+    Returns:
+        ConformanceResult
+    """
+    draws = int(sum(observed))
+    
+    if np is not None:
+        observed_arr = np.asarray(observed, dtype=np.float64)
+        expected_arr = np.asarray(probabilities, dtype=np.float64) * draws
+        impossible = int(observed_arr[expected_arr <= 0].sum())
+        
+        # Pool the sparse bins into one, then drop empty expectations
+        sparse = expected_arr < MIN_EXPECTED_COUNT
+        kept = ~sparse
+        obs = observed_arr[kept]
+        exp = expected_arr[kept]
+        pooled_expected = expected_arr[sparse].sum()
+        if pooled_expected > 0:
+            obs = np.append(obs, observed_arr[sparse & (expected_arr > 0)].sum())
+            exp = np.append(exp, pooled_expected)
+        
+        chi2 = float(((obs - exp) ** 2 / exp).sum())
+        positive = obs > 0
+        g = float(2.0 * (obs[positive] * np.log(obs[positive] / exp[positive])).sum())
+        df = int(obs.size) - 1
+        
+        z = np.zeros_like(observed_arr)
+        nonzero = expected_arr > 0
+        z[nonzero] = (observed_arr[nonzero] - expected_arr[nonzero]) / np.sqrt(expected_arr[nonzero])
+        worst = int(np.abs(z).argmax()) if z.size else None
+    else:
+        expected = [p * draws for p in probabilities]
+        impossible = sum(o for o, e in zip(observed, expected) if e <= 0)
+        
+        bins = [(o, e) for o, e in zip(observed, expected) if e >= MIN_EXPECTED_COUNT]
+        pooled_expected = sum(e for e in expected if e < MIN_EXPECTED_COUNT)
+        if pooled_expected > 0:
+            bins.append((sum(o for o, e in zip(observed, expected) if 0 < e < MIN_EXPECTED_COUNT),
+                         pooled_expected))
+        
+        chi2 = sum((o - e) ** 2 / e for o, e in bins)
+        g = 2.0 * sum(o * math.log(o / e) for o, e in bins if o > 0)
+        df = len(bins) - 1
+        
+        z = [(o - e) / math.sqrt(e) if e > 0 else 0.0 for o, e in zip(observed, expected)]
+        worst = max(range(len(z)), key=lambda i: abs(z[i])) if z else None
+    
+    return ConformanceResult(
+        machine, level, path, draws, df,
+        chi2, chi2_survival(chi2, df), g, chi2_survival(g, df),
+        labels[worst] if worst is not None else None,
+        float(z[worst]) if worst is not None else 0.0,
+        impossible
+    )
+
+
+def _count_batches(draw, n: int, rng, rarity_count: int, pool_size: int):
+    """
+    Draw n samples in chunks and count rarities and pool indices
+    
+    Args:
+        draw: Function (count, rng) -> (rarity_indices, pool_indices)
+        n: Total draws
+        rng: numpy Generator or random.Random
+        rarity_count: Number of rarity tiers
+        pool_size: Number of Pokemon or items
+        
+    Returns:
+        Tuple of (rarity_counts, pool_counts) lists
+    """
+    if is_numpy_generator(rng):
+        rarity_counts = np.zeros(rarity_count, dtype=np.int64)
+        pool_counts = np.zeros(pool_size, dtype=np.int64)
+        for start in range(0, n, CHUNK_SIZE):
+            rarity_indices, pool_indices = draw(min(CHUNK_SIZE, n - start), rng)
+            rarity_counts += np.bincount(rarity_indices, minlength=rarity_count)
+            pool_counts += np.bincount(pool_indices, minlength=pool_size)
+        return rarity_counts.tolist(), pool_counts.tolist()
+    
+    rarity_counts = [0] * rarity_count
+    pool_counts = [0] * pool_size
+    for start in range(0, n, CHUNK_SIZE):
+        rarity_indices, pool_indices = draw(min(CHUNK_SIZE, n - start), rng)
+        for index in rarity_indices:
+            rarity_counts[index] += 1
+        for index in pool_indices:
+            pool_counts[index] += 1
+    return rarity_counts, pool_counts
+
+
+def _count_singles(roll, n: int, rarity_positions: Dict[str, int], pool_positions: Dict[str, int]):
+    """
+    Count n roll_single results by rarity tier and pool index
+    
+    Args:
+        roll: Function () -> Pokemon or Item
+        n: Number of rolls
+        rarity_positions: Rarity name -> index
+        pool_positions: Number -> pool index
+        
+    Returns:
+        Tuple of (rarity_counts, pool_counts) lists
+    """
+    rarity_counts = [0] * len(rarity_positions)
+    pool_counts = [0] * len(pool_positions)
+    for _ in range(n):
+        result = roll()
+        rarity_counts[rarity_positions[result.rarity]] += 1
+        pool_counts[pool_positions[result.number]] += 1
+    return rarity_counts, pool_counts
+
+
+def run_conformance(pokemon_list: List, rarities_dict: Dict, items_list: List,
+                    draws: int = 10_000_000, single_draws: int = 200_000,
+                    seed: int = 0, machines: Optional[List[str]] = None) -> List[ConformanceResult]:
+    """
+    Test every sampler path of every machine against the analytic rates
+    
+    Args:
+        pokemon_list: List of all Pokemon
+        rarities_dict: Dictionary of rarity data
+        items_list: List of all Item objects
+        draws: Draws per machine for the batch (roll_many) path
+        single_draws: Draws per machine for the roll_single path (0 to skip)
+        seed: Root seed for the random streams
+        machines: Machines to test (default: Red, Blue, Yellow and Items)
+        
+    Returns:
+        List of ConformanceResult, a rarity and a per-Pokemon (or per-item)
+        test per machine and path
+    """
+    if machines is None:
+        machines = list(POKEMON_VERSIONS) + [ITEMS_VERSION]
+    
+    table = ProbabilityTable(pokemon_list, rarities_dict, items_list)
+    single_rng = make_rng((seed, (1,)), use_numpy=False)
+    gacha_system = GachaSystem(pokemon_list, rarities_dict, rng=single_rng, probability_table=table)
+    items_gacha_system = ItemsGachaSystem(items_list, rarities_dict, rng=single_rng)
+    results = []
+    
+    for stream, machine in enumerate(machines):
+        if machine == ITEMS_VERSION:
+            sampler = items_gacha_system
+            pool = items_list
+            level = "item"
+            pool_probabilities = table.item_probabilities
+            
+            def draw(count, rng):
+                return items_gacha_system.roll_many(count, rng)
+            
+            roll = items_gacha_system.roll_single
+        else:
+            sampler = gacha_system
+            pool = pokemon_list
+            level = "pokemon"
+            pool_probabilities = table.pokemon_row(machine)
+            
+            def draw(count, rng, version=machine):
+                return gacha_system.roll_many(version, count, rng)
+            
+            def roll(version=machine):
+                return gacha_system.roll_single(version)
+        
+        rarity_names = sampler.rarity_names
+        rarity_probs = table.rarity_probabilities(machine)
+        rarity_probabilities = [rarity_probs.get(name, 0.0) for name in rarity_names]
+        pool_labels = [f"{entry.number} {entry.name}" for entry in pool]
+        
+        rarity_counts, pool_counts = _count_batches(
+            draw, draws, make_rng((seed, (0, stream))), len(rarity_names), len(pool))
+        results.append(goodness_of_fit(machine, "rarity", "roll_many", rarity_counts,
+                                       rarity_probabilities, rarity_names))
+        results.append(goodness_of_fit(machine, level, "roll_many", pool_counts,
+                                       pool_probabilities, pool_labels))
+        
+        if single_draws > 0:
+            rarity_positions = {name: index for index, name in enumerate(rarity_names)}
+            pool_positions = {entry.number: index for index, entry in enumerate(pool)}
+            rarity_counts, pool_counts = _count_singles(roll, single_draws, rarity_positions, pool_positions)
+            results.append(goodness_of_fit(machine, "rarity", "roll_single", rarity_counts,
+                                           rarity_probabilities, rarity_names))
+            results.append(goodness_of_fit(machine, level, "roll_single", pool_counts,
+                                           pool_probabilities, pool_labels))
+    
+    return results
+
+
+def main():
+    """Command line entry point"""
+    from config import POKEMON_CSV, RARITY_CSV, ITEMS_CSV
+    from data.csv_loader import CSVLoader
+    
+    parser = argparse.ArgumentParser(description="Check the gacha samplers against the analytic drop rates")
+    parser.add_argument("--draws", type=int, default=10_000_000, help="Batch draws per machine")
+    parser.add_argument("--single-draws", type=int, default=200_000, help="roll_single draws per machine")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--alpha", type=float, default=1e-3,
+                        help="Family-wise significance level (Bonferroni over all tests)")
+    parser.add_argument("--machines", nargs="+", choices=list(POKEMON_VERSIONS) + [ITEMS_VERSION])
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+    
+    results = run_conformance(
+        CSVLoader.load_pokemon(POKEMON_CSV),
+        CSVLoader.load_rarities(RARITY_CSV),
+        CSVLoader.load_items(ITEMS_CSV),
+        draws=args.draws,
+        single_draws=args.single_draws,
+        seed=args.seed,
+        machines=args.machines
+    )
+    
+    threshold = args.alpha / max(1, len(results))
+    failures = 0
+    
+    print(f"\n{'machine':<8} {'level':<8} {'path':<12} {'draws':>11} {'df':>4} "
+          f"{'chi2 p':>10} {'G p':>10}  worst bin (z)")
+    for result in results:
+        passed = result.p_value() >= threshold
+        failures += not passed
+        note = f"  {result.impossible} impossible draws" if result.impossible else ""
+        print(f"{result.machine:<8} {result.level:<8} {result.path:<12} {result.draws:>11,} {result.df:>4} "
+              f"{result.chi2_p:>10.4f} {result.g_p:>10.4f}  {result.worst_label} ({result.worst_z:+.2f})"
+              f"{'' if passed else '  FAIL'}{note}")
+    
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"alpha": args.alpha, "threshold": threshold,
+                       "results": [result.to_dict() for result in results]}, f, indent=2)
+    
+    if failures:
+        print(f"\nWarning: {failures} of {len(results)} tests failed (p < {threshold:.2e})")
+        sys.exit(1)
+    print(f"\n[OK] All {len(results)} tests passed (p >= {threshold:.2e})")
+
+
+if __name__ == "__main__":
+    main()
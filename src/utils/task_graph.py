@@ -0,0 +1,144 @@
+"""
+Dependency-ordered task runner for startup work
+
+Tasks are named callables that receive the results of the tasks they
+depend on. Independent tasks run concurrently on a thread pool; tasks
+marked main_thread (anything that needs the display, e.g. convert_alpha
+or building UI) run on the calling thread as soon as their dependencies
+finish, once every ready pool task has been submitted. With
+parallel=False (web builds, which have no threads) the same graph runs
+one task at a time in dependency order.
+"""
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Sequence
+
+from utils import tracing
+
+
+class _Task:
+    """One node of the graph"""
+    
+    def __init__(self, name: str, fn: Callable, deps: Sequence[str], main_thread: bool):
+        self.name = name
+        self.fn = fn
+        self.deps = tuple(deps)
+        self.main_thread = main_thread
+    
+    def __call__(self, *args):
+        with tracing.span(f"task {self.name}"):
+            return self.fn(*args)
+
+
+class TaskGraph:
+    """Runs named tasks as soon as their dependencies are done"""
+    
+    def __init__(self, parallel: bool = True, max_workers: Optional[int] = None):
+        """
+        Initialize an empty graph
+        
+        Args:
+            parallel: Run pool tasks on worker threads (False runs everything
+                      on the calling thread)
+            max_workers: Thread pool size (None for the executor default)
+        """
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self._tasks: Dict[str, _Task] = {}
+    
+    def add(self, name: str, fn: Callable, deps: Sequence[str] = (), main_thread: bool = False):
+        """
+        Add a task
+        
+        Args:
+            name: Unique task name (its result is stored under it)
+            fn: Callable taking the dependency results, in deps order
+            deps: Names of tasks that must finish first
+            main_thread: Run on the thread calling run()
+        """
+        if name in self._tasks:
+            raise ValueError(f"Task '{name}' already added")
+        self._tasks[name] = _Task(name, fn, deps, main_thread)
+    
+    def run(self, on_wait: Optional[Callable[[], None]] = None, poll_interval: float = 1 / 60) -> Dict[str, object]:
+        """
+        Run every task
+        
+        Args:
+            on_wait: Called on the calling thread while it waits for worker
+                     tasks (e.g. to keep the window responsive)
+            poll_interval: Longest wait between on_wait calls in seconds
+            
+        Returns:
+            Dict of task name -> result
+            
+        Raises:
+            ValueError: If a dependency is unknown or the graph has a cycle
+            Exception: The first exception raised by a task (remaining
+                       tasks are not started)
+        """
+        order = self._order()
+        if not self.parallel:
+            results: Dict[str, object] = {}
+            for task in order:
+                results[task.name] = task(*[results[dep] for dep in task.deps])
+            return results
+        
+        results = {}
+        pending = list(order)
+        running: Dict[Future, _Task] = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="startup")
+        try:
+            while pending or running:
+                # Submit every ready pool task before running anything on
+                # this thread, so a slow main-thread task never holds back
+                # work the pool could already be doing
+                ready = [task for task in pending if all(dep in results for dep in task.deps)]
+                for task in ready:
+                    if not task.main_thread:
+                        pending.remove(task)
+                        running[executor.submit(task, *[results[dep] for dep in task.deps])] = task
+                
+                # Then run one ready main-thread task and look again, since
+                # it (or a pool task that finished meanwhile) may unblock more
+                main_ready = [task for task in ready if task.main_thread]
+                if main_ready:
+                    task = main_ready[0]
+                    pending.remove(task)
+                    results[task.name] = task(*[results[dep] for dep in task.deps])
+                    for future in [future for future in running if future.done()]:
+                        results[running.pop(future).name] = future.result()
+                    continue
+                
+                if not running:
+                    continue
+                done, _ = wait(running, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future).name] = future.result()
+                if not done and on_wait is not None:
+                    on_wait()
+        finally:
+            executor.shutdown(wait=True)
+        
+        return results
+    
+    def _order(self) -> List[_Task]:
+        """Tasks in dependency order (stable with respect to add order)"""
+        ordered: List[_Task] = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+        
+        def visit(task: _Task):
+            if state.get(task.name) == 2:
+                return
+            if state.get(task.name) == 1:
+                raise ValueError(f"Task graph has a cycle through '{task.name}'")
+            state[task.name] = 1
+            for dep in task.deps:
+                if dep not in self._tasks:
+                    raise ValueError(f"Task '{task.name}' depends on unknown task '{dep}'")
+                visit(self._tasks[dep])
+            state[task.name] = 2
+            ordered.append(task)
+        
+        for task in self._tasks.values():
+            visit(task)
+        return ordered
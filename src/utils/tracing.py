@@ -0,0 +1,180 @@
+"""
+Lightweight span timing with Chrome trace output
+
+Wrap a phase in span() (or decorate a function with traced()) to record
+how long it took and on which thread. Recording is off unless enable() is
+called (main.py does so when POKEGACHA_TRACE names an output file); the
+timeline is then written on exit in Chrome trace format, which opens in
+chrome://tracing or ui.perfetto.dev. When off, a span costs one global
+check and no allocation.
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+# Recorded events (None while tracing is off)
+_events: Optional[List[dict]] = None
+_thread_names: Dict[int, str] = {}
+_trace_path: Optional[str] = None
+_written_count = 0
+
+# Timestamps are microseconds since this module was imported
+_origin = time.perf_counter()
+
+
+class _Span:
+    """Context manager recording one complete ("X") event"""
+    
+    __slots__ = ("name", "args", "start")
+    
+    def __init__(self, name: str, args: Dict[str, object]):
+        self.name = name
+        self.args = args
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = time.perf_counter()
+        events = _events
+        if events is not None:
+            events.append(_event(self.name, "X", self.start, self.args, dur=(end - self.start) * 1e6))
+        return False
+
+
+class _NoSpan:
+    """Shared do-nothing span used while tracing is off"""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def _event(name: str, phase: str, start: float, args: Dict[str, object], **fields) -> dict:
+    """Build one trace event for the current thread"""
+    thread = threading.current_thread()
+    _thread_names[thread.ident] = thread.name
+    event = {"name": name, "ph": phase, "ts": (start - _origin) * 1e6,
+             "pid": os.getpid(), "tid": thread.ident}
+    event.update(fields)
+    if args:
+        event["args"] = {key: str(value) for key, value in args.items()}
+    return event
+
+
+def span(name: str, **args):
+    """
+    Time a block: with span("load_game_data"): ...
+    
+    Args:
+        name: Label shown in the timeline
+        **args: Extra values shown with the span (e.g. a file path)
+        
+    Returns:
+        Context manager
+    """
+    if _events is None:
+        return _NO_SPAN
+    return _Span(name, args)
+
+
+def traced(name: Optional[str] = None):
+    """
+    Decorator timing every call of a function
+    
+    Args:
+        name: Label shown in the timeline (default: the function's qualified name)
+    """
+    def decorate(fn):
+        label = name or fn.__qualname__
+        
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _events is None:
+                return fn(*args, **kwargs)
+            with _Span(label, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def mark(name: str, **args):
+    """
+    Record an instant event (e.g. the first interactive frame)
+    
+    Args:
+        name: Label shown in the timeline
+        **args: Extra values shown with the mark
+    """
+    events = _events
+    if events is not None:
+        events.append(_event(name, "i", time.perf_counter(), args, s="g"))
+
+
+def is_enabled() -> bool:
+    """True while spans are being recorded"""
+    return _events is not None
+
+
+def enable(path: str):
+    """
+    Start recording; the timeline is written to path on exit
+    
+    Args:
+        path: Output file for write_trace()
+    """
+    global _events, _trace_path
+    if _events is None:
+        _events = []
+        atexit.register(_write_at_exit)
+    _trace_path = path
+
+
+def write_trace(path: Optional[str] = None) -> bool:
+    """
+    Write the events recorded so far as a Chrome trace JSON file
+    
+    Args:
+        path: Output file (default: the path given to enable())
+        
+    Returns:
+        True if the file was written
+    """
+    global _written_count
+    path = path or _trace_path
+    if _events is None or not path:
+        return False
+    
+    events = list(_events)
+    metadata = [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": ident, "args": {"name": name}}
+                for ident, name in list(_thread_names.items())]
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+    except OSError as e:
+        print(f"Warning: Could not write trace {path}: {e}")
+        return False
+    
+    _written_count = len(events)
+    print(f"[OK] Wrote {len(events)} trace events to {path}")
+    return True
+
+
+def _write_at_exit():
+    """atexit hook: write anything not written yet"""
+    if _events is not None and len(_events) != _written_count:
+        write_trace()
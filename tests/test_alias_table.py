@@ -0,0 +1,87 @@
+"""
+Tests for logic.alias_table and the per-version tables in GachaSystem
+"""
+import random
+
+import pytest
+
+from conftest import P_THRESHOLD
+from logic.alias_table import AliasTable, np
+from logic.gacha_logic import GachaSystem
+from logic.probability_table import POKEMON_VERSIONS
+from utils.sampler_conformance import goodness_of_fit
+
+
+def _implied_probabilities(table):
+    """Distribution the table encodes: each column keeps its own share and gives the rest to its alias"""
+    shares = [p / table.size for p in table.probabilities]
+    for index, alias in enumerate(table.aliases):
+        shares[alias] += (1.0 - table.probabilities[index]) / table.size
+    return shares
+
+
+def _rngs():
+    """One stdlib and (if installed) one NumPy random source, both seeded"""
+    rngs = [random.Random(1)]
+    if np is not None:
+        rngs.append(np.random.default_rng(1))
+    return rngs
+
+
+@pytest.mark.parametrize("weights", [[1], [1, 1, 1, 1], [5, 1, 0, 3], [1000, 1, 1], [0.1, 0.2, 0.7]])
+def test_table_encodes_the_weights_exactly(weights):
+    table = AliasTable(weights)
+    total = sum(weights)
+    
+    assert _implied_probabilities(table) == pytest.approx([w / total for w in weights], abs=1e-12)
+
+
+@pytest.mark.parametrize("weights", [[], [0, 0]])
+def test_rejects_empty_or_zero_weights(weights):
+    with pytest.raises(ValueError):
+        AliasTable(weights)
+
+
+@pytest.mark.parametrize("rng", _rngs(), ids=lambda rng: type(rng).__name__)
+def test_sample_many_matches_weights(rng):
+    weights = [5, 1, 0, 3, 10, 0.5]
+    table = AliasTable(weights)
+    
+    counts = [0] * len(weights)
+    for index in table.sample_many(50000, rng):
+        counts[int(index)] += 1
+    
+    total = sum(weights)
+    result = goodness_of_fit("test", "index", "sample_many", counts,
+                             [w / total for w in weights], [str(i) for i in range(len(weights))])
+    assert result.impossible == 0
+    assert result.p_value() > P_THRESHOLD
+
+
+def test_sample_matches_weights():
+    weights = [2, 7, 1]
+    table = AliasTable(weights)
+    rng = random.Random(2)
+    
+    counts = [0] * len(weights)
+    for _ in range(30000):
+        counts[table.sample(rng)] += 1
+    
+    result = goodness_of_fit("test", "index", "sample", counts, [w / 10 for w in weights], ["0", "1", "2"])
+    assert result.p_value() > P_THRESHOLD
+
+
+@pytest.mark.parametrize("version", POKEMON_VERSIONS)
+def test_roll_single_matches_probability_table(catalog, probability_table, version):
+    pokemon_list = catalog['pokemon_list']
+    gacha = GachaSystem(pokemon_list, catalog['rarities_dict'], rng=random.Random(3),
+                        probability_table=probability_table)
+    
+    counts = [0] * len(pokemon_list)
+    for _ in range(20000):
+        counts[probability_table.pokemon_index[gacha.roll_single(version).number]] += 1
+    
+    result = goodness_of_fit(version, "pokemon", "roll_single", counts,
+                             probability_table.pokemon_row(version), pokemon_list.numbers)
+    assert result.impossible == 0
+    assert result.p_value() > P_THRESHOLD
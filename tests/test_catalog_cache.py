@@ -0,0 +1,132 @@
+"""
+Tests for the compiled catalog cache (data.catalog_cache via CSVLoader.load_catalog)
+"""
+import os
+import shutil
+
+import pytest
+
+from conftest import CATALOG_CSVS
+from data.catalog_cache import load_catalog_cache
+from data.csv_loader import _BASE_PATH, CSVLoader
+
+SOURCE_KEYS = ('pokemon_list', 'types_dict', 'rarities_dict', 'gacha_machines_dict', 'items_list')
+
+
+@pytest.fixture
+def csvs(tmp_path):
+    """Copies of the shipped CSVs the tests are free to edit"""
+    paths = []
+    for source in CATALOG_CSVS:
+        path = tmp_path / os.path.basename(source)
+        shutil.copyfile(source, path)
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache" / "catalog.bin")
+
+
+def _sources(csvs):
+    return dict(zip(SOURCE_KEYS, csvs))
+
+
+def _no_parsing(monkeypatch):
+    """Make any CSV parse fail, so a load can only come from the cache"""
+    def fail(filepath):
+        raise AssertionError(f"parsed {filepath} instead of using the cache")
+    monkeypatch.setattr(CSVLoader, 'load_pokemon', staticmethod(fail))
+
+
+def _replace_in_file(path: str, old: str, new: str):
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    assert old in text
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text.replace(old, new, 1))
+
+
+def test_first_load_writes_the_cache_and_second_load_hits(csvs, cache_path, monkeypatch):
+    parsed = CSVLoader.load_catalog(*csvs, cache_path=cache_path)
+    assert os.path.exists(cache_path)
+    
+    _no_parsing(monkeypatch)
+    cached = CSVLoader.load_catalog(*csvs, cache_path=cache_path)
+    
+    assert [p.to_pokemon() for p in cached['pokemon_list']] == [p.to_pokemon() for p in parsed['pokemon_list']]
+    assert [vars(i) for i in cached['items_list']] == [vars(i) for i in parsed['items_list']]
+    assert set(cached['rarities_dict']) == set(parsed['rarities_dict'])
+    assert set(cached['gacha_machines_dict']) == set(parsed['gacha_machines_dict'])
+
+
+def test_cold_fields_are_read_from_the_cache_file(csvs, cache_path):
+    parsed = CSVLoader.load_catalog(*csvs, cache_path=cache_path)
+    cached = CSVLoader.load_catalog(*csvs, cache_path=cache_path)
+    
+    for before, after in zip(parsed['pokemon_list'], cached['pokemon_list']):
+        assert after.pokedex_entry == before.pokedex_entry
+        assert after.species == before.species
+        assert after.height_ft == before.height_ft
+
+
+def test_edited_csv_is_reloaded(csvs, cache_path):
+    CSVLoader.load_catalog(*csvs, cache_path=cache_path)
+    _replace_in_file(csvs[0], "001,Bulbasaur,", "001,Bulbasaur2,")
+    
+    catalog = CSVLoader.load_catalog(*csvs, cache_path=cache_path)
+    
+    assert catalog['pokemon_list'][0].name == "Bulbasaur2"
+    
+    # The rewritten cache holds the new data too
+    cached, stale_stamps = load_catalog_cache(cache_path, _sources(csvs), _BASE_PATH)
+    assert cached['pokemon_list'][0].name == "Bulbasaur2"
+    assert not stale_stamps
+
+
+def test_same_size_edit_is_caught_by_the_hash(csvs, cache_path):
+    CSVLoader.load_catalog(*csvs, cache_path=cache_path)
+    stat = os.stat(csvs[0])
+    _replace_in_file(csvs[0], "001,Bulbasaur,", "001,Bulbasaux,")
+    # Same size, and a different mtime than the cache recorded
+    os.utime(csvs[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert os.stat(csvs[0]).st_size == stat.st_size
+    
+    assert load_catalog_cache(cache_path, _sources(csvs), _BASE_PATH) is None
+    assert CSVLoader.load_catalog(*csvs, cache_path=cache_path)['pokemon_list'][0].name == "Bulbasaux"
+
+
+def test_touched_csv_hits_with_stale_stamps_and_is_restamped(csvs, cache_path, monkeypatch):
+    CSVLoader.load_catalog(*csvs, cache_path=cache_path)
+    stat = os.stat(csvs[1])
+    os.utime(csvs[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    
+    cached, stale_stamps = load_catalog_cache(cache_path, _sources(csvs), _BASE_PATH)
+    assert cached is not None
+    assert stale_stamps
+    
+    # load_catalog rewrites the cache, so the next start is a plain stat hit
+    _no_parsing(monkeypatch)
+    CSVLoader.load_catalog(*csvs, cache_path=cache_path)
+    _, stale_stamps = load_catalog_cache(cache_path, _sources(csvs), _BASE_PATH)
+    assert not stale_stamps
+
+
+def test_other_base_path_misses(csvs, cache_path):
+    CSVLoader.load_catalog(*csvs, cache_path=cache_path)
+    
+    assert load_catalog_cache(cache_path, _sources(csvs), _BASE_PATH + "elsewhere") is None
+
+
+def test_corrupt_cache_falls_back_to_the_csvs(csvs, cache_path, capsys):
+    CSVLoader.load_catalog(*csvs, cache_path=cache_path)
+    with open(cache_path, 'wb') as f:
+        f.write(b"not a catalog cache")
+    
+    catalog = CSVLoader.load_catalog(*csvs, cache_path=cache_path)
+    
+    assert catalog['pokemon_list'][0].name == "Bulbasaur"
+    assert "Ignoring unreadable catalog cache" in capsys.readouterr().out
+    # ...and the cache was repaired
+    assert load_catalog_cache(cache_path, _sources(csvs), _BASE_PATH) is not None
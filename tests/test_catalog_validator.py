@@ -0,0 +1,160 @@
+"""
+Tests for data.catalog_validator on broken copies of the shipped catalog
+"""
+import copy
+from dataclasses import replace
+
+import pytest
+
+from data import catalog_validator
+from data.catalog_validator import MAX_LISTED, validate_catalog
+from data.csv_loader import CSVLoader, CSVLoadError
+from data.pokemon_catalog import PokemonCatalog
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def parts(request, catalog, monkeypatch):
+    """
+    Editable copy of the shipped catalog: [pokemon (list of Pokemon),
+    types_dict, rarities_dict, gacha_machines_dict, items_list], checked
+    with and without NumPy
+    """
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(catalog_validator, 'np', None)
+    return [
+        [p.to_pokemon() for p in catalog['pokemon_list']],
+        dict(catalog['types_dict']),
+        copy.deepcopy(catalog['rarities_dict']),
+        dict(catalog['gacha_machines_dict']),
+        copy.deepcopy(catalog['items_list']),
+    ]
+
+
+def _validate(parts):
+    pokemon, types_dict, rarities_dict, gacha_machines_dict, items_list = parts
+    return validate_catalog(PokemonCatalog(pokemon), types_dict, rarities_dict, gacha_machines_dict, items_list)
+
+
+def _set_pokemon(parts, target: str, **changes):
+    """Replace the Pokemon numbered target with a changed copy"""
+    pokemon = parts[0]
+    index = next(i for i, p in enumerate(pokemon) if p.number == target)
+    pokemon[index] = replace(pokemon[index], **changes)
+    return pokemon[index]
+
+
+def test_shipped_catalog_is_valid(parts):
+    assert _validate(parts) == []
+
+
+def test_plain_pokemon_list_is_accepted(parts):
+    pokemon, types_dict, rarities_dict, gacha_machines_dict, items_list = parts
+    assert validate_catalog(pokemon, types_dict, rarities_dict, gacha_machines_dict, items_list) == []
+
+
+def test_unknown_types_are_named(parts):
+    bulbasaur = _set_pokemon(parts, "001", type1="Grasss")
+    pikachu = _set_pokemon(parts, "025", type2="Steel")
+    
+    issues = _validate(parts)
+    
+    assert f"{bulbasaur.name} has invalid Type1: Grasss" in issues
+    assert f"{pikachu.name} has invalid Type2: Steel" in issues
+
+
+def test_unknown_rarity_is_named(parts):
+    mew = _set_pokemon(parts, "151", rarity="Mythic")
+    parts[4][0].rarity = "Shiny"
+    
+    issues = _validate(parts)
+    
+    assert f"{mew.name} has invalid rarity: Mythic" in issues
+    assert f"{parts[4][0].name} has invalid rarity: Shiny" in issues
+
+
+def test_duplicate_numbers(parts):
+    _set_pokemon(parts, "002", number="001")
+    parts[4][1].number = parts[4][0].number
+    
+    issues = _validate(parts)
+    
+    assert "Duplicate Pokemon number: 001" in issues
+    assert f"Duplicate item number: {parts[4][0].number}" in issues
+
+
+def test_negative_weights(parts):
+    _set_pokemon(parts, "010", blue_weight=-1)
+    parts[4][3].weight = -5
+    parts[2]["Epic"].yellow_weight = -2
+    
+    issues = _validate(parts)
+    
+    assert "Pokemon Blue weights contain a negative value" in issues
+    assert "Item weights contain a negative value" in issues
+    assert "Rarity weights for Yellow contain a negative value" in issues
+
+
+def test_rarity_tier_with_nothing_to_drop(parts):
+    # Take every Legendary Pokemon out of the Red machine
+    for p in list(parts[0]):
+        if p.rarity == "Legendary":
+            _set_pokemon(parts, p.number, red_weight=0)
+    # ...and every Epic item out of the Items machine
+    for item in parts[4]:
+        if item.rarity == "Epic":
+            item.weight = 0
+    
+    issues = _validate(parts)
+    
+    assert "Rarity Legendary can roll in Red but no Pokemon of it has a Red weight" in issues
+    assert "Rarity Epic can roll in Items but no item of it has a weight" in issues
+    assert not any("in Blue" in issue or "in Yellow" in issue for issue in issues)
+
+
+def test_tier_that_cannot_roll_may_be_empty(parts):
+    parts[2]["Legendary"].red_weight = 0
+    for p in list(parts[0]):
+        if p.rarity == "Legendary":
+            _set_pokemon(parts, p.number, red_weight=0)
+    
+    assert _validate(parts) == []
+
+
+def test_machine_with_no_rarity_weight(parts):
+    for rarity in parts[2].values():
+        rarity.items_weight = 0
+    
+    assert "No rarity has a Items weight" in _validate(parts)
+
+
+def test_missing_machine(parts):
+    del parts[3]["Yellow"]
+    
+    assert _validate(parts) == ["Missing gacha machine for version: Yellow"]
+
+
+def test_long_issue_lists_are_capped(parts):
+    for p in parts[0][:MAX_LISTED + 5]:
+        _set_pokemon(parts, p.number, rarity="Mythic")
+    
+    issues = [issue for issue in _validate(parts) if "invalid rarity" in issue or issue.startswith("...")]
+    
+    assert len(issues) == MAX_LISTED + 1
+    assert issues[-1] == "... and 5 more"
+
+
+def test_loader_raises_on_issues(parts):
+    _set_pokemon(parts, "001", type1="Grasss")
+    pokemon, types_dict, rarities_dict, gacha_machines_dict, items_list = parts
+    catalog = {
+        'pokemon_list': PokemonCatalog(pokemon),
+        'types_dict': types_dict,
+        'rarities_dict': rarities_dict,
+        'gacha_machines_dict': gacha_machines_dict,
+        'items_list': items_list,
+    }
+    
+    with pytest.raises(CSVLoadError, match="invalid Type1: Grasss"):
+        CSVLoader.validate_catalog(catalog)
@@ -0,0 +1,84 @@
+"""
+Tests for the batch rolls (GachaSystem.roll_many, ItemsGachaSystem.roll_many)
+"""
+import random
+
+import pytest
+
+from conftest import P_THRESHOLD
+from data.pokemon_data import Pokemon
+from data.rarity_data import Rarity
+from logic.alias_table import np
+from logic.gacha_logic import GachaSystem
+from logic.items_gacha import ItemsGachaSystem
+from logic.probability_table import POKEMON_VERSIONS
+from utils.sampler_conformance import goodness_of_fit
+
+
+def _rngs():
+    """(rng, draws) for the stdlib path and, if installed, the NumPy path"""
+    rngs = [pytest.param(random.Random(4), 30000, id="stdlib")]
+    if np is not None:
+        rngs.append(pytest.param(np.random.default_rng(4), 500000, id="numpy"))
+    return rngs
+
+
+def _counts(indices, size):
+    counts = [0] * size
+    for index in indices:
+        counts[int(index)] += 1
+    return counts
+
+
+@pytest.mark.parametrize("rng, draws", _rngs())
+@pytest.mark.parametrize("version", POKEMON_VERSIONS)
+def test_roll_many_matches_probability_table(catalog, probability_table, version, rng, draws):
+    pokemon_list = catalog['pokemon_list']
+    gacha = GachaSystem(pokemon_list, catalog['rarities_dict'], probability_table=probability_table)
+    
+    rarity_indices, pokemon_indices = gacha.roll_many(version, draws, rng)
+    
+    result = goodness_of_fit(version, "pokemon", "roll_many", _counts(pokemon_indices, len(pokemon_list)),
+                             probability_table.pokemon_row(version), pokemon_list.numbers)
+    assert result.impossible == 0
+    assert result.p_value() > P_THRESHOLD
+    
+    # Every rarity index names the rarity of the Pokemon drawn with it
+    for rarity_index, pokemon_index in zip(rarity_indices[:1000], pokemon_indices[:1000]):
+        assert gacha.rarity_names[rarity_index] == pokemon_list[int(pokemon_index)].rarity
+
+
+@pytest.mark.parametrize("rng, draws", _rngs())
+def test_items_roll_many_matches_probability_table(catalog, probability_table, rng, draws):
+    items_list = catalog['items_list']
+    items_gacha = ItemsGachaSystem(items_list, catalog['rarities_dict'])
+    
+    rarity_indices, item_indices = items_gacha.roll_many(draws, rng)
+    
+    result = goodness_of_fit("Items", "item", "roll_many", _counts(item_indices, len(items_list)),
+                             probability_table.item_probabilities, [item.number for item in items_list])
+    assert result.impossible == 0
+    assert result.p_value() > P_THRESHOLD
+    assert all(items_gacha.rarity_names[r] == items_list[int(i)].rarity
+               for r, i in zip(rarity_indices[:1000], item_indices[:1000]))
+
+
+def test_roll_many_refuses_a_weighted_tier_without_pokemon():
+    rarities = {
+        "Common": Rarity("Common", 1, 1, 1, 1, "#FFFFFF"),
+        "Rare": Rarity("Rare", 1, 1, 1, 1, "#0070DD"),
+    }
+    pokemon = [Pokemon("001", "Bulbasaur", "Grass", "Poison", "Common", 1, 1, 1, "", "Seed", 2.3, 15.2, "")]
+    gacha = GachaSystem(pokemon, rarities, rng=random.Random(5))
+    
+    with pytest.raises(ValueError, match="Rare"):
+        gacha.roll_many("Red", 10)
+
+
+def test_roll_many_is_reproducible_from_the_system_rng(catalog, probability_table):
+    def roll():
+        gacha = GachaSystem(catalog['pokemon_list'], catalog['rarities_dict'], rng=random.Random(6),
+                            probability_table=probability_table)
+        return list(gacha.roll_many("Blue", 200)[1])
+    
+    assert roll() == roll()
@@ -0,0 +1,75 @@
+"""
+Tests for logic.new_chance_tracker
+"""
+import random
+
+import pytest
+
+from logic.new_chance_tracker import NewChanceTracker
+from logic.probability_table import POKEMON_VERSIONS
+
+PROBABILITIES = {
+    "Red": {"001": 0.5, "002": 0.3, "003": 0.2},
+    "Blue": {"001": 0.6, "004": 0.4},
+}
+
+
+def test_starts_with_everything_new():
+    tracker = NewChanceTracker(PROBABILITIES)
+    
+    assert tracker.chance("Red") == pytest.approx(1.0)
+    assert tracker.unowned_count("Blue") == 2
+
+
+def test_acquire_updates_every_machine_that_drops_it():
+    tracker = NewChanceTracker(PROBABILITIES)
+    tracker.acquire("001")
+    
+    assert tracker.chance("Red") == pytest.approx(0.5)
+    assert tracker.chance("Blue") == pytest.approx(0.4)
+    assert tracker.unowned_count("Red") == 2
+
+
+def test_repeat_and_unknown_numbers_change_nothing():
+    tracker = NewChanceTracker(PROBABILITIES, owned=["002"])
+    tracker.acquire("002")
+    tracker.acquire("999")
+    
+    assert tracker.chance("Red") == pytest.approx(0.7)
+    assert tracker.chance("Blue") == pytest.approx(1.0)
+    assert tracker.chance("Yellow") == 0.0
+
+
+def test_owning_everything_leaves_exactly_zero():
+    tracker = NewChanceTracker(PROBABILITIES)
+    for number in ("003", "001", "004", "002"):
+        tracker.acquire(number)
+    
+    assert tracker.chance("Red") == 0.0
+    assert tracker.chance("Blue") == 0.0
+    assert tracker.unowned_count("Red") == 0
+
+
+def test_reset_recomputes_from_the_owned_set():
+    tracker = NewChanceTracker(PROBABILITIES)
+    tracker.acquire("001")
+    tracker.reset(owned=["004"])
+    
+    assert tracker.chance("Red") == pytest.approx(1.0)
+    assert tracker.chance("Blue") == pytest.approx(0.6)
+
+
+def test_incremental_matches_a_full_recount(probability_table):
+    probabilities = {version: probability_table.version_probabilities(version) for version in POKEMON_VERSIONS}
+    tracker = NewChanceTracker(probabilities)
+    numbers = sorted(set().union(*probabilities.values()))
+    random.Random(11).shuffle(numbers)
+    
+    owned = set()
+    for number in numbers[:100]:
+        tracker.acquire(number)
+        owned.add(number)
+    
+    for version, drops in probabilities.items():
+        expected = sum(prob for number, prob in drops.items() if number not in owned)
+        assert tracker.chance(version) == pytest.approx(expected, abs=1e-12)
@@ -0,0 +1,149 @@
+"""
+Tests for the columnar PokemonCatalog and its PokemonView rows
+"""
+import pickle
+
+import pytest
+
+from data import pokemon_catalog
+from data.pokemon_catalog import PokemonCatalog, PokemonView, number_column, rarity_column, version_weights
+from data.pokemon_data import Pokemon
+
+POKEMON = [
+    Pokemon("001", "Bulbasaur", "Grass", "Poison", "Uncommon", 1, 1, 1, "a.png", "Seed", 2.3, 15.2, "Seed text"),
+    Pokemon("004", "Charmander", "Fire", None, "Uncommon", 1, 1, 0, "b.png", "Lizard", 2.0, 18.7, "Flame text"),
+    Pokemon("023", "Ekans", "Poison", None, "Common", 10, 0, 0, "c.png", "Snake", 6.7, 15.2, ""),
+    Pokemon("027", "Sandshrew", "Ground", None, "Common", 0, 10, 0, "d.png", "Mouse", 2.0, 26.5, "Sand text"),
+    Pokemon("150", "Mewtwo", "Psychic", None, "Legendary", 1, 1, 1, "e.png", "Genetic", 6.7, 269.0, "Mewtwo text"),
+]
+
+# Every mask() condition the game uses, plus unknown names
+CONDITIONS = [
+    {},
+    {"available_in": ("Red",)},
+    {"available_in": ("Red", "Blue")},
+    {"unavailable_in": ("Yellow",)},
+    {"available_in": ("Blue",), "unavailable_in": ("Red",)},
+    {"rarity": "Common"},
+    {"rarity": "Mythic"},
+    {"type_name": "Poison"},
+    {"type_name": "Poison", "available_in": ("Yellow",)},
+    {"available_in": ("Gold",)},
+]
+
+
+@pytest.fixture
+def small():
+    return PokemonCatalog(POKEMON)
+
+
+def _expected_rows(pokemon_list, available_in=(), unavailable_in=(), rarity=None, type_name=None):
+    """The filter mask() implements, written out over Pokemon objects"""
+    return [index for index, p in enumerate(pokemon_list)
+            if all(p.get_weight_for_version(v) > 0 for v in available_in)
+            and all(p.get_weight_for_version(v) <= 0 for v in unavailable_in)
+            and (rarity is None or p.rarity == rarity)
+            and (type_name is None or type_name in (p.type1, p.type2))]
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def numpy_mode(request, monkeypatch):
+    """Run a test with and without NumPy"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(pokemon_catalog, 'np', None)
+    return request.param
+
+
+def test_views_read_every_field(small):
+    assert len(small) == len(POKEMON)
+    for view, pokemon in zip(small, POKEMON):
+        assert isinstance(view, PokemonView)
+        assert view.to_pokemon() == pokemon
+        assert view == pokemon
+        assert view.get_pokedex_num() == pokemon.get_pokedex_num()
+        assert view.has_dual_type() == pokemon.has_dual_type()
+        for version in ("Red", "Blue", "Yellow", "Gold"):
+            assert view.get_weight_for_version(version) == pokemon.get_weight_for_version(version)
+
+
+def test_indexing_returns_the_same_view(small):
+    assert small[1] is small[1]
+    assert small[-1] is small[len(small) - 1]
+    assert small[0] != small[1]
+    assert len({small[0], small[0], small[2]}) == 2
+
+
+def test_slice_and_take_copy_rows_in_order(small):
+    sliced = small[1:4]
+    assert isinstance(sliced, PokemonCatalog)
+    assert [p.to_pokemon() for p in sliced] == POKEMON[1:4]
+    assert [p.number for p in small[::-2]] == ["150", "023", "001"]
+    
+    taken = small.take([4, 0])
+    assert [p.to_pokemon() for p in taken] == [POKEMON[4], POKEMON[0]]
+    # Views of different catalogs compare by contents
+    assert taken[1] == small[0]
+    assert taken[1].pokedex_entry == "Seed text"
+
+
+def test_copy_is_a_plain_list_of_views(small):
+    rows = small.copy()
+    assert isinstance(rows, list)
+    assert rows == list(small)
+
+
+def test_append_extends_every_column(small):
+    extra = Pokemon("025", "Pikachu", "Electric", None, "Rare", 0, 0, 5, "f.png", "Mouse", 1.3, 13.2, "Zap")
+    small.append(extra)
+    
+    assert small[-1] == extra
+    assert list(small.version_weights("Yellow")) == [1, 0, 0, 0, 1, 5]
+    assert small.rarity_column()[-1] == "Rare"
+
+
+def test_columns(small):
+    assert small.numbers == [p.number for p in POKEMON]
+    assert small.rarity_column() == [p.rarity for p in POKEMON]
+    for version in ("Red", "Blue", "Yellow"):
+        assert list(small.version_weights(version)) == [p.get_weight_for_version(version) for p in POKEMON]
+    assert list(small.version_weights("Gold")) == [0] * len(POKEMON)
+
+
+@pytest.mark.parametrize("pokemon_list", [POKEMON, PokemonCatalog(POKEMON)], ids=["list", "catalog"])
+def test_column_helpers_accept_lists_and_catalogs(pokemon_list):
+    assert number_column(pokemon_list) == [p.number for p in POKEMON]
+    assert list(rarity_column(pokemon_list)) == [p.rarity for p in POKEMON]
+    assert list(version_weights(pokemon_list, "Blue")) == [p.blue_weight for p in POKEMON]
+
+
+@pytest.mark.parametrize("conditions", CONDITIONS)
+def test_select_matches_a_plain_filter(small, numpy_mode, conditions):
+    assert small.select(**conditions) == _expected_rows(POKEMON, **conditions)
+    assert [bool(keep) for keep in small.mask(**conditions)] == [
+        index in _expected_rows(POKEMON, **conditions) for index in range(len(POKEMON))]
+
+
+@pytest.mark.parametrize("conditions", CONDITIONS)
+def test_select_on_the_shipped_catalog(catalog, numpy_mode, conditions):
+    pokemon_list = catalog['pokemon_list']
+    plain = [p.to_pokemon() for p in pokemon_list]
+    
+    selected = pokemon_list.select(**conditions)
+    
+    assert selected == _expected_rows(plain, **conditions)
+    assert pokemon_list.rows(selected) == [pokemon_list[index] for index in selected]
+
+
+def test_pickle_round_trip(small):
+    restored = pickle.loads(pickle.dumps(small))
+    
+    # The cold records are not pickled; the catalog cache stores them
+    # separately and attaches them after loading
+    assert restored.names == small.names
+    restored.cold.use_memory(small.cold.blob_bytes())
+    
+    assert [p.to_pokemon() for p in restored] == POKEMON
+    assert restored[0] is restored[0]
+    assert restored.select(rarity="Common") == small.select(rarity="Common")
@@ -0,0 +1,124 @@
+"""
+Tests for utils.pull_planner against a brute-force optimum
+"""
+from functools import lru_cache
+
+import pytest
+
+from data.gacha_machine_data import GachaMachine
+from data.pokemon_data import Pokemon
+from data.rarity_data import Rarity
+from logic.probability_table import POKEMON_VERSIONS, ProbabilityTable
+from utils.pull_planner import PullPlanner
+
+MACHINES = {
+    "Red": GachaMachine("Red", "Red", 120, 1000, ""),
+    "Blue": GachaMachine("Blue", "Blue", 180, 1500, ""),
+    "Yellow": GachaMachine("Yellow", "Yellow", 100, 800, ""),
+}
+
+RARITIES = {
+    "Common": Rarity("Common", 3, 3, 3, 0, "#FFFFFF"),
+    "Rare": Rarity("Rare", 1, 1, 2, 0, "#0070DD"),
+}
+
+
+def _pokemon(number: str, rarity: str, red: int, blue: int, yellow: int) -> Pokemon:
+    return Pokemon(number, f"Mon{number}", "Normal", None, rarity, red, blue, yellow, "", "", 1.0, 1.0, "")
+
+
+def _brute_force(table: ProbabilityTable, missing, costs):
+    """
+    Exact optimal expected cost over every subset of missing Pokemon
+    
+    Returns:
+        Tuple of (cost, pulls, {machine: expected cost if it is pulled first})
+    """
+    rows = [table.version_probabilities(machine) for machine in POKEMON_VERSIONS]
+    
+    def first_steps(state: frozenset):
+        steps = {}
+        for m, row in enumerate(rows):
+            total = sum(row.get(number, 0.0) for number in state)
+            if total <= 0:
+                continue
+            cost = costs[m]
+            pulls = 1.0
+            for number in state:
+                p = row.get(number, 0.0)
+                if p > 0:
+                    next_cost, next_pulls = solve(state - {number})
+                    cost += p * next_cost
+                    pulls += p * next_pulls
+            steps[POKEMON_VERSIONS[m]] = (cost / total, pulls / total)
+        return steps
+    
+    @lru_cache(maxsize=None)
+    def solve(state: frozenset):
+        if not state:
+            return 0.0, 0.0
+        return min(first_steps(state).values())
+    
+    root = frozenset(missing)
+    cost, pulls = solve(root)
+    return cost, pulls, {machine: step[0] for machine, step in first_steps(root).items()}
+
+
+@pytest.fixture
+def contested_only():
+    """Every Pokemon is missing from at least one machine, and Pokemon
+    sharing a set of machines have the same drop chances, so the planner's
+    grouping is exact here"""
+    pokemon = [
+        _pokemon("001", "Common", 1, 0, 0),
+        _pokemon("002", "Common", 1, 0, 0),
+        _pokemon("003", "Common", 0, 1, 0),
+        _pokemon("004", "Common", 0, 1, 0),
+        _pokemon("005", "Common", 0, 0, 1),
+        _pokemon("006", "Rare", 1, 1, 0),
+        _pokemon("007", "Rare", 1, 1, 0),
+        _pokemon("008", "Rare", 0, 1, 1),
+        _pokemon("009", "Rare", 1, 0, 1),
+    ]
+    return ProbabilityTable(pokemon, RARITIES)
+
+
+@pytest.mark.parametrize("owned", [(), ("001", "003"), ("002", "006", "008"), ("001", "002", "005", "009")])
+def test_plan_matches_brute_force_when_grouping_is_exact(contested_only, owned):
+    planner = PullPlanner(contested_only, MACHINES)
+    missing = [p.number for p in contested_only.pokemon_list if p.number not in owned]
+    
+    plan = planner.plan({number: 1 for number in owned})
+    cost, pulls, first_steps = _brute_force(contested_only, missing, planner.cost_per_pull)
+    
+    assert plan.estimated_cost == pytest.approx(cost, rel=1e-9)
+    assert plan.estimated_pulls == pytest.approx(pulls, rel=1e-9)
+    # Machines can tie exactly, so any optimal first machine is accepted
+    assert first_steps[plan.machine] == pytest.approx(cost, rel=1e-9)
+
+
+def test_plan_is_close_to_brute_force_with_shared_pokemon():
+    pokemon = [
+        _pokemon("001", "Common", 2, 0, 0),
+        _pokemon("002", "Common", 1, 0, 0),
+        _pokemon("003", "Common", 0, 1, 0),
+        _pokemon("004", "Rare", 0, 0, 1),
+        _pokemon("005", "Common", 1, 1, 1),
+        _pokemon("006", "Common", 1, 2, 1),
+        _pokemon("007", "Rare", 1, 1, 1),
+    ]
+    table = ProbabilityTable(pokemon, RARITIES)
+    planner = PullPlanner(table, MACHINES)
+    
+    plan = planner.plan({})
+    cost, _, _ = _brute_force(table, [p.number for p in pokemon], planner.cost_per_pull)
+    
+    # An estimate: never below the true optimum, and not far above it
+    assert cost * (1 - 1e-9) <= plan.estimated_cost <= cost * 1.05
+
+
+def test_complete_collection_has_nothing_to_plan(contested_only):
+    plan = PullPlanner(contested_only, MACHINES).plan({p.number: 1 for p in contested_only.pokemon_list})
+    
+    assert plan.machine is None
+    assert plan.estimated_cost == 0.0
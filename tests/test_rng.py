@@ -0,0 +1,67 @@
+"""
+Tests for logic.rng seeded streams
+"""
+import pytest
+
+from logic.alias_table import np
+from logic.gacha_logic import GachaSystem
+from logic.rng import RngStreamFactory, make_rng
+
+BACKENDS = [pytest.param(False, id="stdlib"),
+            pytest.param(True, id="numpy",
+                         marks=pytest.mark.skipif(np is None, reason="NumPy not installed"))]
+
+
+def _draws(rng, n=20):
+    return [rng.random() for _ in range(n)]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_same_seed_gives_the_same_stream(use_numpy):
+    assert _draws(make_rng((42, (0,)), use_numpy)) == _draws(make_rng((42, (0,)), use_numpy))
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_different_seeds_or_keys_give_different_streams(use_numpy):
+    base = _draws(make_rng((42, (0,)), use_numpy))
+    
+    assert _draws(make_rng((43, (0,)), use_numpy)) != base
+    assert _draws(make_rng((42, (1,)), use_numpy)) != base
+
+
+def test_factories_with_the_same_seed_spawn_the_same_streams():
+    first = RngStreamFactory(7)
+    second = RngStreamFactory(7)
+    
+    assert [_draws(rng) for rng in first.spawn(3)] == [_draws(rng) for rng in second.spawn(3)]
+    # Later spawns continue the sequence instead of repeating it
+    assert first.spawn_seeds(2) == [(7, (3,)), (7, (4,))]
+
+
+def test_spawned_streams_are_distinct():
+    streams = [tuple(_draws(rng)) for rng in RngStreamFactory(8).spawn(4)]
+    
+    assert len(set(streams)) == len(streams)
+
+
+def test_keyed_stream_does_not_depend_on_spawning():
+    factory = RngStreamFactory(9)
+    before = _draws(factory.stream(5))
+    factory.spawn(10)
+    
+    assert _draws(factory.stream(5)) == before
+    assert _draws(RngStreamFactory(9).stream(5)) == before
+    assert _draws(factory.stream(6)) != before
+
+
+def test_unseeded_factories_differ():
+    assert RngStreamFactory().entropy != RngStreamFactory().entropy
+
+
+def test_seeded_gacha_rolls_repeat(catalog):
+    def rolls():
+        rng = RngStreamFactory(10).stream(0)
+        gacha = GachaSystem(catalog['pokemon_list'], catalog['rarities_dict'], rng=rng)
+        return [gacha.roll_single("Yellow").number for _ in range(100)]
+    
+    assert rolls() == rolls()
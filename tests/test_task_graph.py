@@ -0,0 +1,68 @@
+"""
+Tests for utils.task_graph
+"""
+import threading
+
+import pytest
+
+from utils.task_graph import TaskGraph
+
+
+def test_pool_task_starts_before_blocking_main_thread_task_ends():
+    pool_started = threading.Event()
+    main_saw_pool = []
+    
+    def blocking_main():
+        # Blocks until the pool task has started (or gives up)
+        main_saw_pool.append(pool_started.wait(timeout=5))
+    
+    graph = TaskGraph()
+    graph.add("fonts", blocking_main, main_thread=True)
+    graph.add("catalog", pool_started.set)
+    graph.run()
+    
+    assert main_saw_pool == [True]
+
+
+def test_main_thread_tasks_run_on_calling_thread():
+    caller = threading.get_ident()
+    graph = TaskGraph()
+    graph.add("pool", threading.get_ident)
+    graph.add("main", threading.get_ident, main_thread=True)
+    results = graph.run()
+    
+    assert results["main"] == caller
+    assert results["pool"] != caller
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+def test_results_follow_dependencies(parallel):
+    graph = TaskGraph(parallel=parallel)
+    graph.add("a", lambda: 2)
+    graph.add("b", lambda a: a * 3, deps=["a"], main_thread=True)
+    graph.add("c", lambda a, b: a + b, deps=["a", "b"])
+    
+    assert graph.run() == {"a": 2, "b": 6, "c": 8}
+
+
+def test_task_exception_propagates():
+    def fail():
+        raise RuntimeError("boom")
+    
+    graph = TaskGraph()
+    graph.add("fail", fail)
+    with pytest.raises(RuntimeError, match="boom"):
+        graph.run()
+
+
+def test_cycle_and_unknown_dependency_rejected():
+    graph = TaskGraph()
+    graph.add("a", lambda b: b, deps=["b"])
+    graph.add("b", lambda a: a, deps=["a"])
+    with pytest.raises(ValueError, match="cycle"):
+        graph.run()
+    
+    graph = TaskGraph()
+    graph.add("a", lambda x: x, deps=["missing"])
+    with pytest.raises(ValueError, match="unknown"):
+        graph.run()